@@ -0,0 +1,66 @@
+"""
+RESTlet calls and SuiteQL pages sent from a pool of threads over the default HTTP/1.1 transport (a pooled requests
+session, one TLS connection per concurrent request) and over HTTP2Transport (one multiplexed TLS connection),
+against local mock servers with the same latency. Needs `pip install httpx[http2]`. Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.http2_transport --requests 500 --threads 15 --latency 0.05
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import urllib3
+
+from NetSuite_Connector.ODBC import ODBC
+from NetSuite_Connector.Transport import HTTP2Transport
+from tests.mock_netsuite import MockNetSuite
+
+
+def make_client(server: MockNetSuite, threads: int) -> ODBC:
+    transport = partial(HTTP2Transport, verify=False) if server.http2 else "requests"
+    odbc = ODBC(
+        "123456",
+        {"consumer_key": "key", "consumer_secret": "secret"},
+        {"token_key": "token", "token_secret": "secret"},
+        concurrency_limit=threads,
+        transport=transport,
+    )
+    odbc.session.verify = False
+    odbc.session.trust_env = False
+    odbc.suiteql_endpoint = server.suiteql_endpoint
+    return odbc
+
+
+def run(requests: int, rows: int, threads: int, latency: float) -> None:
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    url_path = "/app/site/hosting/restlet.nl"
+    print(f"{'transport':<10} {'workload':<18} {'seconds':>8} {'req/s':>8} {'connections':>12}")
+    for http2 in (False, True):
+        name = "HTTP/2" if http2 else "HTTP/1.1"
+        with MockNetSuite(tls=True, http2=http2, latency=latency) as server:
+            server.suiteql(total=rows)
+            workloads = {
+                f"{requests} RESTlet POSTs": lambda odbc, pool: list(
+                    pool.map(lambda i: odbc.post(url=server.url + url_path, params={"n": i}, body={"n": i}), range(requests))
+                ),
+                f"{rows} SuiteQL rows": lambda odbc, pool: list(odbc.iter_query("SELECT * FROM transaction", page_size=100, workers=threads)),
+            }
+            for workload, fn in workloads.items():
+                before_connections, before_requests = server.connections, server.requests
+                with make_client(server, threads) as odbc, ThreadPoolExecutor(max_workers=threads) as pool:
+                    start = time.perf_counter()
+                    fn(odbc, pool)
+                    elapsed = time.perf_counter() - start
+                sent = server.requests - before_requests
+                print(f"{name:<10} {workload:<18} {elapsed:>8.2f} {sent / elapsed:>8.0f} {server.connections - before_connections:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency per request, in seconds")
+    args = parser.parse_args()
+    run(args.requests, args.rows, args.threads, args.latency)
@@ -0,0 +1,43 @@
+"""
+Throughput of ODBC.iter_query against a local mock SuiteQL server as the worker count grows.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.parallel_query --rows 50000 --latency 0.05
+"""
+import argparse
+import time
+
+from NetSuite_Connector.ODBC import ODBC
+from tests.mock_netsuite import MockNetSuite
+
+
+def run(rows: int, page_size: int, latency: float, workers: list) -> None:
+    with MockNetSuite(latency=latency) as server:
+        server.suiteql(total=rows)
+        print(f"{'workers':>8} {'seconds':>8} {'rows/s':>10} {'speedup':>8}")
+        baseline = None
+        for count in workers:
+            with ODBC(
+                "123456",
+                {"consumer_key": "key", "consumer_secret": "secret"},
+                {"token_key": "token", "token_secret": "secret"},
+                concurrency_limit=max(workers),
+            ) as odbc:
+                odbc.suiteql_endpoint = server.suiteql_endpoint
+                start = time.perf_counter()
+                fetched = sum(1 for _ in odbc.iter_query("SELECT * FROM transaction", page_size=page_size, workers=count))
+                elapsed = time.perf_counter() - start
+            assert fetched == rows
+            baseline = baseline or elapsed
+            print(f"{count:>8} {elapsed:>8.2f} {rows / elapsed:>10.0f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency per page, in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 15])
+    args = parser.parse_args()
+    run(args.rows, args.page_size, args.latency, args.workers)
@@ -0,0 +1,50 @@
+"""
+ODBC.extract (range partitions with keyset pages) against offset pagination (ODBC.iter_query) on a local mock SuiteQL server.
+
+The mock answers every page after `--latency` seconds, plus `--offset-latency` seconds per 1000 rows skipped,
+to model the deep offsets of SuiteQL slowing down. Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.partitioned_extract --rows 100000 --workers 8
+"""
+import argparse
+import time
+
+from NetSuite_Connector.ODBC import ODBC
+from tests.mock_netsuite import KeyedTable, MockNetSuite
+
+QUERY = "SELECT id, tranid, amount FROM transaction"
+
+
+def run(rows: int, page_size: int, latency: float, offset_latency: float, workers: int) -> None:
+    paths = {
+        "iter_query": lambda odbc: odbc.iter_query(QUERY, page_size=page_size),
+        f"iter_query (workers={workers})": lambda odbc: odbc.iter_query(QUERY, page_size=page_size, workers=workers),
+        f"extract (workers={workers})": lambda odbc: odbc.extract(QUERY, page_size=page_size, workers=workers, rows_per_partition=rows // (workers * 4) or 1),
+    }
+    with MockNetSuite(latency=latency) as server:
+        server.suiteql(source=KeyedTable(rows), offset_latency=offset_latency)
+        print(f"{'path':<26} {'seconds':>8} {'rows/s':>10}")
+        for name, fn in paths.items():
+            with ODBC(
+                "123456",
+                {"consumer_key": "key", "consumer_secret": "secret"},
+                {"token_key": "token", "token_secret": "secret"},
+                concurrency_limit=workers,
+            ) as odbc:
+                odbc.suiteql_endpoint = server.suiteql_endpoint
+                start = time.perf_counter()
+                fetched = sum(1 for _ in fn(odbc))
+                elapsed = time.perf_counter() - start
+            assert fetched == rows, fetched
+            print(f"{name:<26} {elapsed:>8.2f} {rows / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency per page, in seconds")
+    parser.add_argument("--offset-latency", type=float, default=0.002, help="extra seconds per 1000 rows of offset")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    run(args.rows, args.page_size, args.latency, args.offset_latency, args.workers)
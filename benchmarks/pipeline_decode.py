@@ -0,0 +1,90 @@
+"""
+Wall clock and CPU time of ODBC.iter_query on wide pages, with the pages parsed by the fetching threads or handed to a
+pool of decoder processes (`decoders`), with the standard json module and with orjson when it is installed.
+
+The mock SuiteQL server runs in a process of its own so that its CPU time is not counted. "client cpu" is the CPU time of
+the process iterating the query (downloads, and parsing when inline), "decoder cpu" the CPU time of the decoder processes.
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.pipeline_decode --rows 50000 --columns 80 --workers 4 --decoders 2
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+
+from NetSuite_Connector.NetSuite import fast_json_decoder
+from NetSuite_Connector.ODBC import ODBC
+from tests.mock_netsuite import MockNetSuite
+
+
+def wide_row(columns: int):
+    def row(index: int) -> dict:
+        values = {"id": str(index + 1), "tranid": f"INV{index + 1:06d}", "memo": f"Order {index} shipped by ground, see the attached packing list"}
+        values.update((f"custbody_field_{c}", f"{(index * 31 + c) % 100000}.{c % 100:02d}") for c in range(columns - len(values)))
+        return values
+
+    return row
+
+
+def serve(rows: int, columns: int, latency: float, conn) -> None:
+    with MockNetSuite(latency=latency) as server:
+        server.suiteql(total=rows, row=wide_row(columns))
+        conn.send(server.suiteql_endpoint)
+        conn.recv()
+
+
+def children_cpu() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def run(rows: int, columns: int, page_size: int, latency: float, workers: int, decoders: int) -> None:
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=serve, args=(rows, columns, latency, child), daemon=True)
+    server.start()
+    endpoint = parent.recv()
+
+    decoders_by_name = {"json": json.loads}
+    if fast_json_decoder() is not json.loads:
+        decoders_by_name["orjson"] = fast_json_decoder()
+    paths = {}
+    for name, decoder in decoders_by_name.items():
+        paths[f"inline {name}"] = (decoder, 0)
+        paths[f"decoders={decoders} {name}"] = (decoder, decoders)
+
+    print(f"{'path':<22} {'wall s':>8} {'client cpu s':>13} {'decoder cpu s':>14} {'rows/s':>9}")
+    try:
+        for name, (decoder, processes) in paths.items():
+            with ODBC(
+                "123456",
+                {"consumer_key": "key", "consumer_secret": "secret"},
+                {"token_key": "token", "token_secret": "secret"},
+                concurrency_limit=workers,
+                json_decoder=decoder,
+            ) as odbc:
+                odbc.suiteql_endpoint = endpoint
+                start, cpu, child_cpu = time.perf_counter(), time.process_time(), children_cpu()
+                fetched = 0
+                for page in odbc.iter_query("SELECT * FROM transaction", page_size=page_size, workers=workers, decoders=processes, batches=True):
+                    fetched += len(page)
+                elapsed = time.perf_counter() - start
+                cpu, child_cpu = time.process_time() - cpu, children_cpu() - child_cpu
+            assert fetched == rows, fetched
+            print(f"{name:<22} {elapsed:>8.2f} {cpu:>13.2f} {child_cpu:>14.2f} {rows / elapsed:>9.0f}")
+    finally:
+        parent.send("stop")
+        server.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=80)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency per page, in seconds")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--decoders", type=int, default=2)
+    args = parser.parse_args()
+    run(args.rows, args.columns, args.page_size, args.latency, args.workers, args.decoders)
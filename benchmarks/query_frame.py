@@ -0,0 +1,97 @@
+"""
+Memory and time of ODBC.query_frame against the dict-of-rows path (rows -> list of dicts -> DataFrame).
+
+The SuiteQL pages are generated in-process and handed to ODBC.post directly, so the numbers
+measure decoding and frame building only, not the network. Every path runs in a fresh process
+and reports its peak RSS above the baseline taken after imports. Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.query_frame --rows 1000000
+"""
+import argparse
+import json
+import multiprocessing
+import resource
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from NetSuite_Connector.NetSuite import NetsuiteObject
+from NetSuite_Connector.ODBC import ODBC
+
+
+def make_odbc(rows: int) -> ODBC:
+    odbc = ODBC("123456", {"consumer_key": "key", "consumer_secret": "secret"}, {"token_key": "token", "token_secret": "secret"})
+
+    def post(url, params=None, **kwargs):
+        params = params or {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+        limit, offset = int(params["limit"]), int(params["offset"])
+        items = [
+            {
+                "links": [],
+                "id": str(i),
+                "tranid": f"INV{i:07d}",
+                "trandate": "17/10/2026",
+                "foreigntotal": f"{i % 10000}.25",
+                "status": "B",
+            }
+            for i in range(offset, min(offset + limit, rows))
+        ]
+        body = {"items": items, "count": len(items), "hasMore": offset + limit < rows, "offset": offset, "totalResults": rows}
+        return NetsuiteObject(url=url, response=json.dumps(body), code=200)
+
+    odbc.post = post
+    return odbc
+
+
+def dict_rows(odbc: ODBC, query: str):
+    import pandas as pd
+
+    return pd.DataFrame(list(odbc.iter_query(query)))
+
+
+def _child(path: str, rows: int, queue) -> None:
+    import pandas as pd  # noqa: F401 imported before the baseline is taken
+
+    query = "SELECT id, tranid, trandate, foreigntotal, status FROM transaction"
+    odbc = make_odbc(rows)
+    if path == "dict rows -> DataFrame":
+        fn = lambda: dict_rows(odbc, query)  # noqa: E731
+    elif path == "query_frame":
+        fn = lambda: odbc.query_frame(query)  # noqa: E731
+    elif path == "query_frame (typed)":
+        fn = lambda: odbc.query_frame(query, dtypes={"id": "int64", "foreigntotal": "float64"})  # noqa: E731
+    else:
+        import pyarrow as pa
+
+        types = {"id": pa.int64(), "foreigntotal": pa.float64()}
+        fn = lambda: odbc.query_frame(query, dtypes=types, as_arrow=True)  # noqa: E731
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    queue.put((elapsed, peak / 1024, len(result)))
+
+
+def run(rows: int) -> None:
+    paths = ["dict rows -> DataFrame", "query_frame", "query_frame (typed)"]
+    try:
+        import pyarrow  # noqa: F401
+
+        paths.append("query_frame (arrow, typed)")
+    except ImportError:
+        pass
+    context = multiprocessing.get_context("spawn")
+    print(f"{'path':<28} {'seconds':>8} {'peak MiB':>10} {'rows':>10}")
+    for path in paths:
+        queue = context.Queue()
+        process = context.Process(target=_child, args=(path, rows, queue))
+        process.start()
+        elapsed, peak, count = queue.get()
+        process.join()
+        print(f"{path:<28} {elapsed:>8.2f} {peak:>10.1f} {count:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    run(parser.parse_args().rows)
@@ -0,0 +1,98 @@
+"""
+Memory held by a batch of results: the former NetsuiteObject dataclass against the slotted one, with and without the request echo and the response headers.
+
+Every result models a record PATCH answered by NetSuite: the request headers and JSON body the client built,
+and the response body and headers. Sizes are measured with tracemalloc, so they count every Python object
+kept alive by the results. The second table times decoding every body as JSON. Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.result_memory --results 100000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from requests.structures import CaseInsensitiveDict
+
+from NetSuite_Connector.NetSuite import NetsuiteObject, fast_json_decoder, kept_headers
+
+URL = "https://123456.suitetalk.api.netsuite.com/services/rest/record/v1/customer/{id}"
+
+
+@dataclass
+class LegacyNetsuiteObject:
+    url: Optional[str] = None
+    request_headers: Optional[dict] = None
+    request_data: Optional[dict | str] = None
+    response: str = None
+    code: int = None
+    response_headers: Optional[dict] = None
+
+
+def exchange(i: int) -> tuple:
+    headers = {"Content-Type": "application/json", "X-NetSuite-Idempotency-Key": f"customer-{i}"}
+    body = {"id": i, "companyname": f"Customer {i:07d}", "comments": "migrated", "subsidiary": {"id": "1"}}
+    response = json.dumps({"id": str(i), "companyname": f"Customer {i:07d}", "balance": i % 1000 + 0.25, "links": []}).encode()
+    response_headers = CaseInsensitiveDict(
+        {"Content-Type": "application/json; charset=UTF-8", "Content-Length": str(len(response)), "Date": "Sat, 17 Oct 2026 10:00:00 GMT"}
+    )
+    return URL.format(id=i), headers, body, response, response_headers
+
+
+def legacy(i: int) -> LegacyNetsuiteObject:
+    url, headers, body, response, response_headers = exchange(i)
+    return LegacyNetsuiteObject(url, headers, body, response.decode(), 200, response_headers)
+
+
+def slotted(i: int) -> NetsuiteObject:
+    url, headers, body, response, response_headers = exchange(i)
+    return NetsuiteObject(url, headers, body, response, 200, dict(response_headers), encoding="utf-8")
+
+
+def slotted_no_echo(i: int) -> NetsuiteObject:
+    url, headers, body, response, response_headers = exchange(i)
+    return NetsuiteObject(url, response=response, code=200, response_headers=kept_headers(response_headers), encoding="utf-8")
+
+
+def measure(build, count: int) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    results = [build(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return results, size
+
+
+def run(count: int) -> None:
+    print(f"{'result type':<32} {'MiB':>8} {'bytes/result':>13}")
+    batches = {}
+    for name, build in (("dataclass (before)", legacy), ("slotted", slotted), ("slotted, keep_request=False", slotted_no_echo)):
+        results, size = measure(build, count)
+        batches[name] = results
+        print(f"{name:<32} {size / 2**20:>8.1f} {size / count:>13.0f}")
+
+    print()
+    print(f"{'decoding':<32} {'seconds':>8}")
+    timings = [
+        ("json.loads(obj.response)", lambda: [json.loads(r.response) for r in batches["dataclass (before)"]]),
+        ("obj.json (asdict)", lambda: [asdict(r) for r in batches["dataclass (before)"]]),
+        ("obj.data (json)", lambda: [r.data for r in batches["slotted"]]),
+    ]
+    decoder = fast_json_decoder()
+    if decoder is not json.loads:
+        for r in batches["slotted, keep_request=False"]:
+            r.decoder = decoder
+        timings.append(("obj.data (orjson)", lambda: [r.data for r in batches["slotted, keep_request=False"]]))
+    for name, fn in timings:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<32} {time.perf_counter() - start:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=100000)
+    run(parser.parse_args().results)
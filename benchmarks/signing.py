@@ -0,0 +1,66 @@
+"""
+OAuth 1.0 signatures per second: the requests_oauthlib session NetSuite used before, sign_request
+(which rebuilds its key on every call) and the SigningContext that clients now keep per instance.
+
+Every path signs the same SuiteQL page request; the requests paths also prepare it, which is what a
+session does for every request. Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.signing --seconds 2
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import requests_oauthlib
+
+from NetSuite_Connector.OAuth import OAuth1Auth, SigningContext, sign_request
+
+URL = "https://1234567-sb1.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql?limit=1000&offset=20000"
+CREDENTIALS = ("c" * 64, "s" * 64, "t" * 64, "u" * 64)
+REALM = "1234567_SB1"
+
+
+def rate(fn, seconds: float, threads: int) -> float:
+    def loop(_):
+        count, deadline = 0, time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            for _ in range(100):
+                fn()
+            count += 100
+        return count
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(loop, range(threads))) / seconds
+
+
+def run(seconds: float, threads: int) -> None:
+    request = requests.Request("POST", URL, data='{"q": "SELECT id FROM transaction"}', headers={"Content-Type": "application/json"})
+    oauthlib_session = requests_oauthlib.OAuth1Session(
+        CREDENTIALS[0],
+        client_secret=CREDENTIALS[1],
+        resource_owner_key=CREDENTIALS[2],
+        resource_owner_secret=CREDENTIALS[3],
+        realm=REALM,
+        signature_method="HMAC-SHA256",
+    )
+    session = requests.Session()
+    session.auth = OAuth1Auth(SigningContext(*CREDENTIALS, realm=REALM))
+    signer = SigningContext(*CREDENTIALS, realm=REALM)
+    paths = {
+        "OAuth1Session.prepare_request": lambda: oauthlib_session.prepare_request(request),
+        "Session + OAuth1Auth (now)": lambda: session.prepare_request(request),
+        "sign_request": lambda: sign_request("POST", URL, *CREDENTIALS, realm=REALM),
+        "SigningContext.sign": lambda: signer.sign("POST", URL),
+    }
+    print(f"{'path':<32} {'signatures/s':>13} ({threads} thread{'s' if threads > 1 else ''})")
+    for name, fn in paths.items():
+        print(f"{name:<32} {rate(fn, seconds, threads):>13.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+    run(args.seconds, args.threads)
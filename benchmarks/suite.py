@@ -0,0 +1,221 @@
+"""
+Offline benchmark suite: drives NetSuite.get/post, ODBC.query and ODBC.iter_query through representative workloads against the
+local mock NetSuite, with configurable latency, page size, throttling and injected errors, and reports throughput, latency
+percentiles, peak RSS and the peak of Python allocations of each workload as JSON.
+
+Every workload runs in a fresh process, so peak RSS is its own. Latencies are measured per call (per page request for
+`suiteql_pages`), retries included. Save the results of two versions and compare them before upgrading:
+
+    PYTHONPATH=src python -m benchmarks.suite --output before.json
+    PYTHONPATH=src python -m benchmarks.suite --output after.json --compare before.json
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from NetSuite_Connector.Governor import Governor
+from NetSuite_Connector.Instrumentation import Histogram, RequestHook
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+from NetSuite_Connector.Retry import RetryPolicy
+from tests.mock_netsuite import MockNetSuite
+
+RESTLET_PATH = "/app/site/hosting/restlet.nl"
+KEYS = ({"consumer_key": "key", "consumer_secret": "secret"}, {"token_key": "token", "token_secret": "secret"})
+RECORD = {"entity": {"id": "1042"}, "memo": "benchmark", "item": {"items": [{"item": {"id": str(i)}, "quantity": i} for i in range(20)]}}
+
+
+class _Latencies(RequestHook):
+    def __init__(self, histogram: Histogram) -> None:
+        self.histogram = histogram
+
+    def after_request(self, metrics) -> None:
+        self.histogram.record(metrics.total)
+
+
+def _calls(client, options: dict, histogram: Histogram, call) -> int:
+    """
+    Runs `call(client, index)` `options["ops"]` times on `options["threads"]` threads, recording the latency of each call. Returns the number of failed calls.
+    """
+
+    def timed(index: int) -> bool:
+        start = time.perf_counter()
+        ok = call(client, index).code < 400
+        histogram.record(time.perf_counter() - start)
+        return ok
+
+    with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+        return sum(not ok for ok in pool.map(timed, range(options["ops"])))
+
+
+def restlet_get(server: MockNetSuite, options: dict, histogram: Histogram, **client) -> int:
+    url = server.url + RESTLET_PATH
+    with NetSuite("123456", *KEYS, concurrency_limit=options["threads"], **client) as nt:
+        return _calls(nt, options, histogram, lambda nt, i: nt.get(url=url, params={"script": "1", "deploy": "1", "id": i}))
+
+
+def restlet_post(server: MockNetSuite, options: dict, histogram: Histogram) -> int:
+    url = server.url + RESTLET_PATH
+    with NetSuite("123456", *KEYS, concurrency_limit=options["threads"]) as nt:
+        return _calls(nt, options, histogram, lambda nt, i: nt.post(url=url, body=dict(RECORD, externalid=str(i))))
+
+
+def suiteql_query(server: MockNetSuite, options: dict, histogram: Histogram) -> int:
+    server.suiteql(total=options["page_size"])
+    with ODBC("123456", *KEYS, concurrency_limit=options["threads"]) as odbc:
+        odbc.suiteql_endpoint = server.suiteql_endpoint
+        return _calls(odbc, options, histogram, lambda odbc, i: odbc.query(f"SELECT id, tranid, amount FROM transaction WHERE id > {i}"))
+
+
+def suiteql_pages(server: MockNetSuite, options: dict, histogram: Histogram) -> int:
+    server.suiteql(total=options["ops"] * options["page_size"])
+    with ODBC("123456", *KEYS, concurrency_limit=options["threads"], hooks=[_Latencies(histogram)]) as odbc:
+        odbc.suiteql_endpoint = server.suiteql_endpoint
+        rows = sum(len(page) for page in odbc.iter_query("SELECT * FROM transaction", page_size=options["page_size"], workers=options["threads"], batches=True))
+    return options["ops"] - rows // options["page_size"]
+
+
+def throttled_get(server: MockNetSuite, options: dict, histogram: Histogram) -> int:
+    server.max_concurrent = max(1, options["threads"] // 2)
+    retry = RetryPolicy(backoff_factor=0.01, max_backoff=0.1)
+    return restlet_get(server, options, histogram, governor=Governor(limit=options["threads"]), retry=retry)
+
+
+def faulty_get(server: MockNetSuite, options: dict, histogram: Histogram) -> int:
+    server.error_rate = options["error_rate"]
+    return restlet_get(server, options, histogram, retry=RetryPolicy(backoff_factor=0.01, max_backoff=0.1))
+
+
+WORKLOADS = {
+    "restlet_get": restlet_get,
+    "restlet_post": restlet_post,
+    "suiteql_query": suiteql_query,
+    "suiteql_pages": suiteql_pages,
+    "throttled_get": throttled_get,
+    "faulty_get": faulty_get,
+}
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure(name: str, options: dict) -> dict:
+    """
+    Runs one workload against a new mock server and returns its measures. A second run under tracemalloc gives the peak of Python allocations.
+    """
+    histogram = Histogram()
+    with MockNetSuite(latency=options["latency"], seed=options["seed"]) as server:
+        start = time.perf_counter()
+        errors = WORKLOADS[name](server, options, histogram)
+        seconds = time.perf_counter() - start
+        requests, throttled, injected = server.requests, server.throttled, server.errors
+    result = {
+        "workload": name,
+        "ops": options["ops"],
+        "errors": errors,
+        "requests": requests,
+        "throttled": throttled,
+        "injected_errors": injected,
+        "seconds": round(seconds, 4),
+        "ops_per_s": round(options["ops"] / seconds, 1),
+        "requests_per_s": round(requests / seconds, 1),
+        "p50_ms": round(histogram.percentile(50) * 1000, 2),
+        "p95_ms": round(histogram.percentile(95) * 1000, 2),
+        "p99_ms": round(histogram.percentile(99) * 1000, 2),
+        "rss_peak_mib": round(_peak_rss_mib(), 1),
+    }
+    if options["allocations"]:
+        with MockNetSuite(latency=options["latency"], seed=options["seed"]) as server:
+            tracemalloc.start()
+            WORKLOADS[name](server, options, Histogram())
+            result["alloc_peak_mib"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+            tracemalloc.stop()
+    return result
+
+
+def _run_isolated(name: str, options: dict) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(measure, (name, options))
+
+
+def compare(results: list, baseline: dict) -> None:
+    before = {result["workload"]: result for result in baseline["results"]}
+    print(f"\nagainst {baseline['version']} ({baseline['timestamp']})")
+    print(f"{'workload':<15} {'ops/s':>9} {'p99':>9} {'rss':>9}")
+    for result in results:
+        old = before.get(result["workload"])
+        if old is None:
+            continue
+        print(
+            f"{result['workload']:<15} {result['ops_per_s'] / old['ops_per_s']:>8.2f}x {result['p99_ms'] / old['p99_ms']:>8.2f}x "
+            f"{result['rss_peak_mib'] / old['rss_peak_mib']:>8.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--ops", type=int, default=500, help="calls per workload, pages for suiteql_pages")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated server latency per request, in seconds")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--error-rate", type=float, default=0.05, help="fraction of failed requests in faulty_get")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-allocations", dest="allocations", action="store_false", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a JSON file of earlier results to compare with")
+    args = parser.parse_args()
+    options = {
+        "ops": args.ops,
+        "threads": args.threads,
+        "latency": args.latency,
+        "page_size": args.page_size,
+        "error_rate": args.error_rate,
+        "seed": args.seed,
+        "allocations": args.allocations,
+    }
+
+    results = []
+    print(f"{'workload':<15} {'ops/s':>9} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'rss MiB':>8} {'alloc MiB':>10}")
+    for name in args.workloads:
+        result = _run_isolated(name, options)
+        results.append(result)
+        print(
+            f"{name:<15} {result['ops_per_s']:>9.1f} {result['requests_per_s']:>9.1f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+            f"{result['errors']:>7} {result['rss_peak_mib']:>8.1f} {result.get('alloc_peak_mib', float('nan')):>10.2f}"
+        )
+
+    try:
+        from importlib.metadata import version
+
+        package_version = version("NetSuite-Connector")
+    except Exception:
+        package_version = "unknown"
+    document = {
+        "version": package_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "options": options,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import json
+import logging
+import traceback
+from typing import Any, Optional
+
+from .NetSuite import NetSuite, NetsuiteObject
+from .OAuth import SigningContext
+
+log = logging.getLogger(__name__)
+
+
+class AsyncNetSuite:
+    """
+    The AsyncNetSuite class is the asyncio counterpart of NetSuite. It signs OAuth 1.0 requests itself and sends them over a pooled httpx.AsyncClient, so a single event loop can drive many concurrent RESTlet calls. It needs the optional `httpx` dependency (`pip install NetSuite-Connector[async]`).
+    ```
+    from NetSuite_Connector.AsyncNetSuite import AsyncNetSuite
+    async with AsyncNetSuite(
+        account_id=123456,
+        consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+        token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije"),
+    ) as nt:
+        x = await nt.get(
+            url="https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx",
+            headers={"Content-Type": "application/json"},
+            params={}
+        )
+    print(x)
+    # NetsuiteObject(url='https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx', request_headers={'Content-Type': 'application/json'}, response='{"foo":"bar"}', code=200)
+    ```
+    """
+
+    _validate_keys = NetSuite._validate_keys
+
+    def __init__(
+        self,
+        account_id: Any,
+        consumer_keys: dict,
+        token_keys: dict,
+        pool_maxsize: Optional[int] = None,
+        concurrency_limit: int = 15,
+        timeout: Optional[float] = 60.0,
+    ) -> None:
+        self.oauth_version = "1.0"
+        self.signature_method = "HMAC-SHA256"
+        self.account_id = account_id
+        self.consumer_key, self.consumer_secret = self._validate_keys(
+            consumer_keys, ["consumer_key", "consumer_secret"]
+        ).values()
+        self.token_id, self.token_secret = self._validate_keys(
+            token_keys, ["token_key", "token_secret"]
+        ).values()
+        self.concurrency_limit = concurrency_limit
+        self.pool_maxsize = pool_maxsize or concurrency_limit
+        self.timeout = timeout
+        self.signer = SigningContext(
+            self.consumer_key,
+            self.consumer_secret,
+            self.token_id,
+            self.token_secret,
+            realm=self.account_id,
+            signature_method=self.signature_method,
+        )
+        self._client = None
+
+    def _make_client(self):
+        """
+        Creates the httpx.AsyncClient holding the keep-alive connection pool.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("AsyncNetSuite requires httpx, install it with `pip install httpx`") from e
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize),
+            timeout=self.timeout,
+        )
+
+    @property
+    def client(self):
+        """
+        The httpx.AsyncClient shared by every request of this instance, created on first use.
+        """
+        if self._client is None:
+            self._client = self._make_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Closes the client and its connections. A new client is created if the instance is used again.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncNetSuite":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self,
+        http_method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        body: Optional[dict[str, Any]] = None,
+    ) -> NetsuiteObject:
+        """
+        Makes an HTTP request to the NetSuite REST API using the specified HTTP method, URL, headers, parameters, and body.
+
+        Parameters:
+            http_method (str): The HTTP method to use for the request.
+            url (str): The URL of the NetSuite REST API endpoint to which the request will be sent.
+            headers (dict[str, str], optional): A dictionary of headers to include in the request. Defaults to {}.
+            params (dict[str, Any], optional): A dictionary of parameters to include in the request. Defaults to {}.
+            body (dict[str, Any], optional): A dictionary of data to include in the request body. Defaults to {}.
+
+        Returns:
+            NetsuiteObject: A NetsuiteObject containing the response data.
+        """
+        log.debug("Making request to restlet at %s.", url)
+        response = NetsuiteObject(url=url, request_headers=headers, request_data=body)
+        try:
+            request = self.client.build_request(
+                http_method.upper(),
+                url,
+                params=params,
+                content=(json.dumps(body) if isinstance(body, (dict, list)) else body),
+                headers=headers,
+            )
+            request.headers["Authorization"] = self.signer.sign(request.method, str(request.url))
+            resp = await self.client.send(request)
+            response.content = resp.content
+            response.encoding = resp.encoding
+            response.code = resp.status_code
+        except Exception:
+            log.warning(traceback.format_exc())
+            response.code = 500
+            response.response = traceback.format_exc()
+        return response
+
+    async def get(self, **kwargs) -> NetsuiteObject:
+        """
+        Makes a GET request to the NetSuite REST API. Takes the same arguments as NetSuite.get.
+        """
+        return await self._make_request(http_method="GET", **kwargs)
+
+    async def put(self, **kwargs) -> NetsuiteObject:
+        """
+        Makes a PUT request to the NetSuite REST API. Takes the same arguments as NetSuite.put.
+        """
+        return await self._make_request(http_method="PUT", **kwargs)
+
+    async def post(self, **kwargs) -> NetsuiteObject:
+        """
+        Makes a POST request to the NetSuite REST API. Takes the same arguments as NetSuite.post.
+        """
+        return await self._make_request(http_method="POST", **kwargs)
+
+    async def delete(self, **kwargs) -> NetsuiteObject:
+        """
+        Makes a DELETE request to the NetSuite REST API. Takes the same arguments as NetSuite.delete.
+        """
+        return await self._make_request(http_method="DELETE", **kwargs)
@@ -0,0 +1,180 @@
+import logging
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .NetSuite import NetSuite, NetsuiteObject
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkProgress:
+    done: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """
+        Records per second since the batch started.
+        """
+        return self.done / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class BulkResult:
+    """
+    The outcome of NetSuite.bulk. `succeeded` and `failed` hold `(index, record, NetsuiteObject)` tuples, where `index` is the position of the record in the input.
+    """
+
+    succeeded: list = field(default_factory=list)
+    failed: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def rate(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+
+def run_bulk(
+    client: "NetSuite",
+    http_method: str,
+    url_template: str,
+    records: Iterable[dict],
+    workers: int,
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
+    idempotency_key: Optional[Callable[[dict], str]] = None,
+    respond_async: bool = False,
+    poll_interval: float = 2.0,
+    job_timeout: Optional[float] = None,
+    progress: Optional[Callable[[BulkProgress], None]] = None,
+    progress_every: int = 100,
+) -> BulkResult:
+    """
+    Sends one request per record through a bounded thread pool. See NetSuite.bulk.
+    """
+    headers = dict(headers or {})
+    if respond_async:
+        headers["Prefer"] = "respond-async"
+    result = BulkResult()
+    status = BulkProgress()
+    start = time.perf_counter()
+
+    def send(record: dict) -> "NetsuiteObject":
+        try:
+            return client._make_request(
+                http_method=http_method,
+                url=url_template.format(**record),
+                headers=headers,
+                params=params,
+                body=record,
+                idempotency_key=idempotency_key(record) if idempotency_key else None,
+            )
+        except Exception:
+            return _failure(client, url_template, record)
+
+    def collect(index: int, record: dict, response: "NetsuiteObject") -> None:
+        if response.code is not None and 200 <= response.code < 300:
+            result.succeeded.append((index, record, response))
+        else:
+            result.failed.append((index, record, response))
+            status.failed += 1
+        status.done += 1
+        if status.done % progress_every == 0:
+            status.elapsed = time.perf_counter() - start
+            log.info("Bulk %s: %d done, %d failed, %.1f records/s.", http_method, status.done, status.failed, status.rate)
+            if progress is not None:
+                progress(status)
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk") as pool:
+        for index, record, response in _bounded_map(pool, send, enumerate(records), workers * 2):
+            location = next((value for name, value in (response.response_headers or {}).items() if name.lower() == "location"), None)
+            if respond_async and response.code == 202 and location:
+                jobs.append(((index, record), location))
+            else:
+                collect(index, record, response)
+
+        if jobs:
+            log.info("Bulk %s: waiting for %d asynchronous jobs.", http_method, len(jobs))
+
+        def wait(location: str) -> "NetsuiteObject":
+            try:
+                return wait_for_job(client, location, poll_interval, job_timeout)
+            except Exception:
+                return _failure(client, location)
+
+        for (index, record), _, response in _bounded_map(pool, wait, jobs, workers * 2):
+            collect(index, record, response)
+
+    result.elapsed = status.elapsed = time.perf_counter() - start
+    if progress is not None:
+        progress(status)
+    return result
+
+
+def _failure(client: "NetSuite", url: str, record: Optional[dict] = None) -> "NetsuiteObject":
+    """
+    The result of a record whose request could not be built or whose job could not be read, with code 500 and the traceback as body, like a failed request.
+    """
+    from .NetSuite import NetsuiteObject
+
+    response = NetsuiteObject(url=url, request_data=record if client.keep_request else None, decoder=client.json_decoder)
+    response.code = 500
+    response.response = traceback.format_exc()
+    log.warning(response.response)
+    return response
+
+
+def _bounded_map(pool: ThreadPoolExecutor, fn: Callable, items: Iterable[tuple], window: int) -> Iterator[tuple]:
+    """
+    Yields `(tag, arg, fn(arg))` for every `(tag, arg)` of `items`, in order, reading at most `window` items ahead.
+    """
+    items = iter(items)
+    pending = deque((tag, arg, pool.submit(fn, arg)) for tag, arg in islice(items, window))
+    while pending:
+        tag, arg, future = pending.popleft()
+        for next_tag, next_arg in islice(items, 1):
+            pending.append((next_tag, next_arg, pool.submit(fn, next_arg)))
+        yield tag, arg, future.result()
+
+
+def wait_for_job(client: "NetSuite", location: str, poll_interval: float = 2.0, timeout: Optional[float] = None) -> "NetsuiteObject":
+    """
+    Polls an asynchronous NetSuite job (the Location of a `Prefer: respond-async` request) until it completes, then returns the result of its task.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while True:
+        job = client._make_request(http_method="GET", url=location)
+        if job.code != 200:
+            return job
+        if job.data.get("completed"):
+            break
+        if deadline is not None and time.monotonic() > deadline:
+            job.code = 408
+            return job
+        time.sleep(poll_interval)
+    tasks = client._make_request(http_method="GET", url=f"{location}/task")
+    if tasks.code != 200:
+        return tasks
+    task_urls = [
+        link["href"]
+        for item in tasks.data.get("items", [])
+        for link in item.get("links", [])
+        if link.get("rel") == "self"
+    ]
+    if not task_urls:
+        return tasks
+    return client._make_request(http_method="GET", url=f"{task_urls[0]}/result")
+
@@ -0,0 +1,216 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+ENTRY_OVERHEAD = 100
+
+
+def request_key(account_id: Any, http_method: str, url: str, params: Optional[dict] = None) -> str:
+    """
+    Builds the cache key of a request: the account, the method and the URL with its query string and `params` merged and sorted.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True) + [(str(k), str(v)) for k, v in (params or {}).items()]
+    normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(sorted(query)), ""))
+    return f"{account_id} {http_method.upper()} {normalized}"
+
+
+def query_key(account_id: Any, query: str) -> str:
+    """
+    Builds the cache key of a SuiteQL query: the account and the query with its whitespace collapsed.
+    """
+    return f"{account_id} SUITEQL {' '.join(query.split())}"
+
+
+class ResponseCache:
+    """
+    Base class of the response caches. A cache stores the `(code, response)` of successful requests under a key for `ttl` seconds, and counts its hits, misses and evictions.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _expiry(self, ttl: Optional[float]) -> float:
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() + ttl if ttl is not None else float("inf")
+
+    def get(self, key: str) -> Optional[tuple]:
+        """
+        Returns the `(code, response)` stored under `key`, or None if it is missing or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, code: int, response: str, ttl: Optional[float] = None) -> None:
+        """
+        Stores a response under `key` for `ttl` seconds, the cache default when omitted.
+        """
+        raise NotImplementedError
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drops the entry stored under `key`.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self)}
+
+
+class MemoryCache(ResponseCache):
+    """
+    An in-process LRU cache bounded by a number of entries and an approximate size in bytes.
+    ```
+    from NetSuite_Connector.Cache import MemoryCache
+    from NetSuite_Connector.ODBC import ODBC
+    nt = ODBC(account_id, consumer_keys, token_keys, cache=MemoryCache(ttl=600, max_bytes=64 * 2**20))
+    nt.query("SELECT id, name FROM subsidiary")  # network
+    nt.query("SELECT id, name FROM subsidiary")  # cache hit
+    ```
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None) -> None:
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def _sizeof(key: str, response: str) -> int:
+        return len(key) + len(response or "") + ENTRY_OVERHEAD
+
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    self._pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, key: str, code: int, response: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (self._expiry(ttl), code, response)
+            self.size += self._sizeof(key, response)
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _pop(self, key: str) -> None:
+        _, _, response = self._entries.pop(key)
+        self.size -= self._sizeof(key, response)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    An LRU cache stored in a sqlite database, so cached responses survive restarts and can be shared by processes on the same host.
+    ```
+    from NetSuite_Connector.Cache import SQLiteCache
+    cache = SQLiteCache("~/.cache/netsuite.sqlite", ttl=3600, max_bytes=256 * 2**20)
+    ```
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = 300.0, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        super().__init__(ttl)
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, code INTEGER, response TEXT, expires REAL, accessed REAL, size INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def get(self, key: str) -> Optional[tuple]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT code, response, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or row[2] <= now:
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0], row[1]
+
+    def set(self, key: str, code: int, response: str, ttl: Optional[float] = None) -> None:
+        size = len(key) + len(response or "") + ENTRY_OVERHEAD
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, code, response, self._expiry(ttl), time.time(), size),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.max_entries is not None:
+            excess = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)", (excess,)
+                )
+                self.evictions += excess
+        if self.max_bytes is not None:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+from .Cache import request_key
+
+COALESCED_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def flight_key(account_id: Any, http_method: str, url: str, params: Optional[dict], headers: Optional[dict], data: Any) -> tuple:
+    """
+    Identifies a request for coalescing: the normalized cache key of its URL and parameters, its headers and its body.
+    """
+    return (
+        request_key(account_id, http_method, url, params),
+        tuple(sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items())),
+        data if isinstance(data, (str, bytes)) or data is None else repr(data),
+    )
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Callers arriving while the call of their key is in flight wait for it and get its result (or its exception) instead of running their own.
+    `calls` counts the calls that ran and `shared` the callers that were handed the result of another one.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._flights: dict = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple:
+        """
+        Returns `(result, leader)`, where `leader` is True for the caller that ran `fn`.
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result(), False
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key)
+            future.set_exception(e)
+            raise
+        self._land(key)
+        future.set_result(result)
+        return result, True
+
+    def _land(self, key: Hashable) -> None:
+        # Forget the flight before publishing its result, so later callers start a fresh call instead of reading a finished one.
+        with self._lock:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self)}
@@ -0,0 +1,245 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import logging
+import lzma
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from .ODBC import ODBC
+
+log = logging.getLogger(__name__)
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+@dataclass
+class ExportResult:
+    """
+    The outcome of ODBC.export. `resumed_at` is the number of rows that were already exported by an interrupted run.
+    """
+
+    path: str
+    format: str
+    rows: int = 0
+    pages: int = 0
+    resumed_at: int = 0
+    elapsed: float = 0.0
+
+
+def export_format(path: str, format: Optional[str] = None, compression: Optional[str] = None) -> tuple:
+    """
+    Returns the `(format, compression)` of an export, inferred from the extensions of `path` when not given, e.g. "extract.csv.gz" is gzipped CSV.
+    """
+    root, extension = os.path.splitext(path.lower())
+    if extension in COMPRESSIONS:
+        compression = compression or COMPRESSIONS[extension]
+        root, extension = os.path.splitext(root)
+    format = format or FORMATS.get(extension)
+    if format not in ("csv", "jsonl", "parquet"):
+        raise ValueError(f"Unknown export format for {path}, pass format='csv', 'jsonl' or 'parquet'")
+    if format != "parquet" and compression is not None and compression not in COMPRESSORS:
+        raise ValueError(f"Unknown compression {compression}, use one of {sorted(COMPRESSORS)}")
+    return format, compression
+
+
+def _write_json(path: str, state: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+class _TextWriter:
+    """
+    Appends every page to a CSV or JSON Lines file. A compressed file gets one gzip/bz2/xz member per page, which their readers concatenate, so a resumed export can cut the file at the end of its last completed page.
+    """
+
+    def __init__(self, path: str, format: str, compression: Optional[str], state: dict) -> None:
+        self.format = format
+        self.compress = COMPRESSORS[compression] if compression else None
+        self.columns = state.get("columns")
+        size = state.get("size", 0)
+        if size:
+            if not os.path.exists(path) or os.path.getsize(path) < size:
+                raise ValueError(f"Cannot resume the export of {path}: the file is shorter than its progress")
+            self.file = open(path, "r+b")
+            self.file.truncate(size)
+            self.file.seek(size)
+        else:
+            self.file = open(path, "wb")
+
+    def write(self, items: list, state: dict) -> None:
+        buffer = io.StringIO()
+        if self.format == "jsonl":
+            for item in items:
+                buffer.write(json.dumps(item))
+                buffer.write("\n")
+        else:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(name for item in items for name in item))
+            writer = csv.DictWriter(buffer, fieldnames=self.columns, lineterminator="\n")
+            if self.file.tell() == 0:
+                writer.writeheader()
+            try:
+                writer.writerows(items)
+            except ValueError:
+                late = sorted({name for item in items for name in item} - set(self.columns))
+                raise ValueError(
+                    f"Columns {late} first appear after the first page of the export, pass them in `columns`"
+                ) from None
+        data = buffer.getvalue().encode()
+        del buffer
+        self.file.write(self.compress(data) if self.compress else data)
+        self.file.flush()
+        state["size"] = self.file.tell()
+        state["columns"] = self.columns
+
+    def finish(self, path: str) -> None:
+        self.file.close()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter:
+    """
+    Stages every page as a small Parquet file, then streams them into `path` with one row group per page.
+    SuiteQL leaves null fields out of its rows, so the schema is only known once every page is in: columns missing from a page are written as nulls and types that differ between pages are promoted, or written as strings.
+    """
+
+    def __init__(self, path: str, compression: Optional[str], dtypes: Optional[dict], page_columns: Callable, state: dict) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet exports need pyarrow: pip install NetSuite-Connector[arrow]") from None
+        self.compression = compression or "snappy"
+        self.dtypes = dtypes or {}
+        self.page_columns = page_columns
+        self.parts = f"{path}.parts"
+        if not state.get("pages"):
+            shutil.rmtree(self.parts, ignore_errors=True)
+        os.makedirs(self.parts, exist_ok=True)
+
+    def write(self, items: list, state: dict) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = self.page_columns(items)
+        arrays = {}
+        for name in list(columns):
+            array = pa.array(columns.pop(name))
+            arrays[name] = array.cast(self.dtypes[name]) if name in self.dtypes else array
+        part = os.path.join(self.parts, f"{state['offset']:012d}.parquet")
+        pq.write_table(pa.table(arrays), f"{part}.tmp", compression="none")
+        os.replace(f"{part}.tmp", part)
+
+    def _schema(self, parts: list):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types: dict = {}
+        for part in parts:
+            for field in pq.read_schema(part):
+                types.setdefault(field.name, set()).add(field.type)
+        fields = []
+        for name, candidates in types.items():
+            candidates = candidates - {pa.null()}
+            if len(candidates) > 1:
+                try:
+                    target = pa.unify_schemas(
+                        [pa.schema([(name, t)]) for t in candidates], promote_options="permissive"
+                    ).field(name).type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    target = pa.string()
+            else:
+                target = candidates.pop() if candidates else pa.null()
+            fields.append(pa.field(name, target))
+        return pa.schema(fields)
+
+    def finish(self, path: str) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parts = sorted(os.path.join(self.parts, name) for name in os.listdir(self.parts) if name.endswith(".parquet"))
+        schema = self._schema(parts)
+        with pq.ParquetWriter(f"{path}.tmp", schema, compression=self.compression) as writer:
+            for part in parts:
+                table = pq.read_table(part)
+                columns = [
+                    table.column(field.name).cast(field.type) if field.name in table.column_names else pa.nulls(table.num_rows, field.type)
+                    for field in schema
+                ]
+                writer.write_table(pa.table(columns, schema=schema), row_group_size=max(table.num_rows, 1))
+                del table, columns
+        os.replace(f"{path}.tmp", path)
+        shutil.rmtree(self.parts, ignore_errors=True)
+
+    def close(self) -> None:
+        pass
+
+
+def run_export(
+    client: "ODBC",
+    query: str,
+    path: str,
+    format: Optional[str] = None,
+    compression: Optional[str] = None,
+    page_size: int = 1000,
+    workers: int = 1,
+    resume: bool = False,
+    columns: Optional[list] = None,
+    dtypes: Optional[dict] = None,
+) -> ExportResult:
+    """
+    Writes every page of a SuiteQL query to `path` as it arrives. See ODBC.export.
+    """
+    path = os.path.expanduser(path)
+    format, compression = export_format(path, format, compression)
+    progress = f"{path}.progress"
+    identity = {"query": query, "page_size": page_size, "format": format, "compression": compression}
+    state = None
+    if resume and os.path.exists(progress):
+        with open(progress) as f:
+            state = json.load(f)
+        if any(state.get(key) != value for key, value in identity.items()):
+            raise ValueError(f"{progress} belongs to another export, delete it or export to another path")
+    if state is None:
+        state = dict(identity, offset=0, rows=0, pages=0, columns=list(columns) if columns else None)
+    result = ExportResult(path=path, format=format, resumed_at=state["rows"])
+    if state["rows"]:
+        log.info("Resuming the export of %s after %d rows.", path, state["rows"])
+
+    start = time.perf_counter()
+    if format == "parquet":
+        writer = _ParquetWriter(path, compression, dtypes, client._page_columns, state)
+    else:
+        writer = _TextWriter(path, format, compression, state)
+    try:
+        for items in client.iter_query(query, page_size, batches=True, workers=workers, offset=state["offset"]):
+            if not items:
+                continue
+            writer.write(items, state)
+            state["offset"] += len(items)
+            state["rows"] += len(items)
+            state["pages"] += 1
+            _write_json(progress, state)
+            del items
+        writer.finish(path)
+    finally:
+        writer.close()
+    if os.path.exists(progress):
+        os.remove(progress)
+    result.rows, result.pages = state["rows"], state["pages"]
+    result.elapsed = time.perf_counter() - start
+    return result
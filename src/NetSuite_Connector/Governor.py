@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import Any, Optional
+
+THROTTLE_ERROR_CODES = ("SSS_REQUEST_LIMIT_EXCEEDED", "CONCURRENCY_LIMIT_EXCEEDED")
+
+
+def is_throttled(code: Optional[int], response: Optional[str | bytes]) -> bool:
+    """
+    Tells whether a NetSuite response was rejected by the account governance limits. `response` is the body, as text or raw bytes.
+    """
+    if code == 429:
+        return True
+    if not (code and code >= 400 and response):
+        return False
+    if isinstance(response, (bytes, bytearray)):
+        return any(error.encode() in response for error in THROTTLE_ERROR_CODES)
+    return any(error in response for error in THROTTLE_ERROR_CODES)
+
+
+class Governor:
+    """
+    The Governor class caps the number of concurrent requests sent to a NetSuite account and adapts that cap with AIMD (additive increase, multiplicative decrease) from the throttled responses it observes.
+    Every NetSuite or ODBC instance given the same governor shares its window, so workers of the same account back off together instead of hammering it into throttling.
+    ```
+    from NetSuite_Connector.Governor import Governor
+    from NetSuite_Connector.NetSuite import NetSuite
+    nt = NetSuite(
+        account_id=123456,
+        consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+        token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije"),
+        governor=Governor.for_account(123456, limit=15),
+    )
+    ```
+    """
+
+    _registry: dict = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, limit: int, min_limit: int = 1, decrease: float = 0.5, increase: float = 1.0) -> None:
+        """
+        Parameters:
+            limit (int): The concurrency limit of the account, the window never grows above it.
+            min_limit (int, optional): The window never shrinks below it. Defaults to 1.
+            decrease (float, optional): The window is multiplied by this factor on throttling. Defaults to 0.5.
+            increase (float, optional): The window grows by this many slots per window of successful requests. Defaults to 1.0.
+        """
+        if not 1 <= min_limit <= limit:
+            raise ValueError("min_limit must be between 1 and limit")
+        self.limit = limit
+        self.min_limit = min_limit
+        self.decrease = decrease
+        self.increase = increase
+        self.window = float(limit)
+        self.in_flight = 0
+        self.throttled = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @classmethod
+    def for_account(cls, account_id: Any, limit: int = 15, **kwargs) -> "Governor":
+        """
+        Returns the governor shared by every client of `account_id` in this process, creating it with `limit` on first use.
+        """
+        with cls._registry_lock:
+            governor = cls._registry.get(str(account_id))
+            if governor is None:
+                governor = cls._registry[str(account_id)] = cls(limit, **kwargs)
+            return governor
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Blocks until a slot of the window is free and takes it.
+
+        Returns:
+            float: A token to hand back to `release`.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.in_flight < int(self.window), timeout):
+                raise TimeoutError("Timed out waiting for a NetSuite concurrency slot")
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, token: float, throttled: bool = False) -> None:
+        """
+        Frees a slot and adapts the window. A throttled response halves the window at most once per round of requests: requests started before the last decrease do not shrink it again.
+        Successes only grow the window while it is full, so an idle client does not inflate it past what the account was shown to accept.
+        """
+        with self._condition:
+            saturated = self.in_flight >= int(self.window)
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                if token > self._last_decrease:
+                    self.window = max(float(self.min_limit), self.window * self.decrease)
+                    self._last_decrease = time.monotonic()
+            elif saturated:
+                self.window = min(float(self.limit), self.window + self.increase / self.window)
+            self._condition.notify_all()
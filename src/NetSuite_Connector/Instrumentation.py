@@ -0,0 +1,293 @@
+import logging
+import math
+import re
+import socket
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+log = logging.getLogger(__name__)
+
+PHASES = ("dns", "connect", "tls", "server", "download", "total")
+ENDPOINT_PARAMS = ("script", "deploy")
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36})$")
+
+_current = threading.local()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    What a NetSuite request cost. Timings are in seconds and, like the byte counts, add up every attempt of the request, while `total` is the wall time from the first attempt to the last response, backoff included.
+    `dns`, `connect` and `tls` are only spent when a new connection is opened, `server` is the time until the response headers arrived and `download` the time spent reading the body.
+    """
+
+    method: str
+    url: str
+    status: Optional[int] = None
+    retries: int = 0
+    error: Optional[str] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    server: float = 0.0
+    download: float = 0.0
+    total: float = 0.0
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint(self.method, self.url)
+
+
+def endpoint(http_method: str, url: str) -> str:
+    """
+    Groups the URLs of a same endpoint: record ids in the path become `{id}` and only the `script` and `deploy` parameters of RESTlets are kept.
+    """
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in parts.path.split("/"))
+    query = "&".join(f"{k}={v}" for k, v in parse_qsl(parts.query) if k in ENDPOINT_PARAMS)
+    return f"{http_method.upper()} {parts.netloc}{path}{'?' + query if query else ''}"
+
+
+class RequestHook:
+    """
+    Base class of the request hooks given to NetSuite. `before_request` is called before the first attempt of a request and `after_request` once it is done, with its RequestMetrics filled in.
+    Hooks run on the thread that made the request, so they must be thread-safe and fast.
+    """
+
+    def before_request(self, metrics: RequestMetrics) -> None:
+        pass
+
+    def after_request(self, metrics: RequestMetrics) -> None:
+        pass
+
+
+def run_hooks(hooks: list, stage: str, metrics: RequestMetrics) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, stage)(metrics)
+        except Exception:
+            log.exception("Request hook %r failed.", hook)
+
+
+def timed_send(send: Callable, metrics: RequestMetrics, url: str, **kwargs):
+    """
+    Calls a session method with `stream=True` so the wait for the response headers and the download of the body are timed apart, and adds the connection timings recorded by TimedHTTPAdapter to `metrics`.
+    """
+    _current.metrics = metrics
+    try:
+        opened = metrics.dns + metrics.connect + metrics.tls
+        resp = send(url, stream=True, **kwargs)
+        opening = metrics.dns + metrics.connect + metrics.tls - opened
+        metrics.server += max(0.0, resp.elapsed.total_seconds() - opening)
+        start = perf_counter()
+        content = resp.content
+        metrics.download += perf_counter() - start
+    finally:
+        _current.metrics = None
+    body = resp.request.body
+    metrics.request_bytes += len(body.encode() if isinstance(body, str) else body or b"")
+    metrics.response_bytes += len(content or b"")
+    return resp
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        metrics = getattr(_current, "metrics", None)
+        if metrics is None:
+            return super()._new_conn()
+        host = self._dns_host
+        start = perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        except OSError:
+            # Let urllib3 resolve again and raise its own NameResolutionError.
+            addresses = [host]
+        resolved = perf_counter()
+        metrics.dns += resolved - start
+        try:
+            for address in addresses[:-1]:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except NewConnectionError:
+                    continue
+            self._dns_host = addresses[-1]
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+            metrics.connect += perf_counter() - resolved
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self) -> None:
+        metrics = getattr(_current, "metrics", None)
+        if metrics is None:
+            return super().connect()
+        opened = metrics.dns + metrics.connect
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            metrics.tls += max(0.0, perf_counter() - start - (metrics.dns + metrics.connect - opened))
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose connections record the time spent resolving, connecting and negotiating TLS into the RequestMetrics of the request that opened them.
+    The host is resolved once up front and its addresses are tried in turn, as urllib3 does, so the lookup can be timed on its own.
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
+
+
+class Histogram:
+    """
+    A log-bucketed histogram: values are counted in buckets `precision` wide relative to their size, so percentiles are exact to within `precision` whatever the number of samples, in constant memory.
+    """
+
+    def __init__(self, precision: float = 0.01, floor: float = 1e-6) -> None:
+        self.floor = floor
+        self._growth = math.log1p(precision)
+        self._buckets: Counter = Counter()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value: float) -> None:
+        bucket = math.ceil(math.log(value / self.floor) / self._growth) if value > self.floor else 0
+        with self._lock:
+            self._buckets[bucket] += 1
+            self.count += 1
+            self.sum += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def percentile(self, p: float) -> float:
+        """
+        Returns the value below which `p` percent of the recorded values fall.
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(p / 100 * self.count))
+            seen = 0
+            for bucket in sorted(self._buckets):
+                seen += self._buckets[bucket]
+                if seen >= rank:
+                    value = self.floor * math.exp(bucket * self._growth) if bucket else self.floor
+                    return min(max(value, self.min), self.max)
+            return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class MetricsRecorder(RequestHook):
+    """
+    A request hook that keeps, per endpoint, a histogram of every timing phase with the request, error, retry and byte counts.
+    ```
+    from NetSuite_Connector.Instrumentation import MetricsRecorder
+    from NetSuite_Connector.NetSuite import NetSuite
+    metrics = MetricsRecorder()
+    nt = NetSuite(account_id, consumer_keys, token_keys, hooks=[metrics])
+    ...
+    print(metrics.report())
+    # endpoint                                                         count  errors  retries   p50 ms   p95 ms   p99 ms
+    # GET 123456.suitetalk.api.netsuite.com/services/rest/record/v1/customer/{id}   200       0        3    182.4    341.9    612.0
+    ```
+    """
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self.precision = precision
+        self.endpoints: dict = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, name: str) -> dict:
+        stats = self.endpoints.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self.endpoints.setdefault(
+                    name,
+                    {
+                        "counts": Counter(),
+                        "histograms": {phase: Histogram(self.precision) for phase in PHASES},
+                        "lock": threading.Lock(),
+                    },
+                )
+        return stats
+
+    def after_request(self, metrics: RequestMetrics) -> None:
+        stats = self._stats(metrics.endpoint)
+        for phase in PHASES:
+            stats["histograms"][phase].record(getattr(metrics, phase))
+        with stats["lock"]:
+            counts = stats["counts"]
+            counts["requests"] += 1
+            counts["errors"] += metrics.error is not None or not metrics.status or metrics.status >= 400
+            counts["retries"] += metrics.retries
+            counts["request_bytes"] += metrics.request_bytes
+            counts["response_bytes"] += metrics.response_bytes
+
+    def snapshot(self, percentiles: tuple = (50, 95, 99)) -> dict:
+        """
+        Returns the counts and the percentiles of every phase, in seconds, per endpoint.
+        """
+        return {
+            name: {
+                **stats["counts"],
+                **{
+                    phase: {f"p{p}": histogram.percentile(p) for p in percentiles}
+                    for phase, histogram in stats["histograms"].items()
+                },
+            }
+            for name, stats in list(self.endpoints.items())
+        }
+
+    def report(self, phase: str = "total") -> str:
+        """
+        Formats the p50/p95/p99 of `phase`, in milliseconds, per endpoint.
+        """
+        snapshot = self.snapshot()
+        width = max([len(name) for name in snapshot] + [8])
+        lines = [f"{'endpoint':<{width}}  {'count':>7}  {'errors':>6}  {'retries':>7}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"]
+        for name, stats in sorted(snapshot.items()):
+            p = stats[phase]
+            lines.append(
+                f"{name:<{width}}  {stats['requests']:>7}  {stats['errors']:>6}  {stats['retries']:>7}"
+                f"  {p['p50'] * 1000:>8.1f}  {p['p95'] * 1000:>8.1f}  {p['p99'] * 1000:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints = {}
@@ -1,53 +1,201 @@
 import json
 import logging
+import threading
 import traceback
-from dataclasses import asdict, dataclass
-from typing import Any, Optional
+from collections import Counter
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional, Union
 
-import requests_oauthlib as oauth
+import requests
+from requests.adapters import HTTPAdapter
+
+from .Bulk import BulkProgress, BulkResult, run_bulk
+from .Cache import ResponseCache, request_key
+from .Coalesce import COALESCED_METHODS, SingleFlight, flight_key
+from .Governor import Governor, is_throttled
+from .Instrumentation import RequestHook, RequestMetrics, TimedHTTPAdapter, run_hooks
+from .OAuth import OAuth1Auth, SigningContext
+from .Retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from .Streaming import StreamedResponse, gzip_body
+from .Transport import TRANSPORTS, Transport
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
 
 
-@dataclass
+_UNDECODED = object()
+KEPT_RESPONSE_HEADERS = ("Location",)
+
+
+def fast_json_decoder() -> Callable[[bytes], Any]:
+    """
+    Returns `orjson.loads` when the optional `orjson` dependency is installed (`pip install NetSuite-Connector[fast]`), `json.loads` otherwise. Both accept the raw bytes of a response.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def kept_headers(headers: Any) -> Optional[dict]:
+    """
+    The response headers the library reads back from results (the Location of asynchronous jobs), which clients created with `keep_request=False` keep instead of all of them.
+    """
+    kept = {name: headers[name] for name in KEPT_RESPONSE_HEADERS if name in headers}
+    return kept or None
+
+
 class NetsuiteObject:
-    url: Optional[str] = None
-    request_headers: Optional[dict] = None
-    request_data: Optional[dict | str] = None
-    response: str = None
-    code: int = None
+    """
+    The result of a request. The body is kept as the raw bytes received (`content`), `response` decodes it to text on access and `data` parses it as JSON once, with the `decoder` of the client, and keeps the result.
+    Instances are slotted so that large batches of results stay small. Clients created with `keep_request=False` leave `request_headers` and `request_data` empty and keep only the Location of `response_headers`.
+    """
+
+    __slots__ = ("url", "request_headers", "request_data", "code", "response_headers", "encoding", "decoder", "_content", "_data")
+    _fields = ("url", "request_headers", "request_data", "response", "code", "response_headers")
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        request_headers: Optional[dict] = None,
+        request_data: Optional[dict | str] = None,
+        response: Optional[str | bytes] = None,
+        code: Optional[int] = None,
+        response_headers: Optional[dict] = None,
+        encoding: Optional[str] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+    ) -> None:
+        self.url = url
+        self.request_headers = request_headers
+        self.request_data = request_data
+        self.code = code
+        self.response_headers = response_headers
+        self.encoding = encoding
+        self.decoder = decoder
+        self.content = response
+
+    @property
+    def content(self) -> Optional[str | bytes]:
+        return self._content
+
+    @content.setter
+    def content(self, value: Optional[str | bytes]) -> None:
+        self._content = value
+        self._data = _UNDECODED
+
+    @property
+    def response(self) -> Optional[str]:
+        content = self._content
+        if isinstance(content, (bytes, bytearray)):
+            return content.decode(self.encoding or "utf-8", errors="replace")
+        return content
+
+    @response.setter
+    def response(self, value: Optional[str | bytes]) -> None:
+        self.content = value
+
+    @property
+    def data(self) -> Any:
+        """
+        The body parsed as JSON, decoded on first access. Raises ValueError when the body is not JSON.
+        """
+        if self._data is _UNDECODED:
+            self._data = (self.decoder or json.loads)(self._content) if self._content else None
+        return self._data
 
     def __repr__(self):
         return f"NetsuiteObject(url={self.url}, request_headers={self.request_headers}, request_data={self.request_data}, response={self.response}, code={self.code})"
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NetsuiteObject):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
     @property
     def json(self):
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._fields}
+
+    def copy(self) -> "NetsuiteObject":
+        """
+        Returns a result with the same fields and body, which decodes its own `data`.
+        """
+        return NetsuiteObject(
+            self.url, self.request_headers, self.request_data, self._content, self.code, self.response_headers, self.encoding, self.decoder
+        )
+
+
+class NetSuiteError(Exception):
+    """
+    Raised by the streaming helpers when NetSuite answers with an unsuccessful status code. The failed NetsuiteObject is kept in `response`.
+    """
+
+    def __init__(self, response: NetsuiteObject) -> None:
+        self.response = response
+        super().__init__(f"NetSuite request to {response.url} failed with code {response.code}: {response.response}")
 
 
 class NetSuite:
     """
     The NetSuite class is a Python wrapper for the NetSuite REST API. It provides methods for making HTTP requests to the NetSuite REST API using OAuth 1.0 authentication. The class supports GET, PUT, POST, and DELETE HTTP methods. The class also provides error handling for failed requests.
+
+    Requests are signed by a SigningContext built once per instance (`signer`) and sent over a session created on first use and reused, so connections are kept alive and pooled per host. Call `close()`, or use the instance as a context manager, to release the sockets.
+    Results keep the raw body and parse it lazily through `.data`. `stream` reads large responses chunk by chunk.
     ```
     from NetSuite_Connector.NetSuite import NetSuite
-    nt = NetSuite(
+    with NetSuite(
         account_id=123456,
         consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
         token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije"),
-    )
+    ) as nt:
 
-    x = nt.get(
-        url="https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx",
-        headers={"Content-Type": "application/json"},
-        params={}
-    )
+        x = nt.get(
+            url="https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx",
+            headers={"Content-Type": "application/json"},
+            params={}
+        )
     print(x)
     # NetsuiteObject(url='https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx', request_headers={'Content-Type': 'application/json'}, response='{"foo":"bar"}', code=200)
     ```
     """
 
-    def __init__(self, account_id: Any, consumer_keys: dict, token_keys: dict) -> None:
+    def __init__(
+        self,
+        account_id: Any,
+        consumer_keys: dict,
+        token_keys: dict,
+        pool_connections: int = 10,
+        pool_maxsize: Optional[int] = None,
+        concurrency_limit: int = 15,
+        governor: Optional[Governor] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        keep_request: bool = True,
+        json_decoder: Optional[Callable[[bytes], Any]] = None,
+        coalesce: bool = True,
+        transport: Union[str, Callable[["NetSuite"], Transport]] = "requests",
+        accept_encoding: str = "gzip, deflate",
+        gzip_requests: Optional[int] = None,
+    ) -> None:
+        """
+        Parameters:
+            account_id (Any): The NetSuite account id, used as the OAuth realm.
+            consumer_keys (dict): The consumer_key and consumer_secret of the integration.
+            token_keys (dict): The token_key and token_secret of the access token.
+            pool_connections (int, optional): The number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): The connections kept alive in each pool. Defaults to concurrency_limit.
+            concurrency_limit (int, optional): The concurrent requests the account allows, parallel helpers never use more workers. Defaults to 15.
+            governor (Governor, optional): An adaptive concurrency window, shared by the clients of an account with `Governor.for_account`. Defaults to None.
+            retry (RetryPolicy, optional): Which failed requests to send again and how long to wait. Defaults to None.
+            cache (ResponseCache, optional): Serves successful GET responses until they expire, see MemoryCache and SQLiteCache. Defaults to None.
+            hooks (Iterable[RequestHook], optional): Called around every request with its timings, byte counts, retries and status, see MetricsRecorder. Defaults to None.
+            keep_request (bool, optional): False keeps only the URL of the request and the Location header in results, for large batches. Defaults to True.
+            json_decoder (Callable, optional): Parses the bodies in `.data`, see fast_json_decoder. Defaults to json.loads.
+            coalesce (bool, optional): Identical GET and idempotent requests in flight on several threads share one call, see `flights`. Defaults to True.
+            transport (str or Callable, optional): "requests" (HTTP/1.1), "http2", or a Transport class or callable building one from the client. Defaults to "requests".
+            accept_encoding (str, optional): The Accept-Encoding of every request, responses are decompressed as they are read. Defaults to "gzip, deflate".
+            gzip_requests (int, optional): Request bodies of at least this many bytes are sent gzipped. Defaults to None.
+        """
         self.oauth_version = "1.0"
         self.signature_method = "HMAC-SHA256"
         self.account_id = account_id
@@ -57,7 +205,34 @@ class NetSuite:
         self.token_id, self.token_secret = self._validate_keys(
             token_keys, ["token_key", "token_secret"]
         ).values()
+        self.pool_connections = pool_connections
+        self.concurrency_limit = concurrency_limit
+        self.pool_maxsize = pool_maxsize or concurrency_limit
+        self.governor = governor
+        self.retry = retry
+        self.cache = cache
+        self.hooks = list(hooks or [])
+        self.keep_request = keep_request
+        self.json_decoder = json_decoder
+        self.coalesce = coalesce
+        self.accept_encoding = accept_encoding
+        self.gzip_requests = gzip_requests
+        self.flights = SingleFlight()
+        self.signer = SigningContext(
+            self.consumer_key,
+            self.consumer_secret,
+            self.token_id,
+            self.token_secret,
+            realm=self.account_id,
+            signature_method=self.signature_method,
+        )
         self._request_session = None
+        self._session_lock = threading.Lock()
+        if isinstance(transport, str):
+            if transport not in TRANSPORTS:
+                raise ValueError(f"Unknown transport {transport}, use one of {sorted(TRANSPORTS)}")
+            transport = TRANSPORTS[transport]
+        self.transport = transport(self)
 
     def _validate_keys(self, keys: dict, key_names: list) -> dict:
         missing_keys = [k for k in key_names if k not in keys]
@@ -65,18 +240,48 @@ class NetSuite:
             raise ValueError(f"Missing required keys: {missing_keys}")
         return {k: keys[k] for k in key_names}
 
-    def _make_request_session(self) -> oauth.OAuth1Session:
+    def _make_request_session(self) -> requests.Session:
         """
-        Creates an OAuth1Session object for making requests to the NetSuite REST API.
+        Creates a requests Session for making requests to the NetSuite REST API, signed with the SigningContext of the instance and with keep-alive connection pools mounted for http and https. The pools also time new connections when the instance has hooks.
         """
-        return oauth.OAuth1Session(
-            signature_method=self.signature_method,
-            client_key=self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.token_id,
-            resource_owner_secret=self.token_secret,
-            realm=self.account_id,
+        session = requests.Session()
+        session.auth = OAuth1Auth(self.signer)
+        session.headers["Accept-Encoding"] = self.accept_encoding
+        adapter = (TimedHTTPAdapter if self.hooks else HTTPAdapter)(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
         )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The session shared by every request of this instance, created on first use. It is read once, so a concurrent `close()` never hands out None.
+        """
+        session = self._request_session
+        if session is None:
+            with self._session_lock:
+                if self._request_session is None:
+                    self._request_session = self._make_request_session()
+                session = self._request_session
+        return session
+
+    def close(self) -> None:
+        """
+        Closes the pooled session, the transport and their connections. A new session is created if the instance is used again.
+        """
+        self.transport.close()
+        with self._session_lock:
+            if self._request_session is not None:
+                self._request_session.close()
+                self._request_session = None
+
+    def __enter__(self) -> "NetSuite":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def _make_request(
         self,
@@ -85,9 +290,13 @@ class NetSuite:
         headers: Optional[dict[str, str]] = None,
         params: Optional[dict[str, Any]] = None,
         body: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        idempotent: bool = False,
     ) -> NetsuiteObject:
         """
         Makes an HTTP request to the NetSuite REST API using the specified HTTP method, URL, headers, parameters, and body.
+        Failed attempts are sent again as long as the `retry` policy of the instance allows it.
+        With `coalesce`, a GET or an idempotent request identical to one already in flight on another thread waits for it and gets a copy of its response instead of calling NetSuite again.
 
         Parameters:
             http_method (str): The HTTP method to use for the request.
@@ -95,34 +304,162 @@ class NetSuite:
             headers (dict[str, str], optional): A dictionary of headers to include in the request. Defaults to {}.
             params (dict[str, Any], optional): A dictionary of parameters to include in the request. Defaults to {}.
             body (dict[str, Any], optional): A dictionary of data to include in the request body. Defaults to {}.
+            idempotency_key (str, optional): Sent as the X-NetSuite-Idempotency-Key header, makes a POST safe to retry. Defaults to None.
+            idempotent (bool, optional): Marks a request with no side effects (like a SuiteQL POST) as safe to retry. Defaults to False.
 
         Returns:
             NetsuiteObject: A NetsuiteObject containing the response data.
         """
-        log.debug("Making request to restlet at %s.", url)
-        log.debug("Payload: %s", body)
-        log.debug("Headers: %s", json.dumps(headers))
-        response = NetsuiteObject(url=url, request_headers=headers, request_data=body)
-        try:
-            self._request_session = self._make_request_session()
-
-            method = getattr(self._request_session, http_method.lower())
-            resp = method(
-                url,
-                data=(json.dumps(body) if isinstance(body, (dict, list)) else body),
-                params=params,
-                headers=headers,
+        data = json.dumps(body) if isinstance(body, (dict, list)) else body
+        if self.coalesce and (idempotent or http_method.upper() in COALESCED_METHODS):
+            key = flight_key(self.account_id, http_method, url, params, headers, data)
+            response, leader = self.flights.do(
+                key, lambda: self._send(http_method, url, headers, params, body, data, idempotency_key, idempotent)
+            )
+            return response if leader else response.copy()
+        return self._send(http_method, url, headers, params, body, data, idempotency_key, idempotent)
+
+    def _send(
+        self,
+        http_method: str,
+        url: str,
+        headers: Optional[dict[str, str]],
+        params: Optional[dict[str, Any]],
+        body: Any,
+        data: Any,
+        idempotency_key: Optional[str],
+        idempotent: bool,
+    ) -> NetsuiteObject:
+        """
+        Sends a request and its retries, see `_make_request`. `data` is the serialized `body`.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Making request to restlet at %s.", url)
+            log.debug("Payload: %s", body)
+            log.debug("Headers: %s", headers)
+        if self.keep_request:
+            response = NetsuiteObject(url=url, request_headers=headers, request_data=body, decoder=self.json_decoder)
+        else:
+            response = NetsuiteObject(url=url, decoder=self.json_decoder)
+        if idempotency_key:
+            headers = {**(headers or {}), IDEMPOTENCY_KEY_HEADER: idempotency_key}
+        data, headers = gzip_body(data, headers, self.gzip_requests)
+        retryable = self.retry is not None and (idempotent or self.retry.allows(http_method, idempotency_key))
+        retries = Counter()
+        metrics = None
+        if self.hooks:
+            metrics = RequestMetrics(method=http_method.upper(), url=url)
+            run_hooks(self.hooks, "before_request", metrics)
+            start = perf_counter()
+        while True:
+            resp = error = None
+            token = self.governor.acquire() if self.governor is not None else None
+            try:
+                resp = self.transport.send(http_method, url, data=data, params=params, headers=headers, metrics=metrics)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Got response headers: %s", dict(resp.headers))
+                response.content = resp.content
+                response.encoding = resp.encoding
+                response.code = resp.status_code
+                response.response_headers = dict(resp.headers) if self.keep_request else kept_headers(resp.headers)
+            except Exception as e:
+                error = e
+                response.code = 500
+                response.response = traceback.format_exc()
+                log.warning(response.response)
+            finally:
+                if token is not None:
+                    self.governor.release(token, throttled=is_throttled(response.code, response.content))
+
+            rule = self.retry.rule(code=response.code, error=error) if retryable else None
+            if rule is None or retries[rule[0]] >= rule[1] or sum(retries.values()) >= self.retry.total:
+                break
+            retries[rule[0]] += 1
+            delay = self.retry.backoff(
+                sum(retries.values()), resp.headers.get("Retry-After") if resp is not None else None
             )
-            log.debug("Got response headers: %s", json.dumps(dict(resp.headers)))
-            response.response = resp.text
-            response.code = resp.status_code
+            log.info("Retrying %s %s in %.2fs after %s.", http_method, url, delay, error or response.code)
+            self.retry.sleep(delay)
+
+        if metrics is not None:
+            metrics.total = perf_counter() - start
+            metrics.status = response.code
+            metrics.retries = sum(retries.values())
+            metrics.error = type(error).__name__ if error is not None else None
+            run_hooks(self.hooks, "after_request", metrics)
+        return response
+
+    def stream(
+        self,
+        http_method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        body: Any = None,
+        chunk_size: int = 65536,
+    ) -> StreamedResponse:
+        """
+        Sends a request and returns as soon as the response headers arrive, with the body left on the connection to be read in chunks, so large RESTlet exports go to disk or to a parser without being held in memory.
+        The body is decompressed as it is read when the server compressed it (see `accept_encoding`). Streamed requests are neither retried, coalesced nor cached; a `governor` slot is held until the response is closed.
+
+        Parameters:
+            http_method (str): The HTTP method to use for the request.
+            url (str): The URL of the NetSuite REST API endpoint to which the request will be sent.
+            headers (dict[str, str], optional): A dictionary of headers to include in the request. Defaults to {}.
+            params (dict[str, Any], optional): A dictionary of parameters to include in the request. Defaults to {}.
+            body (Any, optional): The request body, dicts and lists are sent as JSON. Defaults to None.
+            chunk_size (int, optional): Largest chunk of the body read at once, in bytes. Defaults to 65536.
+
+        Returns:
+            StreamedResponse: The status and headers of the response, with `iter_bytes`, `iter_lines`, `iter_json` and `save` to read its body.
+        ```
+        with nt.stream("GET", url="https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx") as response:
+            for record in response.iter_json("records"):
+                load(record)
+        ```
+        """
+        data = json.dumps(body) if isinstance(body, (dict, list)) else body
+        data, headers = gzip_body(data, headers, self.gzip_requests)
+        token = self.governor.acquire() if self.governor is not None else None
+        try:
+            response = self.transport.open(http_method, url, data=data, params=params, headers=headers, chunk_size=chunk_size)
         except Exception:
-            log.warning(traceback.format_exc())
-            response.code = 500
-            response.response = traceback.format_exc()
+            if token is not None:
+                self.governor.release(token)
+            raise
+        if token is not None:
+            close = response._close
+
+            def release() -> None:
+                try:
+                    close()
+                finally:
+                    self.governor.release(token, throttled=response.code == 429)
+
+            response._close = release
+        return response
+
+    def _cached(self, key: str, fetch, ttl: Optional[float], **fields) -> NetsuiteObject:
+        """
+        Returns the cached response stored under `key`, or calls `fetch` and caches its response when it succeeded.
+        """
+        hit = self.cache.get(key)
+        if hit is not None:
+            log.debug("Cache hit for %s.", key)
+            return NetsuiteObject(code=hit[0], response=hit[1], decoder=self.json_decoder, **fields)
+        response = fetch()
+        if response.code == 200:
+            self.cache.set(key, response.code, response.response, ttl=ttl)
         return response
 
-    def get(self, **kwargs) -> NetsuiteObject:
+    def invalidate(self, url: str, params: Optional[dict[str, Any]] = None) -> None:
+        """
+        Drops the cached response of a GET request.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(request_key(self.account_id, "GET", url, params))
+
+    def get(self, cache_ttl: Optional[float] = None, **kwargs) -> NetsuiteObject:
         """
         Makes a GET request to the NetSuite REST API using the specified URL, headers, and parameters.
 
@@ -131,11 +468,20 @@ class NetSuite:
             url (str): The URL of the NetSuite REST API endpoint to which the request will be sent.
             headers (dict[str, str], optional): A dictionary of headers to include in the request. Defaults to {}.
             params (dict[str, Any], optional): A dictionary of parameters to include in the request. Defaults to {}.
+            cache_ttl (float, optional): Seconds to keep the response in the cache of the instance. Defaults to the cache TTL.
 
         Returns:
             NetsuiteObject: A NetsuiteObject containing the response data.
         """
-        return self._make_request(http_method="GET", **kwargs)
+        if self.cache is None:
+            return self._make_request(http_method="GET", **kwargs)
+        return self._cached(
+            request_key(self.account_id, "GET", kwargs["url"], kwargs.get("params")),
+            lambda: self._make_request(http_method="GET", **kwargs),
+            cache_ttl,
+            url=kwargs["url"],
+            request_headers=kwargs.get("headers"),
+        )
 
     def put(self, **kwargs) -> NetsuiteObject:
         """
@@ -163,6 +509,7 @@ class NetSuite:
             headers (dict[str, str], optional): A dictionary of headers to include in the request. Defaults to {}.
             params (dict[str, Any], optional): A dictionary of parameters to include in the request. Defaults to {}.
             body (dict[str, Any], optional): A dictionary of data to include in the request body. Defaults to {}.
+            idempotency_key (str, optional): A unique key for the operation. POST requests are only retried when it is given. Defaults to None.
 
         Returns:
             NetsuiteObject: A NetsuiteObject containing the response data.
@@ -184,3 +531,64 @@ class NetSuite:
             NetsuiteObject: A NetsuiteObject containing the response data.
         """
         return self._make_request(http_method="DELETE", **kwargs)
+
+    def bulk(
+        self,
+        http_method: str,
+        url_template: str,
+        records: Iterable[dict],
+        workers: Optional[int] = None,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[Callable[[dict], str]] = None,
+        respond_async: bool = False,
+        poll_interval: float = 2.0,
+        job_timeout: Optional[float] = None,
+        progress: Optional[Callable[[BulkProgress], None]] = None,
+        progress_every: int = 100,
+    ) -> BulkResult:
+        """
+        Sends one request per record, streaming `records` through a bounded pool of threads that share the pooled session. Failures are collected without aborting the batch.
+
+        Parameters:
+            http_method (str): The HTTP method to use for every request.
+            url_template (str): The URL of each request, formatted with the fields of its record, e.g. ".../record/v1/customer/{id}".
+            records (Iterable[dict]): The records to send as request bodies. Only `2 * workers` of them are read ahead.
+            workers (int, optional): Number of concurrent requests, capped by `concurrency_limit`. Defaults to `concurrency_limit`.
+            headers (dict[str, str], optional): Headers sent with every request. Defaults to {}.
+            params (dict[str, Any], optional): Parameters sent with every request. Defaults to {}.
+            idempotency_key (Callable[[dict], str], optional): Builds the idempotency key of a record, which makes POSTs retryable. Defaults to None.
+            respond_async (bool, optional): Sends `Prefer: respond-async` and polls every accepted job until it completes, for very large loads. Defaults to False.
+            poll_interval (float, optional): Seconds between two polls of an asynchronous job. Defaults to 2.0.
+            job_timeout (float, optional): Seconds after which an asynchronous job is reported as failed with code 408. Defaults to None.
+            progress (Callable[[BulkProgress], None], optional): Called every `progress_every` records and at the end with the counts and throughput. Defaults to None.
+            progress_every (int, optional): Defaults to 100.
+
+        Returns:
+            BulkResult: The succeeded and failed records with their NetsuiteObject.
+        ```
+        result = nt.bulk(
+            "PATCH",
+            "https://123456.suitetalk.api.netsuite.com/services/rest/record/v1/customer/{id}",
+            ({"id": c["id"], "comments": "migrated"} for c in customers),
+            workers=10,
+        )
+        print(len(result.succeeded), len(result.failed), f"{result.rate:.0f} records/s")
+        ```
+        """
+        workers = min(workers or self.concurrency_limit, self.concurrency_limit)
+        return run_bulk(
+            self,
+            http_method,
+            url_template,
+            records,
+            workers,
+            headers=headers,
+            params=params,
+            idempotency_key=idempotency_key,
+            respond_async=respond_async,
+            poll_interval=poll_interval,
+            job_timeout=job_timeout,
+            progress=progress,
+            progress_every=progress_every,
+        )
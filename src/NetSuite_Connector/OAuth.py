@@ -0,0 +1,189 @@
+import base64
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Optional
+from urllib.parse import quote, unquote_plus, urlsplit, urlunsplit
+
+from requests.auth import AuthBase
+
+SIGNATURE_METHODS = {"HMAC-SHA256": hashlib.sha256, "HMAC-SHA1": hashlib.sha1}
+_UNRESERVED = re.compile(r"[A-Za-z0-9._~-]*")
+
+
+def _escape(value: Any) -> str:
+    value = str(value)
+    if _UNRESERVED.fullmatch(value):
+        return value
+    return quote(value, safe="~")
+
+
+def _base_url(url: str) -> str:
+    parts = urlsplit(url)
+    scheme, host = parts.scheme.lower(), (parts.hostname or "").lower()
+    port = parts.port
+    if port and not (scheme, port) in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", "", ""))
+
+
+def _escape_escaped(value: str) -> str:
+    # `value` is made of escaped parameters joined by "=" and "&", or of base64: every other character is unreserved.
+    return value.replace("%", "%25").replace("=", "%3D").replace("&", "%26").replace("+", "%2B").replace("/", "%2F")
+
+
+@lru_cache(maxsize=1024)
+def _escaped_base_url(url: str) -> str:
+    return _escape(_base_url(url))
+
+
+def _query_params(query: str) -> list:
+    """
+    Returns the escaped `(name, value)` pairs of a query string, as they enter the signature base string.
+    """
+    pairs = []
+    for field in query.split("&"):
+        if not field:
+            continue
+        name, _, value = field.partition("=")
+        if "%" in field or "+" in field:
+            name, value = unquote_plus(name), unquote_plus(value)
+        pairs.append((_escape(name), _escape(value)))
+    return pairs
+
+
+class _Nonces:
+    """
+    Hands out 128-bit hex nonces cut from a buffer of `os.urandom` bytes, refilled every `batch` nonces, instead of one system call per request. The buffer is dropped in forked children so that they never reuse the nonces of their parent.
+    """
+
+    def __init__(self, batch: int = 256) -> None:
+        self.batch = batch
+        self._lock = threading.Lock()
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._buffer = ""
+        self._position = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            if self._position >= len(self._buffer):
+                self._buffer = os.urandom(16 * self.batch).hex()
+                self._position = 0
+            nonce = self._buffer[self._position:self._position + 32]
+            self._position += 32
+        return nonce
+
+
+new_nonce = _Nonces()
+
+
+class SigningContext:
+    """
+    Signs requests with OAuth 1.0 (RFC 5849) for one set of credentials. Everything that does not change between requests is prepared once: the HMAC key, the escaped credentials and the Authorization header prefix with the realm.
+    A context is immutable, so a single one is shared by every thread and session of a client.
+    ```
+    from NetSuite_Connector.OAuth import SigningContext
+    signer = SigningContext("ck", "cs", "tk", "ts", realm="123456")
+    headers = {"Authorization": signer.sign("GET", "https://123456.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=1&deploy=1")}
+    ```
+    """
+
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        token_key: str,
+        token_secret: str,
+        realm: Any = None,
+        signature_method: str = "HMAC-SHA256",
+    ) -> None:
+        if signature_method not in SIGNATURE_METHODS:
+            raise ValueError(f"Unsupported signature method {signature_method}, use one of {sorted(SIGNATURE_METHODS)}")
+        self.consumer_key = consumer_key
+        self.token_key = token_key
+        self.realm = realm
+        self.signature_method = signature_method
+        self._key = f"{_escape(consumer_secret)}&{_escape(token_secret)}".encode()
+        self._digest = SIGNATURE_METHODS[signature_method]
+        self._params = [
+            ("oauth_consumer_key", _escape(consumer_key)),
+            ("oauth_signature_method", _escape(signature_method)),
+            ("oauth_token", _escape(token_key)),
+            ("oauth_version", "1.0"),
+        ]
+        header = ", ".join(f'{k}="{v}"' for k, v in self._params)
+        if realm is not None:
+            header = f'realm="{_escape(realm)}", {header}'
+        self._prefix = f"OAuth {header}"
+
+    def __repr__(self) -> str:
+        return f"SigningContext(consumer_key={self.consumer_key!r}, token_key={self.token_key!r}, realm={self.realm!r}, signature_method={self.signature_method!r})"
+
+    def sign(self, http_method: str, url: str, nonce: Optional[str] = None, timestamp: Optional[str] = None) -> str:
+        """
+        Returns the Authorization header of a request. `url` is the full URL, query string included; the body is never signed since NetSuite requests are JSON. `nonce` and `timestamp` are fixed values for testing, generated when omitted.
+        """
+        nonce = _escape(nonce) if nonce else new_nonce()
+        timestamp = _escape(timestamp) if timestamp else str(int(time.time()))
+        base, _, query = url.partition("?")
+        params = _query_params(query.partition("#")[0]) if query else []
+        params += self._params
+        params.append(("oauth_nonce", nonce))
+        params.append(("oauth_timestamp", timestamp))
+        params.sort()
+        normalized = "&".join([f"{k}={v}" for k, v in params])
+        base_string = f"{http_method.upper()}&{_escaped_base_url(base.partition('#')[0])}&{_escape_escaped(normalized)}"
+        signature = base64.b64encode(hmac.digest(self._key, base_string.encode(), self._digest)).decode()
+        return f'{self._prefix}, oauth_nonce="{nonce}", oauth_timestamp="{timestamp}", oauth_signature="{_escape_escaped(signature)}"'
+
+
+class OAuth1Auth(AuthBase):
+    """
+    A requests authentication handler that signs every prepared request with a SigningContext.
+    """
+
+    def __init__(self, signer: SigningContext) -> None:
+        self.signer = signer
+
+    def __call__(self, request):
+        request.headers["Authorization"] = self.signer.sign(request.method, request.url)
+        return request
+
+
+def sign_request(
+    http_method: str,
+    url: str,
+    consumer_key: str,
+    consumer_secret: str,
+    token_key: str,
+    token_secret: str,
+    realm: Any = None,
+    signature_method: str = "HMAC-SHA256",
+    nonce: Optional[str] = None,
+    timestamp: Optional[str] = None,
+) -> str:
+    """
+    Signs a request with OAuth 1.0 (RFC 5849) and returns the value of its Authorization header. Clients that sign many requests keep a SigningContext instead.
+
+    Parameters:
+        http_method (str): The HTTP method of the request.
+        url (str): The full URL of the request, query string included. The body is never signed since NetSuite requests are JSON.
+        consumer_key, consumer_secret, token_key, token_secret (str): The integration and token credentials.
+        realm (Any, optional): The NetSuite account ID, sent as the OAuth realm.
+        signature_method (str, optional): HMAC-SHA256 (default) or HMAC-SHA1.
+        nonce, timestamp (str, optional): Fixed values for testing, generated when omitted.
+
+    Returns:
+        str: The OAuth Authorization header.
+    """
+    return SigningContext(consumer_key, consumer_secret, token_key, token_secret, realm, signature_method).sign(
+        http_method, url, nonce, timestamp
+    )
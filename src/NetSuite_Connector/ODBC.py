@@ -1,19 +1,47 @@
+import json
+import logging
 import traceback
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, Union
 
-from .NetSuite import NetSuite, NetsuiteObject
+from .Cache import query_key
+from .Export import ExportResult, run_export
+from .NetSuite import NetSuite, NetSuiteError, NetsuiteObject
+from .Partition import extraction_name, partition_query, plan_partitions, probe_query
+from .Pipeline import iter_decoded
+from .Records import SUITEQL_MAX_IN, RecordCache, lookup_query, record_ids
+from .Sync import (
+    WATERMARK_COLUMN,
+    WATERMARK_STRPTIME,
+    SQLiteWatermarks,
+    WatermarkStore,
+    decode_position,
+    delta_query,
+    encode_position,
+    shift_watermark,
+)
+
+log = logging.getLogger(__name__)
+
+SUITEQL_HEADERS = {"prefer": "transient", "Content-Type": "application/json"}
+SUITEQL_MAX_PAGE_SIZE = 1000
 
 
 class ODBC(NetSuite):
 
-    def __init__(self, account_id: Any, consumer_keys: dict, token_keys: dict) -> None:
-        super().__init__(account_id, consumer_keys, token_keys)
+    def __init__(self, account_id: Any, consumer_keys: dict, token_keys: dict, record_cache: Optional[RecordCache] = None, **kwargs) -> None:
+        super().__init__(account_id, consumer_keys, token_keys, **kwargs)
         self.suiteql_endpoint = f'https://{account_id.lower().replace("_", "-")}.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql'
+        self.record_cache = record_cache if record_cache is not None else RecordCache()
 
-    def query(self, query: str) -> NetsuiteObject:
+    def query(self, query: str, cache_ttl: Optional[float] = None) -> NetsuiteObject:
         """
         Perfom a query to ODBC driver
         query: fully qualified sql query
+        cache_ttl: seconds to keep the result in the cache of the instance, when it has one
         >>> from NetSuite_Connector.ODBC import ODBC
 
         >>> nt = ODBC(
@@ -26,15 +54,610 @@ class ODBC(NetSuite):
 
         >>> NetsuiteObject(url='https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx', request_headers={'Content-Type': 'application/json'}, response='{"foo":"bar"}', code=200)
         """
-        response = NetsuiteObject(request_data=query)
+        if self.cache is not None:
+            return self._cached(query_key(self.account_id, query), lambda: self._query(query), cache_ttl, request_data=query)
+        return self._query(query)
+
+    def _query(self, query: str) -> NetsuiteObject:
+        response = NetsuiteObject(request_data=query, decoder=self.json_decoder)
         try:
             data = {"q": query}
-            headers = {"prefer": "transient", "Content-Type": "application/json"}
-            req = self.post(url=self.suiteql_endpoint, body=data, headers=headers)
-            response.response = req.response
+            req = self.post(url=self.suiteql_endpoint, body=data, headers=dict(SUITEQL_HEADERS), idempotent=True)
+            response.content = req.content
+            response.encoding = req.encoding
             response.code = req.code
         except Exception:
             response.code = 500
             response.response = traceback.format_exc()
 
         return response
+
+    def invalidate_query(self, query: str) -> None:
+        """
+        Drops the cached result of a SuiteQL query.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(query_key(self.account_id, query))
+
+    def _query_response(self, query: str, url: str, params: Optional[dict] = None) -> NetsuiteObject:
+        """
+        Fetches a single SuiteQL page. Raises NetSuiteError on an unsuccessful response.
+        """
+        req = self.post(url=url, params=params, body={"q": query}, headers=dict(SUITEQL_HEADERS), idempotent=True)
+        if req.code != 200:
+            raise NetSuiteError(req)
+        return req
+
+    def _query_page(self, query: str, url: str, params: Optional[dict] = None) -> dict:
+        """
+        Fetches a single SuiteQL page and returns the decoded body. Raises NetSuiteError on an unsuccessful response.
+        """
+        return self._query_response(query, url, params).data
+
+    @staticmethod
+    def _page_items(page: dict) -> list:
+        items = page.get("items", [])
+        for item in items:
+            item.pop("links", None)
+        return items
+
+    @staticmethod
+    def _next_link(page: dict) -> Optional[str]:
+        for link in page.get("links", []):
+            if link.get("rel") == "next":
+                return link.get("href")
+        return None
+
+    def _iter_pages(self, query: str, page_size: int, offset: int = 0) -> Iterator[list]:
+        """
+        Sequentially yields the rows of each page, following the next links.
+        """
+        url, params = self.suiteql_endpoint, {"limit": page_size, "offset": offset}
+        while True:
+            page = self._query_page(query, url, params)
+            items = self._page_items(page)
+            yield items
+            if not page.get("hasMore") or not items:
+                return
+            offset = page.get("offset", offset) + len(items)
+            next_link = self._next_link(page)
+            if next_link:
+                url, params = next_link, None
+            else:
+                url, params = self.suiteql_endpoint, {"limit": page_size, "offset": offset}
+            del page, items
+
+    def _iter_pages_parallel(self, query: str, page_size: int, workers: int, ordered: bool, offset: int = 0) -> Iterator[list]:
+        """
+        Fetches the first page, reads `totalResults` and fetches the remaining offsets on a pool of `workers` threads.
+        At most `workers` pages are in flight or buffered at any time.
+        """
+        first = self._query_page(query, self.suiteql_endpoint, {"limit": page_size, "offset": offset})
+        total = first.get("totalResults", 0)
+        yield self._page_items(first)
+        if not first.get("hasMore"):
+            return
+        del first
+
+        offsets = iter(range(offset + page_size, total, page_size))
+
+        def fetch(offset: int) -> list:
+            return self._page_items(self._query_page(query, self.suiteql_endpoint, {"limit": page_size, "offset": offset}))
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="suiteql")
+        try:
+            pending = deque(pool.submit(fetch, offset) for offset in islice(offsets, workers))
+            while pending:
+                if ordered:
+                    done = pending.popleft()
+                else:
+                    done = next(as_completed(pending))
+                    pending.remove(done)
+                for offset in islice(offsets, 1):
+                    pending.append(pool.submit(fetch, offset))
+                yield done.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_pages_pipeline(self, query: str, page_size: int, workers: int, decoders: int, queue_size: int, offset: int = 0) -> Iterator[list]:
+        """
+        Fetches the raw pages on `workers` threads and parses them on `decoders` processes, see `Pipeline.iter_decoded`.
+        """
+
+        def fetch(offset: int) -> tuple:
+            req = self._query_response(query, self.suiteql_endpoint, {"limit": page_size, "offset": offset})
+            return req.content, req.encoding
+
+        return iter_decoded(fetch, offset, page_size, workers, decoders, queue_size, self.json_decoder)
+
+    def get_records(
+        self,
+        record_type: str,
+        ids: Iterable[Any],
+        columns: str = "*",
+        versions: Optional[dict] = None,
+        chunk_size: int = SUITEQL_MAX_IN,
+    ) -> dict:
+        """
+        Fetches records by internal id through the `record_cache` of the instance, instead of one request per record.
+        The ids are de-duplicated, cached records are returned as they are and the others are fetched with `WHERE id IN (...)` SuiteQL queries of `chunk_size` ids.
+        Records another thread is already fetching are waited for rather than fetched twice.
+        record_type: SuiteQL table of the records, e.g. "customer", "item" or "vendor"
+        ids: internal ids, ints or digit strings
+        columns: selected columns, they must include `id`
+        versions: the `lastmodifieddate` expected for some ids, a cached record with another one is fetched again
+        chunk_size: ids per query, at most 1000
+        Returns the records by id as strings, ids that do not exist are left out.
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> customers = nt.get_records("customer", [row["entity"] for row in rows], columns="id, companyname, email")
+
+        >>> {'1234': {'id': '1234', 'companyname': 'Acme', 'email': 'ap@acme.com'}}
+        """
+        if not 0 < chunk_size <= SUITEQL_MAX_IN:
+            raise ValueError(f"chunk_size must be between 1 and {SUITEQL_MAX_IN}")
+        record_type = record_type.lower()
+        ids = record_ids(ids)
+        if versions:
+            versions = dict(zip(record_ids(versions), versions.values()))
+        cache = self.record_cache
+        records, owned, waiting = cache.claim(record_type, ids, versions, columns)
+        for start in range(0, len(owned), chunk_size):
+            chunk = owned[start:start + chunk_size]
+            try:
+                fetched = {}
+                for row in self.iter_query(lookup_query(record_type, chunk, columns)):
+                    if "id" not in row:
+                        raise ValueError("The selected columns must include id")
+                    fetched[str(row["id"])] = row
+            except BaseException as e:
+                cache.fail(record_type, owned[start:], e, columns)
+                raise
+            cache.fill(record_type, chunk, fetched, columns)
+            records.update(fetched)
+        for id, future in waiting.items():
+            record = future.result()
+            if record is not None:
+                records[id] = record
+        return {id: dict(records[id]) for id in ids if id in records}
+
+    def get_record(self, record_type: str, id: Any, columns: str = "*") -> Optional[dict]:
+        """
+        Fetches a single record by internal id through the `record_cache`, see `get_records`. Returns None if it does not exist.
+        """
+        return self.get_records(record_type, [id], columns).get(str(int(id)))
+
+    def invalidate_record(self, record_type: str, id: Any) -> None:
+        """
+        Drops the cached copies of a record, e.g. after updating it.
+        """
+        self.record_cache.invalidate(record_type.lower(), id)
+
+    def iter_query(
+        self,
+        query: str,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        batches: bool = False,
+        workers: int = 1,
+        ordered: bool = True,
+        offset: int = 0,
+        decoders: int = 0,
+        queue_size: Optional[int] = None,
+    ) -> Iterator:
+        """
+        Lazily iterates over every row of a SuiteQL query, following the `links`/`hasMore`/`offset` pagination of the suiteql resource.
+        Only one page is held in memory at a time, or `workers` pages in parallel mode.
+        query: fully qualified sql query
+        page_size: rows requested per page, NetSuite caps it at 1000
+        batches: yield each page as a list of rows instead of single rows
+        workers: fetch the pages after the first one concurrently on this many threads, capped by `concurrency_limit`
+        ordered: keep the rows in query order when fetching concurrently, set to False to get pages as soon as they arrive
+        offset: number of rows to skip, the query should have an ORDER BY for offsets to be stable between calls
+        decoders: parse the pages on a pool of this many processes instead of the fetching threads, so that decoding wide pages neither waits on the network nor holds the GIL of the downloads. Pages keep query order and the client `json_decoder` must be picklable (`json.loads` and `orjson.loads` are)
+        queue_size: raw pages waiting for a decoder before the downloads pause, `workers + decoders` by default
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> for row in nt.iter_query("SELECT id, tranid FROM transaction", page_size=500, workers=4):
+                print(row)
+
+        >>> {'id': '1', 'tranid': 'INV0001'}
+
+        >>> for rows in nt.iter_query("SELECT * FROM transaction", workers=4, decoders=2, batches=True):
+                load(rows)
+        """
+        if not 0 < page_size <= SUITEQL_MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {SUITEQL_MAX_PAGE_SIZE}")
+        workers = min(workers, self.concurrency_limit)
+        if decoders > 0:
+            workers = max(workers, 1)
+            pages = self._iter_pages_pipeline(query, page_size, workers, decoders, queue_size or workers + decoders, offset)
+        elif workers > 1:
+            pages = self._iter_pages_parallel(query, page_size, workers, ordered, offset)
+        else:
+            pages = self._iter_pages(query, page_size, offset)
+        for items in pages:
+            if batches:
+                yield items
+            else:
+                yield from items
+
+    def extract(
+        self,
+        query: str,
+        key: str = "id",
+        partition_by: Optional[str] = None,
+        dates: bool = False,
+        partitions: Optional[int] = None,
+        rows_per_partition: int = 50000,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        workers: Optional[int] = None,
+        batches: bool = False,
+        progress: Union[str, WatermarkStore, None] = None,
+        name: Optional[str] = None,
+    ) -> Iterator:
+        """
+        Extracts a whole table without offset pagination, which slows down with depth and stops at about 100k rows.
+        A MIN/MAX/COUNT probe splits the `partition_by` column into ranges, the partitions are read concurrently on `workers` threads and each one pages by ascending `key` (`key > last key`).
+        Pages are yielded as they complete: rows are in `key` order within a partition, not across partitions.
+        With `progress`, the plan and the last key of every partition are saved after each page, so a rerun after an interruption skips the finished partitions and resumes the others. The progress is cleared once the extraction completes.
+        query: base sql query, it must select `key`
+        key: unique numeric column used for keyset pagination
+        partition_by: column split into ranges, defaults to `key`. Rows where it is null are read in a partition of their own
+        dates: `partition_by` is a date column, split by days
+        partitions: number of partitions, by default about `rows_per_partition` rows each
+        page_size: rows requested per page, NetSuite caps it at 1000
+        workers: partitions read concurrently, capped by `concurrency_limit`
+        batches: yield each page as a list of rows instead of single rows
+        progress: a WatermarkStore (FileWatermarks or SQLiteWatermarks), or the path of a sqlite file
+        name: key of this extraction in the progress store, derived from the query by default
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> for rows in nt.extract("SELECT id, tranid, trandate FROM transaction", workers=8, batches=True, progress="~/.netsuite/extract.sqlite"):
+                load(rows)
+        """
+        if not 0 < page_size <= SUITEQL_MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {SUITEQL_MAX_PAGE_SIZE}")
+        column = partition_by or key
+        workers = min(workers or self.concurrency_limit, self.concurrency_limit)
+        if isinstance(progress, str):
+            progress = SQLiteWatermarks(progress)
+        name = name or extraction_name(query, key, column)
+
+        saved = progress.get(f"{name}/plan") if progress is not None else None
+        if saved is not None:
+            plan = json.loads(saved)
+        else:
+            probe = self._page_items(self._query_page(probe_query(query, column, dates), self.suiteql_endpoint, {"limit": 1, "offset": 0}))
+            bounds = probe[0] if probe else {}
+            plan = plan_partitions(
+                bounds.get("lo"),
+                bounds.get("hi"),
+                int(bounds.get("total") or 0),
+                int(bounds.get("counted") or 0),
+                rows_per_partition,
+                partitions,
+                dates,
+            )
+            if progress is not None:
+                progress.set(f"{name}/plan", json.dumps(plan))
+        log.info("Extracting %s in %d partitions.", name, len(plan))
+
+        cursors = {}
+        for index in range(len(plan)):
+            state = progress.get(f"{name}/{index}") if progress is not None else None
+            if state != "done":
+                cursors[index] = int(state) if state else None
+        remaining = iter(list(cursors))
+
+        def fetch(index: int, after: Optional[int]) -> tuple:
+            page = self._query_page(
+                partition_query(query, key, column, plan[index], after, dates),
+                self.suiteql_endpoint,
+                {"limit": page_size, "offset": 0},
+            )
+            items = self._page_items(page)
+            if items and key not in items[-1]:
+                raise ValueError(f"The query must select the key column {key}")
+            return items, bool(page.get("hasMore")) and bool(items)
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="suiteql")
+        try:
+            pending = {pool.submit(fetch, index, cursors[index]): index for index in islice(remaining, workers)}
+            while pending:
+                done = next(as_completed(pending))
+                index = pending.pop(done)
+                items, has_more = done.result()
+                if has_more:
+                    pending[pool.submit(fetch, index, items[-1][key])] = index
+                else:
+                    for following in islice(remaining, 1):
+                        pending[pool.submit(fetch, following, cursors[following])] = following
+                state = str(items[-1][key]) if has_more else "done"
+                if batches:
+                    yield items
+                else:
+                    yield from items
+                del items
+                if progress is not None:
+                    progress.set(f"{name}/{index}", state)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if progress is not None:
+            for index in range(len(plan)):
+                progress.reset(f"{name}/{index}")
+            progress.reset(f"{name}/plan")
+
+    @staticmethod
+    def _page_columns(items: list) -> dict[str, list]:
+        """
+        Transposes a page of rows into column lists. SuiteQL leaves null fields out of a row, those cells are filled with None.
+        """
+        columns = {}
+        for i, row in enumerate(items):
+            for name, value in row.items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * i
+                column.append(value)
+            if len(row) != len(columns):
+                for column in columns.values():
+                    if len(column) <= i:
+                        column.append(None)
+        return columns
+
+    def iter_columns(
+        self,
+        query: str,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        workers: int = 1,
+        dtypes: Optional[dict] = None,
+        as_arrow: bool = False,
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Yields `(rows, columns)` for every page of a SuiteQL query, where `columns` maps each column name to a typed pandas Series, or a pyarrow Array when `as_arrow` is set.
+        The decoded rows of a page are released as soon as the page is converted.
+        """
+        dtypes = dtypes or {}
+        if as_arrow:
+            import pyarrow as pa
+
+            def to_buffer(name, values):
+                array = pa.array(values)
+                return array.cast(dtypes[name]) if name in dtypes else array
+
+        else:
+            import pandas as pd
+
+            def to_buffer(name, values):
+                return pd.Series(values, dtype=dtypes.get(name))
+
+        for items in self.iter_query(query, page_size=page_size, batches=True, workers=workers):
+            rows = len(items)
+            columns = self._page_columns(items)
+            del items
+            yield rows, {name: to_buffer(name, columns.pop(name)) for name in list(columns)}
+
+    def query_frame(
+        self,
+        query: str,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        workers: int = 1,
+        dtypes: Optional[dict] = None,
+        as_arrow: bool = False,
+    ):
+        """
+        Runs a SuiteQL query and returns the whole result as a pandas DataFrame, or a pyarrow Table when `as_arrow` is set.
+        Every page is parsed straight into typed column buffers that are concatenated once at the end, so no list of row dicts is ever built.
+        query: fully qualified sql query
+        page_size: rows requested per page, NetSuite caps it at 1000
+        workers: fetch pages concurrently on this many threads, capped by `concurrency_limit`
+        dtypes: column name to pandas dtype (or pyarrow type with `as_arrow`), other columns are inferred per page
+        as_arrow: return a pyarrow Table whose columns keep one chunk per page, without copying (needs pyarrow)
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> df = nt.query_frame("SELECT id, tranid, foreigntotal FROM transaction", dtypes={"id": "int64", "foreigntotal": "float64"})
+
+        >>> df.dtypes
+        id               int64
+        tranid          object
+        foreigntotal   float64
+        """
+        chunks: dict[str, list] = {}
+        total = 0
+        for rows, columns in self.iter_columns(query, page_size, workers, dtypes, as_arrow):
+            for name, buffer in columns.items():
+                chunks.setdefault(name, []).append((total, buffer))
+            total += rows
+        if as_arrow:
+            return self._concat_arrow(chunks, total)
+        return self._concat_frame(chunks, total)
+
+    @staticmethod
+    def _fill_gaps(pieces: list, total: int, nulls) -> Iterator:
+        """
+        Yields the buffers of a column in row order, with `nulls(n)` in place of the pages where the column was absent.
+        """
+        position = 0
+        for start, buffer in pieces:
+            if start > position:
+                yield nulls(start - position, buffer)
+            yield buffer
+            position = start + len(buffer)
+        if position < total:
+            yield nulls(total - position, pieces[-1][1])
+
+    def _concat_frame(self, chunks: dict[str, list], total: int):
+        import pandas as pd
+
+        def nulls(count, like):
+            dtype = like.dtype
+            if not isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.kind in "iub":
+                dtype = "float64" if dtype.kind in "iu" else object
+            return pd.Series([None] * count, dtype=dtype)
+
+        data = {}
+        for name in list(chunks):
+            buffers = list(self._fill_gaps(chunks.pop(name), total, nulls))
+            data[name] = pd.concat(buffers, ignore_index=True) if buffers else pd.Series(dtype=object)
+            del buffers
+        return pd.DataFrame(data, copy=False)
+
+    def _concat_arrow(self, chunks: dict[str, list], total: int):
+        import pyarrow as pa
+
+        def nulls(count, like):
+            return pa.nulls(count, type=like.type)
+
+        data = {}
+        for name, pieces in chunks.items():
+            buffers = list(self._fill_gaps(pieces, total, nulls))
+            types = {buffer.type for buffer in buffers} - {pa.null()}
+            if len(types) > 1:
+                try:
+                    target = pa.unify_schemas(
+                        [pa.schema([(name, t)]) for t in types], promote_options="permissive"
+                    ).field(name).type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    target = pa.string()
+            else:
+                target = types.pop() if types else pa.null()
+            data[name] = pa.chunked_array([buffer.cast(target) for buffer in buffers], type=target)
+        return pa.table(data)
+
+    def export(
+        self,
+        query: str,
+        path: str,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        workers: int = 1,
+        resume: bool = False,
+        columns: Optional[list] = None,
+        dtypes: Optional[dict] = None,
+    ) -> ExportResult:
+        """
+        Streams the result of a SuiteQL query to a CSV, JSON Lines or Parquet file, writing every page as it arrives so that only one page is held in memory.
+        The progress is saved next to the file (`<path>.progress`) after every page. With `resume`, an interrupted export continues after its last completed page instead of starting over, so the query should have an ORDER BY.
+        query: fully qualified sql query
+        path: the file to write, "~" is expanded
+        format: "csv", "jsonl" or "parquet", inferred from the extension of `path` when omitted
+        compression: "gzip", "bz2" or "xz" for CSV and JSON Lines (inferred from a .gz/.bz2/.xz extension), or the Parquet codec (snappy by default)
+        page_size: rows requested per page, NetSuite caps it at 1000
+        workers: fetch pages concurrently on this many threads, capped by `concurrency_limit`
+        resume: continue an interrupted export of the same query to the same path
+        columns: the CSV header, taken from the first page when omitted. SuiteQL leaves null fields out, so pass it when a column may be empty on the whole first page
+        dtypes: column name to pyarrow type for Parquet, other columns are inferred
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> nt.export("SELECT id, tranid, foreigntotal FROM transaction ORDER BY id", "transactions.csv.gz", resume=True)
+
+        >>> ExportResult(path='transactions.csv.gz', format='csv', rows=254312, pages=255, resumed_at=0, elapsed=412.7)
+        """
+        if not 0 < page_size <= SUITEQL_MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {SUITEQL_MAX_PAGE_SIZE}")
+        return run_export(
+            self,
+            query,
+            path,
+            format=format,
+            compression=compression,
+            page_size=page_size,
+            workers=workers,
+            resume=resume,
+            columns=columns,
+            dtypes=dtypes,
+        )
+
+    def sync(
+        self,
+        query: str,
+        name: str,
+        watermarks: Union[str, WatermarkStore],
+        column: str = "lastmodifieddate",
+        since: Optional[str] = None,
+        lookback: float = 0,
+        page_size: int = SUITEQL_MAX_PAGE_SIZE,
+        id_column: str = "id",
+    ) -> Iterator[dict]:
+        """
+        Incrementally syncs a SuiteQL query: only the rows whose `column` changed since the last run are fetched, oldest first.
+        Pages are read by keyset in `(column, id_column)` order: each page starts right after the last row of the previous one, so rows sharing a timestamp are neither skipped nor limited by the offset cap.
+        The position (watermark and last id) is persisted under `name` after every page, so an interrupted run resumes right after its last completed page.
+        With a `lookback`, or from a bare `since`, the rows of the watermark second are fetched again, so rows should be upserted by id.
+        query: base sql query, it must select `column` and `id_column`
+        name: key of the position of this query in the store
+        watermarks: a WatermarkStore (FileWatermarks or SQLiteWatermarks), or the path of a sqlite file
+        column: the last modified datetime column of the query
+        since: watermark to start from ("YYYY-MM-DD HH:MM:SS") when none is stored yet, every row is fetched when omitted
+        lookback: seconds subtracted from the stored watermark, to catch rows committed late
+        id_column: a unique column of the query, breaking the ties of `column`
+        >>> from NetSuite_Connector.ODBC import ODBC
+
+        >>> nt = ODBC(
+            account_id=123456,
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije")
+            )
+
+        >>> for row in nt.sync("SELECT id, companyname, lastmodifieddate FROM customer", "customers", "~/.netsuite/sync.sqlite"):
+                upsert(row)
+        """
+        if not 0 < page_size <= SUITEQL_MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {SUITEQL_MAX_PAGE_SIZE}")
+        if isinstance(watermarks, str):
+            watermarks = SQLiteWatermarks(watermarks)
+        watermark, last_id = decode_position(watermarks.get(name))
+        if watermark is None:
+            watermark = since
+        if watermark:
+            datetime.strptime(watermark, WATERMARK_STRPTIME)
+        if lookback and watermark:
+            watermark, last_id = shift_watermark(watermark, lookback), None
+        while True:
+            query_page = delta_query(query, column, watermark, last_id, id_column)
+            page = self._query_page(query_page, self.suiteql_endpoint, {"limit": page_size, "offset": 0})
+            items = self._page_items(page)
+            position = (watermark, last_id)
+            for item in items:
+                item_watermark = item.pop(WATERMARK_COLUMN, None)
+                if item_watermark:
+                    if id_column not in item:
+                        raise ValueError(f"The synced query must select {id_column}")
+                    watermark, last_id = item_watermark, item[id_column]
+            yield from items
+            if watermark and (watermark, last_id) != position:
+                watermarks.set(name, encode_position(watermark, last_id))
+            # A page without a dated row cannot move the position.
+            if not page.get("hasMore") or not items or (watermark, last_id) == position:
+                return
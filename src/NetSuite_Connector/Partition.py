@@ -0,0 +1,78 @@
+import hashlib
+import json
+import math
+from datetime import date, timedelta
+from typing import Optional
+
+DATE_FORMAT = "YYYY-MM-DD"
+NULL_PARTITION = None
+
+
+def probe_query(query: str, column: str, dates: bool = False) -> str:
+    """
+    Builds the query returning the bounds and row counts of `column`, used to plan the partitions of `query`.
+    """
+    lo, hi = f"MIN(base.{column})", f"MAX(base.{column})"
+    if dates:
+        lo, hi = f"TO_CHAR({lo}, '{DATE_FORMAT}')", f"TO_CHAR({hi}, '{DATE_FORMAT}')"
+    return f"SELECT {lo} AS lo, {hi} AS hi, COUNT(*) AS total, COUNT(base.{column}) AS counted FROM ({query}) base"
+
+
+def plan_partitions(
+    lo: Optional[str],
+    hi: Optional[str],
+    total: int,
+    counted: int,
+    rows_per_partition: int,
+    partitions: Optional[int] = None,
+    dates: bool = False,
+) -> list:
+    """
+    Splits `[lo, hi]` into half-open `[start, end)` ranges of equal width, about `rows_per_partition` rows each unless `partitions` is given.
+    Date bounds are "YYYY-MM-DD" strings split by day. A last `None` partition holds the rows where the column is null.
+    """
+    plan = []
+    if counted and lo is not None and hi is not None:
+        if dates:
+            first, last = date.fromisoformat(lo[:10]), date.fromisoformat(hi[:10])
+            width = (last - first).days + 1
+        else:
+            first, last = int(lo), int(hi)
+            width = last - first + 1
+        count = max(1, min(width, partitions or math.ceil(counted / rows_per_partition)))
+        step = math.ceil(width / count)
+        for start in range(0, width, step):
+            end = min(start + step, width)
+            if dates:
+                plan.append([(first + timedelta(days=start)).isoformat(), (first + timedelta(days=end)).isoformat()])
+            else:
+                plan.append([first + start, first + end])
+    if total > counted:
+        plan.append(NULL_PARTITION)
+    return plan
+
+
+def partition_query(query: str, key: str, column: str, bounds: Optional[list], after: Optional[int], dates: bool = False) -> str:
+    """
+    Builds the keyset query of one partition: the rows of `bounds` whose `key` is greater than `after`, by ascending `key`.
+    """
+    if bounds is NULL_PARTITION:
+        where = [f"base.{column} IS NULL"]
+    elif dates:
+        where = [
+            f"base.{column} >= TO_DATE('{bounds[0]}', '{DATE_FORMAT}')",
+            f"base.{column} < TO_DATE('{bounds[1]}', '{DATE_FORMAT}')",
+        ]
+    else:
+        where = [f"base.{column} >= {int(bounds[0])}", f"base.{column} < {int(bounds[1])}"]
+    if after is not None:
+        where.append(f"base.{key} > {int(after)}")
+    return f"SELECT base.* FROM ({query}) base WHERE {' AND '.join(where)} ORDER BY base.{key}"
+
+
+def extraction_name(query: str, key: str, column: str) -> str:
+    """
+    The default name under which the progress of an extraction is kept.
+    """
+    digest = hashlib.sha1(json.dumps([" ".join(query.split()), key, column]).encode()).hexdigest()
+    return f"extract-{digest[:12]}"
@@ -0,0 +1,106 @@
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+_PUT_INTERVAL = 0.1
+
+
+def decode_page(content: bytes, encoding: Optional[str] = None, decoder: Optional[Callable[[bytes], Any]] = None) -> tuple:
+    """
+    Parses the raw body of a SuiteQL page, in a decoder process. Returns `(items, totalResults, hasMore)`, the rows without their `links`.
+    """
+    if encoding and encoding.lower().replace("-", "").replace("_", "") not in ("utf8", "ascii"):
+        content = content.decode(encoding)
+    page = (decoder or json.loads)(content)
+    items = page.get("items", [])
+    for item in items:
+        item.pop("links", None)
+    return items, page.get("totalResults", 0), bool(page.get("hasMore"))
+
+
+def _put(pages: queue.Queue, item: tuple, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=_PUT_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _feed(fetch: Callable[[int], tuple], offsets: Iterator[int], workers: int, pages: queue.Queue, stop: threading.Event) -> None:
+    """
+    The fetch stage: downloads the pages at `offsets` on `workers` threads and puts their raw bodies in `pages`, in order.
+    Blocks while the queue is full, so a slow decode stage stops the downloads instead of buffering them.
+    """
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="suiteql")
+    try:
+        pending = deque(pool.submit(fetch, offset) for offset in islice(offsets, workers))
+        while pending:
+            raw = pending.popleft().result()
+            for offset in islice(offsets, 1):
+                pending.append(pool.submit(fetch, offset))
+            if not _put(pages, ("page", raw), stop):
+                return
+        _put(pages, ("done", None), stop)
+    except BaseException as e:
+        _put(pages, ("error", e), stop)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_decoded(
+    fetch: Callable[[int], tuple],
+    offset: int,
+    page_size: int,
+    workers: int,
+    decoders: int,
+    queue_size: int,
+    decoder: Optional[Callable[[bytes], Any]] = None,
+) -> Iterator[list]:
+    """
+    Yields the rows of each page of a SuiteQL query, in order, with fetching and decoding in separate stages.
+    `fetch(offset)` returns the `(content, encoding)` of a page. The first page gives `totalResults`, then `workers` threads download
+    the other offsets into a queue of at most `queue_size` raw pages, which a pool of `decoders` processes parses.
+    At most `workers + queue_size + decoders` pages are held at any time.
+    """
+    executor = ProcessPoolExecutor(max_workers=decoders)
+    try:
+        # The pool starts its processes on the first submit, before the fetch threads exist.
+        items, total, has_more = executor.submit(decode_page, *fetch(offset), decoder).result()
+        yield items
+        if not has_more:
+            return
+        del items
+
+        pages = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        offsets = iter(range(offset + page_size, total, page_size))
+        feeder = threading.Thread(target=_feed, args=(fetch, offsets, workers, pages, stop), name="suiteql-feed", daemon=True)
+        feeder.start()
+        try:
+            decoding, finished, error = deque(), False, None
+            while True:
+                while not finished and len(decoding) < decoders:
+                    kind, value = pages.get()
+                    if kind == "page":
+                        decoding.append(executor.submit(decode_page, *value, decoder))
+                    else:
+                        finished, error = True, value
+                if not decoding:
+                    break
+                yield decoding.popleft().result()[0]
+            if error is not None:
+                raise error
+        finally:
+            stop.set()
+            feeder.join()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,130 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Iterable, Optional
+
+RECORD_TYPE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+LASTMODIFIED_COLUMN = "lastmodifieddate"
+SUITEQL_MAX_IN = 1000
+
+
+def record_ids(ids: Iterable[Any]) -> list:
+    """
+    Normalizes internal ids to strings of digits, keeping the first occurrence of each. Raises ValueError on an id that is not an integer.
+    """
+    seen = {}
+    for value in ids:
+        text = str(value).strip()
+        if not text.isdigit():
+            raise ValueError(f"Invalid internal id {value!r}")
+        seen.setdefault(str(int(text)), None)
+    return list(seen)
+
+
+def lookup_query(record_type: str, ids: list, columns: str = "*") -> str:
+    """
+    Builds the SuiteQL query fetching the records of `record_type` whose id is in `ids`.
+    """
+    if not RECORD_TYPE.match(record_type):
+        raise ValueError(f"Invalid record type {record_type!r}")
+    return f"SELECT {columns} FROM {record_type} WHERE id IN ({', '.join(ids)})"
+
+
+class RecordCache:
+    """
+    An in-process LRU of records keyed by `(record type, columns, id)`, each kept with its `lastmodifieddate` for the TTL of its type.
+    A lookup may name the `lastmodifieddate` it expects, a cached record with another one is a miss.
+    Lookups of records that are already being fetched by another thread wait for that fetch (single-flight) instead of fetching them again.
+    ```
+    from NetSuite_Connector.Records import RecordCache
+    cache = RecordCache(ttl=300, ttls={"item": 3600, "currency": 86400}, max_entries=100000)
+    nt = ODBC(account_id, consumer_keys, token_keys, record_cache=cache)
+    ```
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, ttls: Optional[dict] = None, max_entries: Optional[int] = 10000) -> None:
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._in_flight: dict = {}
+        self._lock = threading.Lock()
+
+    def _expiry(self, record_type: str) -> float:
+        ttl = self.ttls.get(record_type.lower(), self.ttl)
+        return time.time() + ttl if ttl is not None else float("inf")
+
+    def claim(self, record_type: str, ids: list, versions: Optional[dict] = None, columns: str = "*") -> tuple:
+        """
+        Sorts `ids` into `(hits, owned, waiting)`: the cached records by id, the ids the caller must fetch and then `fill` or `fail`,
+        and the futures of the ids another thread is fetching.
+        """
+        hits, owned, waiting = {}, [], {}
+        now = time.time()
+        with self._lock:
+            for id in ids:
+                key = (record_type, columns, id)
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now and (not versions or versions.get(id) in (None, entry[1])):
+                    self._entries.move_to_end(key)
+                    hits[id] = entry[2]
+                elif key in self._in_flight:
+                    waiting[id] = self._in_flight[key]
+                else:
+                    self._in_flight[key] = Future()
+                    owned.append(id)
+            self.hits += len(hits)
+            self.misses += len(owned)
+            self.coalesced += len(waiting)
+        return hits, owned, waiting
+
+    def fill(self, record_type: str, owned: list, records: dict, columns: str = "*") -> None:
+        """
+        Caches the `records` fetched for the `owned` ids and hands them to the threads waiting for them, None for the ids that do not exist.
+        """
+        expiry = self._expiry(record_type)
+        with self._lock:
+            for id, record in records.items():
+                key = (record_type, columns, id)
+                self._entries.pop(key, None)
+                self._entries[key] = (expiry, record.get(LASTMODIFIED_COLUMN), record)
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            futures = [self._in_flight.pop((record_type, columns, id)) for id in owned]
+        for id, future in zip(owned, futures):
+            future.set_result(records.get(id))
+
+    def fail(self, record_type: str, owned: list, error: BaseException, columns: str = "*") -> None:
+        """
+        Releases the `owned` ids after a failed fetch, the threads waiting for them get the error.
+        """
+        with self._lock:
+            futures = [self._in_flight.pop((record_type, columns, id)) for id in owned]
+        for future in futures:
+            future.set_exception(error)
+
+    def invalidate(self, record_type: str, id: Any) -> None:
+        """
+        Drops every cached copy of a record, e.g. after updating it.
+        """
+        id = str(id)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == record_type and key[2] == id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced, "evictions": self.evictions, "entries": len(self)}
@@ -0,0 +1,81 @@
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import requests
+
+IDEMPOTENCY_KEY_HEADER = "X-NetSuite-Idempotency-Key"
+
+
+@dataclass
+class RetryPolicy:
+    """
+    The RetryPolicy class tells NetSuite which failed requests to send again and how long to wait in between.
+
+    `statuses` and `exceptions` map a status code or an exception type to the number of retries it allows, and `total` caps the retries of a request across every rule. Delays use exponential backoff with full jitter, `random.uniform(0, min(max_backoff, backoff_factor * 2 ** retry))`, unless the response carries a `Retry-After` header.
+    GET, PUT and DELETE are retried automatically. POST is only retried when the caller passes an `idempotency_key`, which is sent as the `X-NetSuite-Idempotency-Key` header so NetSuite does not apply the request twice.
+    ```
+    from NetSuite_Connector.NetSuite import NetSuite
+    from NetSuite_Connector.Retry import RetryPolicy
+    nt = NetSuite(
+        account_id=123456,
+        consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+        token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije"),
+        retry=RetryPolicy(total=5, statuses={429: 5, 503: 3}),
+    )
+    nt.post(url=url, body=body, idempotency_key="9b2e3f0c-order-1042")
+    ```
+    """
+
+    total: int = 5
+    statuses: dict = field(default_factory=lambda: {429: 5, 500: 2, 502: 3, 503: 3, 504: 3})
+    exceptions: dict = field(
+        default_factory=lambda: {requests.exceptions.ConnectionError: 3, requests.exceptions.Timeout: 2}
+    )
+    methods: frozenset = frozenset({"GET", "PUT", "DELETE", "HEAD", "OPTIONS"})
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    respect_retry_after: bool = True
+    max_retry_after: float = 300.0
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+
+    def allows(self, http_method: str, idempotency_key: Optional[str] = None) -> bool:
+        """
+        Tells whether requests of `http_method` may be retried at all.
+        """
+        return http_method.upper() in self.methods or bool(idempotency_key)
+
+    def rule(self, code: Optional[int] = None, error: Optional[BaseException] = None) -> Optional[tuple]:
+        """
+        Returns the `(rule, max_retries)` matching a failed attempt, or None when it must not be retried.
+        """
+        if error is not None:
+            for exception, retries in self.exceptions.items():
+                if isinstance(error, exception):
+                    return exception, retries
+            return None
+        if code in self.statuses:
+            return code, self.statuses[code]
+        return None
+
+    def backoff(self, retry: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns the number of seconds to wait before the `retry`-th retry (starting at 1).
+        """
+        if self.respect_retry_after and retry_after:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1)))
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
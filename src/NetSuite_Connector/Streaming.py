@@ -0,0 +1,210 @@
+import codecs
+import gzip
+import json
+import logging
+import os
+from typing import Any, Callable, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+WHITESPACE = " \t\n\r"
+
+
+def gzip_body(data: Any, headers: Optional[dict], min_size: Optional[int]) -> tuple:
+    """
+    Compresses a request body of at least `min_size` bytes with gzip and adds the `Content-Encoding` header. Returns the `(data, headers)` to send.
+    """
+    if min_size is None or data is None:
+        return data, headers
+    raw = data.encode() if isinstance(data, str) else data
+    if not isinstance(raw, bytes) or len(raw) < min_size:
+        return data, headers
+    return gzip.compress(raw, compresslevel=6), {**(headers or {}), "Content-Encoding": "gzip"}
+
+
+class _Text:
+    """
+    A text buffer fed from byte chunks, for parsing JSON as it arrives.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], encoding: str) -> None:
+        self.chunks = chunks
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self) -> bool:
+        """
+        Appends the next chunk to the buffer, dropping what was already consumed. Returns False at the end of the body.
+        """
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self.decoder.decode(b"", final=True)
+        else:
+            text = self.decoder.decode(chunk)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, or "" at the end of the body.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in the JSON body, got {char or 'the end'!r}")
+        self.pos += 1
+        return char
+
+    def value(self, decode: Callable) -> Any:
+        """
+        Parses the next complete JSON value, reading more chunks until it is whole.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # A number at the end of the buffer may go on in the next chunk.
+            if end == len(self.buffer) and not self.eof and self.more():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterator[bytes], path: Optional[str] = None, encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yields the elements of a JSON array as the chunks of the document arrive, holding one element at a time.
+    `path` names the array by the dotted keys of the objects that contain it, e.g. "items" for a SuiteQL page, the document itself is the array by default.
+    The other values met on the way to the array are parsed whole and dropped.
+    """
+    text = _Text(chunks, encoding)
+    decode = json.JSONDecoder().raw_decode
+    for key in path.split(".") if path else []:
+        text.expect("{")
+        if text.peek() == "}":
+            raise KeyError(key)
+        while True:
+            name = text.value(decode)
+            text.expect(":")
+            if name == key:
+                break
+            text.value(decode)
+            if text.expect(",}") == "}":
+                raise KeyError(key)
+    text.expect("[")
+    if text.peek() == "]":
+        return
+    while True:
+        yield text.value(decode)
+        if text.expect(",]") == "]":
+            return
+
+
+class StreamedResponse:
+    """
+    A response whose body is read as it arrives instead of being held in memory, returned by `NetSuite.stream`.
+    The body is read once, with `iter_bytes`, `iter_lines`, `iter_json` or `save`. Close the response, or use it as a context manager, to release its connection.
+    ```
+    with nt.stream("GET", url=export_url) as response:
+        for record in response.iter_json("records"):
+            load(record)
+    ```
+    """
+
+    def __init__(
+        self,
+        url: str,
+        code: int,
+        headers: Any,
+        encoding: Optional[str],
+        chunks: Iterator[bytes],
+        close: Callable[[], None],
+    ) -> None:
+        self.url = url
+        self.code = code
+        self.headers = headers
+        self.encoding = encoding or "utf-8"
+        self.bytes_read = 0
+        self._chunks = chunks
+        self._close = close
+        self._consumed = False
+        self.closed = False
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """
+        Yields the body in chunks of bytes, already decompressed when the server used a `Content-Encoding`.
+        """
+        if self._consumed:
+            raise RuntimeError("The body of a streamed response can only be read once")
+        self._consumed = True
+        for chunk in self._chunks:
+            if chunk:
+                self.bytes_read += len(chunk)
+                yield chunk
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """
+        Yields the lines of the body without their line break, for JSON Lines or CSV exports.
+        """
+        rest = b""
+        for chunk in self.iter_bytes():
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if rest:
+            yield rest
+
+    def iter_json(self, path: Optional[str] = None) -> Iterator[Any]:
+        """
+        Yields the elements of the JSON array at `path` (dotted keys, e.g. "items") as they are received, see `iter_json_array`.
+        """
+        return iter_json_array(self.iter_bytes(), path, self.encoding)
+
+    def read(self) -> bytes:
+        """
+        Reads the whole remaining body, for small bodies such as errors.
+        """
+        return b"".join(self.iter_bytes())
+
+    def save(self, path: str) -> int:
+        """
+        Writes the body to `path` chunk by chunk and returns the number of bytes written.
+        """
+        written = 0
+        with open(os.path.expanduser(path), "wb") as f:
+            for chunk in self.iter_bytes():
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._close()
+
+    def __enter__(self) -> "StreamedResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"StreamedResponse(url={self.url}, code={self.code})"
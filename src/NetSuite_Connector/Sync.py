@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+WATERMARK_FORMAT = "YYYY-MM-DD HH24:MI:SS"
+WATERMARK_STRPTIME = "%Y-%m-%d %H:%M:%S"
+WATERMARK_COLUMN = "sync_watermark"
+
+
+def delta_query(query: str, column: str, watermark: Optional[str], last_id: Any = None, id_column: str = "id") -> str:
+    """
+    Wraps a SuiteQL query so it only returns the rows after the position `(watermark, last_id)` in `(column, id_column)` order, with the value of `column` as a sortable `sync_watermark` string.
+    Without `last_id` the rows at or after `watermark` are returned. The order is unique, so each page can start right after the last row of the previous one (keyset paging).
+    """
+    wrapped = f"SELECT base.*, TO_CHAR(base.{column}, '{WATERMARK_FORMAT}') AS {WATERMARK_COLUMN} FROM ({query}) base"
+    if watermark:
+        at = f"TO_TIMESTAMP('{watermark}', '{WATERMARK_FORMAT}')"
+        if last_id is None:
+            wrapped += f" WHERE base.{column} >= {at}"
+        else:
+            wrapped += f" WHERE (base.{column} > {at} OR (base.{column} = {at} AND base.{id_column} > {id_literal(last_id)}))"
+    return f"{wrapped} ORDER BY base.{column}, base.{id_column}"
+
+
+def id_literal(value: Any) -> str:
+    """
+    Renders an id as a SuiteQL literal, a number for internal ids and a quoted string otherwise.
+    """
+    value = str(value)
+    if value.isdigit():
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def encode_position(watermark: str, last_id: Any) -> str:
+    """
+    The value stored for a sync position, the watermark and the id of the last synced row: "2026-10-17 10:00:00|1234".
+    """
+    return watermark if last_id is None else f"{watermark}|{last_id}"
+
+
+def decode_position(value: Optional[str]) -> tuple:
+    """
+    Returns the `(watermark, last_id)` of a stored value, `last_id` is None for the bare watermarks of earlier versions.
+    """
+    if not value:
+        return None, None
+    watermark, _, last_id = value.partition("|")
+    return watermark, last_id or None
+
+
+def shift_watermark(watermark: Optional[str], seconds: float) -> Optional[str]:
+    if not watermark or not seconds:
+        return watermark
+    return (datetime.strptime(watermark, WATERMARK_STRPTIME) - timedelta(seconds=seconds)).strftime(WATERMARK_STRPTIME)
+
+
+class WatermarkStore:
+    """
+    Base class of the watermark stores, which persist the high-water mark of every synced query by name.
+    """
+
+    def get(self, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, name: str, watermark: str) -> None:
+        raise NotImplementedError
+
+    def reset(self, name: str) -> None:
+        raise NotImplementedError
+
+
+class FileWatermarks(WatermarkStore):
+    """
+    Keeps the watermarks in a JSON file, rewritten atomically on every update.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, state: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._read().get(name)
+
+    def set(self, name: str, watermark: str) -> None:
+        with self._lock:
+            state = self._read()
+            state[name] = watermark
+            self._write(state)
+
+    def reset(self, name: str) -> None:
+        with self._lock:
+            state = self._read()
+            if state.pop(name, None) is not None:
+                self._write(state)
+
+
+class SQLiteWatermarks(WatermarkStore):
+    """
+    Keeps the watermarks in a sqlite database.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("CREATE TABLE IF NOT EXISTS watermarks (name TEXT PRIMARY KEY, watermark TEXT)")
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT watermark FROM watermarks WHERE name = ?", (name,)).fetchone()
+            return row[0] if row else None
+
+    def set(self, name: str, watermark: str) -> None:
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO watermarks VALUES (?, ?)", (name, watermark))
+
+    def reset(self, name: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM watermarks WHERE name = ?", (name,))
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,236 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .Governor import Governor
+from .NetSuite import NetSuite
+from .ODBC import ODBC
+
+log = logging.getLogger(__name__)
+
+
+class TenantGovernor(Governor):
+    """
+    The governor of one account in a ClientRegistry: it caps and adapts the concurrency of the account like a Governor, then takes a slot of the `budget` shared by every account,
+    so a busy tenant cannot use up the connections of the others. It remembers when it was last used, for idle eviction.
+    """
+
+    def __init__(self, limit: int, budget: Governor, **kwargs) -> None:
+        super().__init__(limit, **kwargs)
+        self.budget = budget
+        self.last_used = time.monotonic()
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        token = super().acquire(timeout)
+        try:
+            self.budget.acquire(max(0.0, deadline - time.monotonic()) if deadline is not None else None)
+        except BaseException:
+            super().release(token)
+            raise
+        return token
+
+    def release(self, token: float, throttled: bool = False) -> None:
+        self.budget.release(token)
+        self.last_used = time.monotonic()
+        super().release(token, throttled=throttled)
+
+
+class _Tenant:
+    __slots__ = ("consumer_keys", "token_keys", "kwargs", "governor", "client", "last_used")
+
+    def __init__(self, consumer_keys: dict, token_keys: dict, kwargs: dict, governor: TenantGovernor) -> None:
+        self.consumer_keys = consumer_keys
+        self.token_keys = token_keys
+        self.kwargs = kwargs
+        self.governor = governor
+        self.client = None
+        self.last_used = time.monotonic()
+
+    def idle_for(self, now: float) -> float:
+        return now - max(self.last_used, self.governor.last_used)
+
+
+class ClientRegistry:
+    """
+    Keeps one client per NetSuite account for services that talk to many of them, instead of building a client per call.
+    Clients are built on first use from the credentials registered for their account and reused, with their pooled session, their SigningContext and, for ODBC, their `suiteql_endpoint`.
+    Every client gets a TenantGovernor: at most `concurrency_limit` requests in flight per account (or the limit registered for it), and at most `max_in_flight` for all of them together.
+    The governors cap requests, not sockets: each client keeps up to its `pool_maxsize` idle connections alive, so the sockets of the registry are bounded by `max_clients` times `pool_maxsize`.
+    A client unused for `idle_timeout` seconds is closed and dropped, and past `max_clients` the least recently used idle one is; it is built again on the next `get`, its governor and credentials are kept.
+    A client returned by `get` in the last `grace_period` seconds is never closed. Get the client from the registry for each call rather than holding on to it.
+    ```
+    from NetSuite_Connector.Tenants import ClientRegistry
+    with ClientRegistry(max_in_flight=60, concurrency_limit=15, idle_timeout=300) as clients:
+        clients.register(
+            "123456",
+            consumer_keys=dict(consumer_key="2345678", consumer_secret="3456yhg"),
+            token_keys=dict(token_key="wfdbfdsdfg", token_secret="efguhfjoidejhfije"),
+        )
+        clients.register("654321_SB1", consumer_keys=..., token_keys=..., concurrency_limit=5)
+        rows = clients.get("123456").query("SELECT id FROM customer")
+    ```
+    """
+
+    def __init__(
+        self,
+        client_class: Callable[..., NetSuite] = ODBC,
+        max_in_flight: int = 100,
+        concurrency_limit: int = 15,
+        idle_timeout: Optional[float] = 300.0,
+        max_clients: Optional[int] = None,
+        grace_period: float = 1.0,
+        **client_kwargs,
+    ) -> None:
+        """
+        Parameters:
+            client_class (type, optional): The class of the clients, NetSuite or ODBC. Defaults to ODBC.
+            max_in_flight (int, optional): The requests in flight for all the accounts together. Defaults to 100.
+            concurrency_limit (int, optional): The requests in flight per account, unless registered otherwise. Defaults to 15.
+            idle_timeout (float, optional): Seconds after which an unused client is closed, None to keep them. Defaults to 300.
+            max_clients (int, optional): The clients kept at once, None for no limit. Defaults to None.
+            grace_period (float, optional): Seconds after a `get` during which the client is not evicted, so a caller has time to use it. Defaults to 1.
+            **client_kwargs: Passed to every client, e.g. `retry` or `hooks`.
+        """
+        if "governor" in client_kwargs:
+            raise ValueError("The registry builds the governor of its clients")
+        self.client_class = client_class
+        self.budget = Governor(max_in_flight, decrease=1.0)
+        self.concurrency_limit = concurrency_limit
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self.grace_period = grace_period
+        self.client_kwargs = client_kwargs
+        self.created = 0
+        self.evictions = 0
+        self._tenants: dict = {}
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def register(self, account_id: Any, consumer_keys: dict, token_keys: dict, concurrency_limit: Optional[int] = None, **client_kwargs) -> None:
+        """
+        Adds the credentials of an account, its client is built on first use. Registering an account again replaces its credentials and closes its client.
+
+        Parameters:
+            account_id (Any): The NetSuite account id, e.g. "123456" or "123456_SB1".
+            consumer_keys (dict): The consumer_key and consumer_secret of the integration.
+            token_keys (dict): The token_key and token_secret of the account.
+            concurrency_limit (int, optional): The requests in flight for this account. Defaults to the limit of the registry.
+            **client_kwargs: Passed to the client of this account, over those of the registry.
+        """
+        if "governor" in client_kwargs:
+            raise ValueError("The registry builds the governor of its clients")
+        governor = TenantGovernor(concurrency_limit or self.concurrency_limit, self.budget)
+        with self._lock:
+            previous = self._tenants.get(str(account_id))
+            self._tenants[str(account_id)] = _Tenant(consumer_keys, token_keys, client_kwargs, governor)
+        if previous is not None and previous.client is not None:
+            previous.client.close()
+
+    def unregister(self, account_id: Any) -> None:
+        """
+        Forgets an account and closes its client.
+        """
+        with self._lock:
+            tenant = self._tenants.pop(str(account_id))
+        if tenant.client is not None:
+            tenant.client.close()
+
+    def get(self, account_id: Any) -> NetSuite:
+        """
+        Returns the client of a registered account, building it if it was never used or was evicted. Raises KeyError for an unknown account.
+        """
+        account_id = str(account_id)
+        now = time.monotonic()
+        closing = []
+        with self._lock:
+            tenant = self._tenants[account_id]
+            tenant.last_used = now
+            client = tenant.client
+            if client is None:
+                kwargs = {**self.client_kwargs, **tenant.kwargs, "concurrency_limit": tenant.governor.limit, "governor": tenant.governor}
+                client = tenant.client = self.client_class(account_id, tenant.consumer_keys, tenant.token_keys, **kwargs)
+                self.created += 1
+                closing.extend(self._over_limit(tenant))
+            if self.idle_timeout is not None and now - self._last_sweep >= self.idle_timeout / 2:
+                self._last_sweep = now
+                closing.extend(self._idle(now))
+        self._close(closing)
+        return client
+
+    __getitem__ = get
+
+    def _idle(self, now: float) -> list:
+        # Detaches the clients unused for idle_timeout, under the lock.
+        closing = []
+        for tenant in self._tenants.values():
+            if tenant.client is not None and tenant.governor.in_flight == 0 and tenant.idle_for(now) >= max(self.idle_timeout, self.grace_period):
+                closing.append(tenant.client)
+                tenant.client = None
+        self.evictions += len(closing)
+        return closing
+
+    def _over_limit(self, keep: _Tenant) -> list:
+        # Detaches the least recently used idle clients past max_clients, other than the one of `keep` and those handed out within grace_period, under the lock.
+        if self.max_clients is None:
+            return []
+        now = time.monotonic()
+        live = [tenant for tenant in self._tenants.values() if tenant.client is not None]
+        idle = sorted((tenant for tenant in live if tenant is not keep and tenant.governor.in_flight == 0 and tenant.idle_for(now) >= self.grace_period), key=lambda tenant: -tenant.idle_for(now))
+        closing = []
+        for tenant in idle[: max(0, len(live) - self.max_clients)]:
+            closing.append(tenant.client)
+            tenant.client = None
+        self.evictions += len(closing)
+        return closing
+
+    @staticmethod
+    def _close(clients: list) -> None:
+        for client in clients:
+            log.debug("Closing the idle client of account %s.", client.account_id)
+            client.close()
+
+    def evict_idle(self) -> int:
+        """
+        Closes the clients unused for `idle_timeout` seconds now, instead of on the next `get`. Returns the number of clients closed.
+        """
+        if self.idle_timeout is None:
+            return 0
+        with self._lock:
+            self._last_sweep = time.monotonic()
+            closing = self._idle(self._last_sweep)
+        self._close(closing)
+        return len(closing)
+
+    def close(self) -> None:
+        """
+        Closes every client. The accounts stay registered and their clients are built again if they are used.
+        """
+        with self._lock:
+            closing = [tenant.client for tenant in self._tenants.values() if tenant.client is not None]
+            for tenant in self._tenants.values():
+                tenant.client = None
+        for client in closing:
+            client.close()
+
+    def __enter__(self) -> "ClientRegistry":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, account_id: Any) -> bool:
+        return str(account_id) in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def stats(self) -> dict:
+        return {
+            "tenants": len(self),
+            "clients": sum(tenant.client is not None for tenant in list(self._tenants.values())),
+            "created": self.created,
+            "evictions": self.evictions,
+            "in_flight": self.budget.in_flight,
+        }
@@ -0,0 +1,173 @@
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+import requests
+
+from .Instrumentation import RequestMetrics, timed_send
+from .Streaming import StreamedResponse
+
+if TYPE_CHECKING:
+    from .NetSuite import NetSuite
+
+log = logging.getLogger(__name__)
+
+
+class Transport:
+    """
+    Sends the requests of a NetSuite client over the network. A transport is built with its client, signs every request with the `signer` of that client and returns a response with
+    `status_code`, `headers`, `content` and `encoding`. Network errors are raised, the client turns them into results and retries.
+    """
+
+    def __init__(self, client: "NetSuite") -> None:
+        self.client = client
+
+    def send(
+        self,
+        http_method: str,
+        url: str,
+        data: Any = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ) -> Any:
+        """
+        Sends one signed request and returns its response. `metrics`, when given, is filled with the timings and byte counts the transport can measure.
+        """
+        raise NotImplementedError
+
+    def open(
+        self,
+        http_method: str,
+        url: str,
+        data: Any = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        chunk_size: int = 65536,
+    ) -> StreamedResponse:
+        """
+        Sends one signed request and returns as soon as its headers are received, the body is read from the StreamedResponse in chunks of up to `chunk_size` bytes.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Closes the connections of the transport. It opens new ones if it is used again.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport: HTTP/1.1 over the pooled requests session of the client (`client.session`), one connection per concurrent request.
+    """
+
+    def send(self, http_method, url, data=None, params=None, headers=None, metrics=None):
+        method = getattr(self.client.session, http_method.lower())
+        if metrics is None:
+            return method(url, data=data, params=params, headers=headers)
+        return timed_send(method, metrics, url, data=data, params=params, headers=headers)
+
+    def open(self, http_method, url, data=None, params=None, headers=None, chunk_size=65536):
+        response = self.client.session.request(http_method.upper(), url, data=data, params=params, headers=headers, stream=True)
+        return StreamedResponse(
+            response.url, response.status_code, response.headers, response.encoding, response.iter_content(chunk_size), response.close
+        )
+
+
+@contextmanager
+def _as_requests_errors() -> Iterator[None]:
+    """
+    Raises the network errors of httpx as their requests counterparts, so the retry rules of a RetryPolicy apply to every transport.
+    """
+    try:
+        yield
+    except Exception as e:
+        httpx = sys.modules.get("httpx")
+        if httpx is None:
+            raise
+        if isinstance(e, httpx.TimeoutException):
+            raise requests.exceptions.Timeout(str(e)) from e
+        if isinstance(e, (httpx.NetworkError, httpx.RemoteProtocolError)):
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        raise
+
+
+class HTTP2Transport(Transport):
+    """
+    Multiplexes the requests of every thread of the client as concurrent HTTP/2 streams over one TLS connection per host, through an httpx.Client.
+    Needs the optional `httpx` and `h2` dependencies (`pip install NetSuite-Connector[http2]`). Hooks get the status, byte counts and server time of each request, not the connection phases. Connection errors and timeouts are raised as their `requests` counterparts, so the same retry rules apply.
+    ```
+    from functools import partial
+    from NetSuite_Connector.Transport import HTTP2Transport
+    nt = ODBC(account_id, consumer_keys, token_keys, transport="http2")
+    nt = ODBC(account_id, consumer_keys, token_keys, transport=partial(HTTP2Transport, timeout=120))
+    ```
+    """
+
+    def __init__(self, client: "NetSuite", timeout: Optional[float] = 60.0, verify: Any = True) -> None:
+        super().__init__(client)
+        self.timeout = timeout
+        self.verify = verify
+        self._http = None
+        self._lock = threading.Lock()
+
+    def _make_http(self):
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError as e:
+            raise ImportError("HTTP2Transport requires httpx and h2, install them with `pip install httpx[http2]`") from e
+        limits = httpx.Limits(max_connections=self.client.pool_maxsize, max_keepalive_connections=self.client.pool_maxsize)
+        return httpx.Client(
+            http2=True,
+            limits=limits,
+            timeout=self.timeout,
+            verify=self.verify,
+            headers={"Accept-Encoding": self.client.accept_encoding},
+        )
+
+    @property
+    def http(self):
+        """
+        The httpx.Client shared by every request of the client, created on first use.
+        """
+        http = self._http
+        if http is None:
+            with self._lock:
+                if self._http is None:
+                    self._http = self._make_http()
+                http = self._http
+        return http
+
+    def _signed(self, http_method, url, data, params, headers):
+        request = self.http.build_request(http_method.upper(), url, params=params, content=data, headers=headers)
+        request.headers["Authorization"] = self.client.signer.sign(request.method, str(request.url))
+        return request
+
+    def send(self, http_method, url, data=None, params=None, headers=None, metrics=None):
+        request = self._signed(http_method, url, data, params, headers)
+        with _as_requests_errors():
+            response = self.http.send(request)
+        if metrics is not None:
+            metrics.request_bytes += len(request.content)
+            metrics.response_bytes += len(response.content)
+            metrics.server += response.elapsed.total_seconds()
+        return response
+
+    def open(self, http_method, url, data=None, params=None, headers=None, chunk_size=65536):
+        with _as_requests_errors():
+            response = self.http.send(self._signed(http_method, url, data, params, headers), stream=True)
+        return StreamedResponse(
+            str(response.url), response.status_code, response.headers, response.charset_encoding, response.iter_bytes(chunk_size), response.close
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+
+TRANSPORTS = {"requests": RequestsTransport, "http2": HTTP2Transport}
@@ -0,0 +1,59 @@
+import shutil
+
+import pytest
+
+from mock_netsuite import MockNetSuite
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+
+KEYS = ({"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "odbc(**options): options of the ODBC client built by the odbc fixture")
+
+
+@pytest.fixture
+def mock_server():
+    with MockNetSuite() as server:
+        yield server
+
+
+@pytest.fixture
+def tls_mock_server():
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required for the TLS stand-in")
+    with MockNetSuite(tls=True) as server:
+        yield server
+
+
+@pytest.fixture
+def h2_mock_server():
+    pytest.importorskip("h2")
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required for the TLS stand-in")
+    with MockNetSuite(http2=True) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client():
+    """
+    Builds clients of account 123456 with test credentials: `make_client(cls=NetSuite, **options)`.
+    """
+
+    def make(cls=NetSuite, **kwargs):
+        return cls("123456", *KEYS, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def odbc(request, mock_server):
+    """
+    An ODBC client whose suiteql_endpoint is the mock server, built with the options of the `odbc` marker of the test.
+    """
+    marker = request.node.get_closest_marker("odbc")
+    with ODBC("123456", *KEYS, **(marker.kwargs if marker else {})) as client:
+        client.suiteql_endpoint = mock_server.suiteql_endpoint
+        yield client
@@ -0,0 +1,459 @@
+"""
+Local stand-in for NetSuite RESTlet and SuiteQL endpoints.
+
+The server runs on a background thread, speaks HTTP/1.1 with keep-alive and can optionally
+wrap its socket in TLS using a throwaway self-signed certificate, or speak HTTP/2 over TLS. It counts accepted
+connections (one TLS handshake each) and handled requests so tests can assert on how the
+connector uses the network.
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def make_self_signed_cert(directory: str) -> tuple:
+    """
+    Creates a self-signed certificate for localhost with the openssl CLI.
+
+    Returns:
+        tuple: The (certfile, keyfile) paths.
+    """
+    if shutil.which("openssl") is None:
+        raise RuntimeError("openssl is required to generate a test certificate")
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", keyfile, "-out", certfile, "-days", "1",
+            "-subj", "/CN=localhost",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self.ssl_context = ssl_context
+        self.connections = 0
+        self.requests = 0
+        self.counter_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        with self.counter_lock:
+            self.connections += 1
+        if self.ssl_context is not None:
+            sock = self.ssl_context.wrap_socket(sock, server_side=True)
+        return sock, addr
+
+
+def _dispatch(server, method: str, target: str, headers: dict, body: bytes) -> tuple:
+    """
+    Answers one request through the routes of the mock, after its latency or with a 429 past `max_concurrent`.
+    Returns the `(status, headers, payload)` of the response, with the payload serialized to bytes.
+    """
+    parsed = urlparse(target)
+    mock = server.mock
+    with server.counter_lock:
+        server.requests += 1
+        mock.in_flight += 1
+        throttled = mock.max_concurrent is not None and mock.in_flight > mock.max_concurrent
+        mock.throttled += throttled
+        failed = not throttled and mock.error_rate > 0 and mock.random.random() < mock.error_rate
+        mock.errors += failed
+    try:
+        if mock.latency:
+            time.sleep(mock.latency)
+        if failed:
+            status, response_headers, payload = mock.error_status, {"Content-Type": "application/json"}, {
+                "title": "Service Unavailable",
+                "status": mock.error_status,
+                "o:errorDetails": [{"detail": "An unexpected error occurred.", "o:errorCode": "UNEXPECTED_ERROR"}],
+            }
+        elif throttled:
+            status, response_headers, payload = 429, {"Content-Type": "application/json"}, {
+                "type": "https://www.rfc-editor.org/rfc/rfc6585#section-4",
+                "title": "Too Many Requests",
+                "status": 429,
+                "o:errorDetails": [{"detail": "Concurrent request limit exceeded.", "o:errorCode": "SSS_REQUEST_LIMIT_EXCEEDED"}],
+            }
+        else:
+            handler = mock.route(parsed.path)
+            status, response_headers, payload = handler(method, parsed.path, parse_qs(parsed.query), headers, body)
+    finally:
+        with server.counter_lock:
+            mock.in_flight -= 1
+    if not isinstance(payload, bytes):
+        payload = json.dumps(payload).encode()
+    return status, response_headers, payload
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes: with Nagle on, every keep-alive response would wait for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = _dispatch(self.server, self.command, self.path, dict(self.headers), body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_PATCH = do_DELETE = _handle
+
+
+class _HTTP2Server:
+    """
+    The HTTP/2 counterpart of _Server: an asyncio TLS server negotiating h2 with ALPN. The streams of a connection are
+    answered concurrently on a thread pool, so one connection carries many requests in flight. Needs the `h2` package.
+    """
+
+    def __init__(self, mock: "MockNetSuite", ssl_context: ssl.SSLContext) -> None:
+        self.mock = mock
+        self.connections = 0
+        self.requests = 0
+        self.counter_lock = threading.Lock()
+        ssl_context.set_alpn_protocols(["h2"])
+        self._pool = ThreadPoolExecutor(max_workers=128, thread_name_prefix="mock-h2")
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._serve, "127.0.0.1", 0, ssl=ssl_context))
+        self.server_address = self._server.sockets[0].getsockname()
+        self._stopped = threading.Event()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._stopped.wait()
+
+    def server_close(self) -> None:
+        self._server.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        with self.counter_lock:
+            self.connections += 1
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        streams, pending = {}, {}
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        streams[event.stream_id] = (event.headers, bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        streams[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = streams.pop(event.stream_id)
+                        asyncio.ensure_future(self._respond(conn, writer, pending, event.stream_id, headers, bytes(body)))
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        self._flush(conn, pending)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except (ConnectionError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, conn, writer, pending: dict, stream_id: int, headers: list, body: bytes) -> None:
+        request_headers = {name.title(): value for name, value in headers if not name.startswith(":")}
+        pseudo = dict(headers)
+        status, response_headers, payload = await asyncio.get_running_loop().run_in_executor(
+            self._pool, _dispatch, self, pseudo[":method"], pseudo[":path"], request_headers, body
+        )
+        fields = [(":status", str(status)), *((name.lower(), value) for name, value in response_headers.items())]
+        conn.send_headers(stream_id, fields + [("content-length", str(len(payload)))])
+        pending[stream_id] = payload
+        self._flush(conn, pending)
+        writer.write(conn.data_to_send())
+
+    @staticmethod
+    def _flush(conn, pending: dict) -> None:
+        import h2.exceptions
+
+        for stream_id, payload in list(pending.items()):
+            try:
+                while payload:
+                    size = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size, len(payload))
+                    if size <= 0:
+                        break
+                    conn.send_data(stream_id, payload[:size])
+                    payload = payload[size:]
+                if payload:
+                    pending[stream_id] = payload
+                else:
+                    conn.end_stream(stream_id)
+                    del pending[stream_id]
+            except h2.exceptions.StreamClosedError:
+                del pending[stream_id]
+
+
+def echo(method: str, path: str, query: dict, headers: dict, body: bytes) -> tuple:
+    """
+    Default RESTlet route, echoes the request back as JSON.
+    """
+    return 200, {"Content-Type": "application/json"}, {
+        "method": method,
+        "path": path,
+        "query": {k: v[0] for k, v in query.items()},
+        "body": body.decode() if body else None,
+        "authorization": headers.get("Authorization"),
+    }
+
+
+SUITEQL_PATH = "/services/rest/query/v1/suiteql"
+
+
+def default_row(index: int) -> dict:
+    return {"id": str(index + 1), "tranid": f"INV{index + 1:06d}", "amount": f"{index % 1000}.50"}
+
+
+class SuiteQLRoute:
+    """
+    Paginated suiteql resource serving `total` generated rows, with the same `links`, `count`,
+    `hasMore`, `offset` and `totalResults` envelope as NetSuite. When `source` is given, it is
+    called with the SuiteQL text and returns the list of rows to serve instead.
+    Like NetSuite, deep offsets can be made slower (`offset_latency` seconds per 1000 rows skipped)
+    and rejected past `max_offset`.
+    """
+
+    def __init__(
+        self,
+        mock: "MockNetSuite",
+        total: int = 0,
+        row: Callable[[int], dict] = default_row,
+        max_page: int = 1000,
+        source: Optional[Callable[[str], list]] = None,
+        offset_latency: float = 0.0,
+        max_offset: Optional[int] = None,
+    ) -> None:
+        self.mock = mock
+        self.total = total
+        self.row = row
+        self.max_page = max_page
+        self.source = source
+        self.offset_latency = offset_latency
+        self.max_offset = max_offset
+        self.queries = []
+        self.offsets = []
+
+    def __call__(self, method: str, path: str, query: dict, headers: dict, body: bytes) -> tuple:
+        limit = min(int(query.get("limit", ["1000"])[0]), self.max_page)
+        offset = int(query.get("offset", ["0"])[0])
+        q = json.loads(body)["q"] if body else None
+        self.queries.append(q)
+        self.offsets.append(offset)
+        if self.max_offset is not None and offset >= self.max_offset:
+            return 400, {"Content-Type": "application/json"}, {
+                "o:errorDetails": [{"detail": "Offset exceeds the maximum", "o:errorCode": "INVALID_PARAMETER"}]
+            }
+        if self.offset_latency:
+            time.sleep(offset / 1000 * self.offset_latency)
+        if self.source is not None:
+            rows = self.source(q)
+            total = len(rows)
+            items = [dict(row, links=[]) for row in rows[offset:offset + limit]]
+        else:
+            total = self.total
+            items = [dict(self.row(i), links=[]) for i in range(offset, min(offset + limit, total))]
+        has_more = offset + len(items) < total
+        base = f"{self.mock.url}{path}"
+        links = [{"rel": "self", "href": f"{base}?limit={limit}&offset={offset}"}]
+        if has_more:
+            links.append({"rel": "next", "href": f"{base}?limit={limit}&offset={offset + limit}"})
+        return 200, {"Content-Type": "application/json"}, {
+            "links": links,
+            "count": len(items),
+            "hasMore": has_more,
+            "items": items,
+            "offset": offset,
+            "totalResults": total,
+        }
+
+
+class KeyedTable:
+    """
+    A `source` for SuiteQLRoute serving `total` rows with ids 1..total that understands the probe and
+    keyset partition queries of ODBC.extract on the `id` column. Other queries get every row.
+    """
+
+    def __init__(self, total: int, row: Callable[[int], dict] = default_row) -> None:
+        self.total = total
+        self.row = row
+
+    def __call__(self, query: str):
+        if "MIN(" in query:
+            return [{"lo": "1", "hi": str(self.total), "total": self.total, "counted": self.total}]
+        start, end = 1, self.total + 1
+        bounds = re.search(r"base\.id >= (\d+) AND base\.id < (\d+)", query or "")
+        if bounds:
+            start, end = int(bounds.group(1)), min(int(bounds.group(2)), end)
+        after = re.search(r"base\.id > (\d+)", query or "")
+        if after:
+            start = max(start, int(after.group(1)) + 1)
+        return _Rows(self.row, start - 1, max(start - 1, end - 1))
+
+
+class _Rows:
+    """
+    The rows of indexes [start, end) of a generated table, built only when sliced.
+    """
+
+    def __init__(self, row: Callable[[int], dict], start: int, end: int) -> None:
+        self.row, self.start, self.end = row, start, end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, index: slice) -> list:
+        return [self.row(self.start + i) for i in range(len(self))[index]]
+
+
+class MockNetSuite:
+    """
+    A threaded local NetSuite stand-in. `latency` delays every response and `max_concurrent` answers 429
+    SSS_REQUEST_LIMIT_EXCEEDED to requests beyond that many in flight. A fraction `error_rate` of the other
+    requests fail with `error_status`, drawn from a generator seeded with `seed`. With `http2=True` the server
+    speaks HTTP/2 over TLS instead of HTTP/1.1.
+    ```
+    with MockNetSuite(tls=True, latency=0.05) as server:
+        nt.get(url=server.url + "/restlet")
+        print(server.connections, server.requests)
+    ```
+    """
+
+    def __init__(
+        self,
+        tls: bool = False,
+        latency: float = 0.0,
+        max_concurrent: Optional[int] = None,
+        http2: bool = False,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.tls = tls or http2
+        self.http2 = http2
+        self.latency = latency
+        self.max_concurrent = max_concurrent
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.in_flight = 0
+        self.throttled = 0
+        self.errors = 0
+        self.routes: dict[str, Callable] = {}
+        self._tmpdir = None
+        self._server = None
+        self._thread = None
+
+    def route(self, path: str) -> Callable:
+        """
+        Returns the route registered for `path`, or for the longest registered prefix ending with "/", or the echo route.
+        """
+        if path in self.routes:
+            return self.routes[path]
+        prefixes = [p for p in self.routes if p.endswith("/") and path.startswith(p)]
+        return self.routes[max(prefixes, key=len)] if prefixes else echo
+
+    def suiteql(self, total: int = 0, **kwargs) -> SuiteQLRoute:
+        """
+        Serves `total` generated rows (or the rows of `source`) from the suiteql path and returns the route.
+        """
+        self.routes[SUITEQL_PATH] = SuiteQLRoute(self, total, **kwargs)
+        return self.routes[SUITEQL_PATH]
+
+    @property
+    def suiteql_endpoint(self) -> str:
+        return self.url + SUITEQL_PATH
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{'https' if self.tls else 'http'}://127.0.0.1:{port}"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    def start(self) -> "MockNetSuite":
+        ssl_context = None
+        if self.tls:
+            self._tmpdir = tempfile.TemporaryDirectory()
+            certfile, keyfile = make_self_signed_cert(self._tmpdir.name)
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(certfile, keyfile)
+        if self.http2:
+            self._server = _HTTP2Server(self, ssl_context)
+        else:
+            self._server = _Server(("127.0.0.1", 0), _Handler, ssl_context=ssl_context)
+            self._server.mock = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+
+    def __enter__(self) -> "MockNetSuite":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from NetSuite_Connector.AsyncNetSuite import AsyncNetSuite
+from NetSuite_Connector.AsyncODBC import AsyncODBC
+
+
+class TestAsyncNetSuite:
+    # A signed GET returns a NetsuiteObject with the response.
+    def test_get(self, mock_server, make_client):
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+        headers = {"Content-Type": "application/json"}
+
+        async def run():
+            async with make_client(AsyncNetSuite) as ns:
+                return await ns.get(url=url, headers=headers, params={"script": "1", "deploy": "1"})
+
+        result = asyncio.run(run())
+
+        echoed = json.loads(result.response)
+        assert result.code == 200
+        assert result.url == url
+        assert result.request_headers == headers
+        assert echoed["query"] == {"script": "1", "deploy": "1"}
+        assert echoed["authorization"].startswith('OAuth realm="123456", oauth_consumer_key=""')
+        assert 'oauth_signature_method="HMAC-SHA256"' in echoed["authorization"]
+
+    # PUT, POST and DELETE send the JSON body.
+    @pytest.mark.parametrize("method", ["put", "post", "delete"])
+    def test_methods_with_body(self, mock_server, method, make_client):
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+
+        async def run():
+            async with make_client(AsyncNetSuite) as ns:
+                return await getattr(ns, method)(url=url, body={"foo": "bar"})
+
+        result = asyncio.run(run())
+
+        echoed = json.loads(result.response)
+        assert echoed["method"] == method.upper()
+        assert json.loads(echoed["body"]) == {"foo": "bar"}
+
+    # Hundreds of concurrent calls share a bounded pool of connections.
+    def test_concurrent_calls_share_pool(self, mock_server, make_client):
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+        mock_server.latency = 0.01
+
+        async def run():
+            async with make_client(AsyncNetSuite, pool_maxsize=8) as ns:
+                return await asyncio.gather(*(ns.get(url=url) for _ in range(200)))
+
+        results = asyncio.run(run())
+
+        assert all(r.code == 200 for r in results)
+        assert mock_server.requests == 200
+        assert mock_server.connections <= 8
+
+    # Transport errors are reported as a 500 NetsuiteObject, like NetSuite.
+    def test_failed_request(self, make_client):
+        async def run():
+            async with make_client(AsyncNetSuite) as ns:
+                return await ns.get(url="http://127.0.0.1:1/restlet")
+
+        result = asyncio.run(run())
+
+        assert result.code == 500
+        assert "Traceback" in result.response
+
+
+class TestAsyncODBC:
+    # query posts the SuiteQL statement to the suiteql endpoint.
+    def test_query(self, mock_server, make_client):
+        mock_server.suiteql(total=3)
+
+        async def run():
+            async with make_client(AsyncODBC) as odbc:
+                odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+                return await odbc.query("SELECT id FROM transaction")
+
+        result = asyncio.run(run())
+
+        assert result.code == 200
+        assert result.request_data == "SELECT id FROM transaction"
+        assert json.loads(result.response)["count"] == 3
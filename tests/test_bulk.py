@@ -0,0 +1,122 @@
+import json
+import threading
+
+RECORD_PATH = "/services/rest/record/v1/customer/"
+JOB_PATH = "/services/rest/async/v1/job/"
+
+
+class TestBulk:
+    # Every record is sent to its URL and the progress callback reports the throughput.
+    def test_bulk_put(self, mock_server, make_client):
+        reports = []
+        records = [{"id": i, "comments": "migrated"} for i in range(250)]
+
+        with make_client(concurrency_limit=8) as ns:
+            result = ns.bulk(
+                "PUT",
+                mock_server.url + RECORD_PATH + "{id}",
+                records,
+                progress=lambda p: reports.append((p.done, p.failed)),
+            )
+
+        assert result.total == 250
+        assert not result.failed
+        assert [index for index, _, _ in result.succeeded] == list(range(250))
+        echoed = json.loads(result.succeeded[7][2].response)
+        assert echoed["path"] == RECORD_PATH + "7"
+        assert json.loads(echoed["body"]) == records[7]
+        assert reports == [(100, 0), (200, 0), (250, 0)]
+        assert result.rate > 0
+
+    # Failed records are collected without aborting the batch.
+    def test_bulk_collects_failures(self, mock_server, make_client):
+        def customer(method, path, query, headers, body):
+            record_id = int(path.rsplit("/", 1)[1])
+            if record_id % 3 == 0:
+                return 400, {}, {"o:errorDetails": [{"detail": "Invalid field value"}]}
+            return 204, {}, b""
+
+        mock_server.routes[RECORD_PATH] = customer
+
+        with make_client() as ns:
+            result = ns.bulk("PATCH", mock_server.url + RECORD_PATH + "{id}", ({"id": i} for i in range(30)), workers=4)
+
+        assert len(result.failed) == 10
+        assert len(result.succeeded) == 20
+        assert all(record["id"] % 3 == 0 and response.code == 400 for _, record, response in result.failed)
+
+    # Records are streamed: only a bounded number are read ahead of the completed ones.
+    def test_bulk_streams_records(self, mock_server, make_client):
+        consumed = [0]
+
+        def records():
+            for i in range(200):
+                consumed[0] += 1
+                yield {"id": i}
+
+        ahead = []
+        with make_client() as ns:
+            ns.bulk(
+                "PUT",
+                mock_server.url + RECORD_PATH + "{id}",
+                records(),
+                workers=4,
+                progress=lambda p: ahead.append(consumed[0] - p.done),
+                progress_every=10,
+            )
+
+        assert max(ahead) <= 8
+
+    # With respond_async, accepted jobs are polled until they complete and their task result is returned.
+    def test_bulk_async_jobs(self, mock_server, make_client):
+        polls, lock = {}, threading.Lock()
+
+        def customer(method, path, query, headers, body):
+            assert headers["Prefer"] == "respond-async"
+            job_id = json.loads(body)["id"]
+            return 202, {"Location": f"{mock_server.url}{JOB_PATH}{job_id}"}, b""
+
+        def job(method, path, query, headers, body):
+            parts = path[len(JOB_PATH):].split("/")
+            job_id = parts[0]
+            if len(parts) == 1:
+                with lock:
+                    polls[job_id] = polls.get(job_id, 0) + 1
+                return 200, {}, {"id": job_id, "completed": polls[job_id] >= 2}
+            if parts[1:] == ["task"]:
+                return 200, {}, {"items": [{"links": [{"rel": "self", "href": f"{mock_server.url}{JOB_PATH}{job_id}/task/{job_id}"}]}]}
+            return 200, {}, {"jobId": job_id, "status": "created"}
+
+        mock_server.routes[RECORD_PATH] = customer
+        mock_server.routes[JOB_PATH] = job
+
+        with make_client() as ns:
+            result = ns.bulk(
+                "POST",
+                mock_server.url + RECORD_PATH,
+                [{"id": str(i)} for i in range(12)],
+                respond_async=True,
+                poll_interval=0.01,
+                idempotency_key=lambda record: f"customer-{record['id']}",
+            )
+
+        assert len(result.succeeded) == 12
+        assert all(polls[str(i)] == 2 for i in range(12))
+        assert json.loads(result.succeeded[0][2].response) == {"jobId": "0", "status": "created"}
+
+    # A record that cannot be sent, or whose job answers with a body that is not JSON, fails alone.
+    def test_bulk_record_errors(self, mock_server, make_client):
+        def customer(method, path, query, headers, body):
+            return 202, {"Location": f"{mock_server.url}{JOB_PATH}{json.loads(body)['id']}"}, b""
+
+        mock_server.routes[RECORD_PATH] = customer
+        mock_server.routes[JOB_PATH] = lambda method, path, query, headers, body: (200, {}, b"<html>maintenance</html>")
+
+        with make_client() as ns:
+            result = ns.bulk("PUT", mock_server.url + RECORD_PATH + "{id}", [{"id": 1}, {"name": "x"}, {"id": 3}])
+            jobs = ns.bulk("POST", mock_server.url + RECORD_PATH, [{"id": 1}], respond_async=True, poll_interval=0.01)
+
+        assert [index for index, _, _ in result.succeeded] == [0, 2]
+        assert [(index, response.code) for index, _, response in result.failed] == [(1, 500)]
+        assert "KeyError" in result.failed[0][2].response
+        assert [response.code for _, _, response in jobs.failed] == [500]
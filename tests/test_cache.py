@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from NetSuite_Connector.Cache import MemoryCache, SQLiteCache, query_key, request_key
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+
+URL = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+KEYS = dict(consumer_keys={"consumer_key": "", "consumer_secret": ""}, token_keys={"token_key": "", "token_secret": ""})
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCache(ttl=60)
+    else:
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite"), ttl=60)
+        yield cache
+        cache.close()
+
+
+class TestCache:
+    # Keys ignore the order of the query parameters and the SuiteQL whitespace.
+    def test_keys_are_normalized(self):
+        assert request_key(1, "get", "https://A.com/x?b=2&a=1") == request_key(1, "GET", "https://a.com/x", {"a": 1, "b": 2})
+        assert request_key(1, "GET", "https://a.com/x") != request_key(2, "GET", "https://a.com/x")
+        assert query_key(1, "SELECT id\n  FROM item") == query_key(1, "SELECT id FROM item")
+
+    # Entries expire after their TTL and count hits and misses.
+    def test_ttl_and_counters(self, cache):
+        cache.set("a", 200, "{}", ttl=0.05)
+        cache.set("b", 200, "[]")
+
+        assert cache.get("a") == (200, "{}")
+        time.sleep(0.06)
+        assert cache.get("a") is None
+        assert cache.get("b") == (200, "[]")
+        assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "entries": 1}
+
+    # invalidate and clear drop entries.
+    def test_invalidate_and_clear(self, cache):
+        cache.set("a", 200, "{}")
+        cache.set("b", 200, "{}")
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    # The least recently used entries are evicted past the entry or byte bound.
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 200, "1")
+        cache.set("b", 200, "2")
+        cache.get("a")
+        cache.set("c", 200, "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.evictions == 1
+
+        cache = MemoryCache(max_entries=None, max_bytes=1000)
+        for i in range(10):
+            cache.set(str(i), 200, "x" * 300)
+        assert cache.size <= 1000
+        assert len(cache) == 2
+
+    # The sqlite cache survives a restart.
+    def test_sqlite_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        SQLiteCache(path).set("a", 200, "{}")
+
+        assert SQLiteCache(path).get("a") == (200, "{}")
+
+    # NetSuite.get serves repeated requests from the cache until they are invalidated.
+    def test_get_uses_cache(self, requests_mock, cache):
+        requests_mock.get(URL, json={"foo": "bar"}, status_code=200)
+        ns = NetSuite(account_id=123456, cache=cache, **KEYS)
+
+        first = ns.get(url=URL, headers={"Content-Type": "application/json"})
+        second = ns.get(url=URL, headers={"Content-Type": "application/json"})
+        ns.invalidate(URL)
+        ns.get(url=URL)
+
+        assert requests_mock.call_count == 2
+        assert (second.url, second.request_headers, second.response, second.code) == (
+            first.url, first.request_headers, first.response, first.code,
+        )
+
+    # Failed responses are not cached.
+    def test_errors_are_not_cached(self, requests_mock, cache):
+        requests_mock.get(URL, status_code=503)
+        ns = NetSuite(account_id=123456, cache=cache, **KEYS)
+
+        ns.get(url=URL)
+        ns.get(url=URL)
+
+        assert requests_mock.call_count == 2
+
+    # ODBC.query caches by SQL text.
+    def test_query_uses_cache(self, requests_mock, cache):
+        odbc = ODBC("123456", cache=cache, **KEYS)
+        requests_mock.post(odbc.suiteql_endpoint, json={"items": [{"id": "1"}]}, status_code=200)
+
+        odbc.query("SELECT id FROM subsidiary")
+        result = odbc.query("SELECT id\n FROM subsidiary")
+        odbc.invalidate_query("SELECT id FROM subsidiary")
+        odbc.query("SELECT id FROM subsidiary")
+
+        assert requests_mock.call_count == 2
+        assert result.request_data == "SELECT id\n FROM subsidiary"
+        assert result.code == 200
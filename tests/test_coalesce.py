@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+from NetSuite_Connector.Coalesce import SingleFlight
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+
+KEYS = ({"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+
+
+def hammer(threads: int, fn) -> list:
+    """
+    Runs `fn(index)` on `threads` threads released at the same time and returns the results.
+    """
+    barrier, results, lock = threading.Barrier(threads), [], threading.Lock()
+
+    def run(index):
+        barrier.wait()
+        result = fn(index)
+        with lock:
+            results.append(result)
+
+    workers = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+class TestSingleFlight:
+    # Concurrent callers of a key share one call, a later caller runs a new one.
+    def test_shares_in_flight_call(self):
+        flights, started, release, calls = SingleFlight(), threading.Event(), threading.Event(), []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        first = threading.Thread(target=flights.do, args=("key", slow))
+        first.start()
+        started.wait()
+        followers = [threading.Thread(target=flights.do, args=("key", slow)) for _ in range(4)]
+        for follower in followers:
+            follower.start()
+        while flights.shared < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [first, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert flights.do("key", lambda: "again") == ("again", True)
+        assert flights.stats() == {"calls": 2, "shared": 4, "in_flight": 0}
+
+    # Waiters get the exception of the call they joined.
+    def test_shares_exception(self):
+        flights, started, release = SingleFlight(), threading.Event(), threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            release.wait()
+            raise RuntimeError("boom")
+
+        def call():
+            try:
+                flights.do("key", failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        while flights.shared < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+        assert len(flights) == 0
+
+
+class TestCoalescing:
+    # Identical GETs from many threads reach the server once and every caller gets its own result.
+    def test_concurrent_gets(self, mock_server):
+        mock_server.latency = 0.3
+        ns = NetSuite("123456", *KEYS)
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+
+        results = hammer(32, lambda _: ns.get(url=url, params={"script": "1", "deploy": "1"}))
+
+        assert mock_server.requests == 1
+        assert all(result.code == 200 for result in results)
+        assert len({id(result) for result in results}) == 32
+        assert len({id(result.data) for result in results}) == 32
+        assert ns.flights.stats() == {"calls": 1, "shared": 31, "in_flight": 0}
+
+    # Identical SuiteQL queries, which are idempotent POSTs, are coalesced too; other queries are not.
+    def test_concurrent_queries(self, mock_server):
+        mock_server.latency = 0.3
+        route = mock_server.suiteql(total=10)
+        odbc = ODBC("123456", *KEYS)
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+        queries = ["SELECT id FROM customer", "SELECT id FROM vendor"]
+
+        results = hammer(24, lambda index: odbc.query(queries[index % 2]))
+
+        assert sorted(route.queries) == queries
+        assert all(len(result.data["items"]) == 10 for result in results)
+
+    # Writes and clients created with coalesce=False send every request.
+    @pytest.mark.parametrize("coalesce, method", [(True, "post"), (False, "get")])
+    def test_not_coalesced(self, mock_server, coalesce, method):
+        mock_server.latency = 0.2
+        ns = NetSuite("123456", *KEYS, coalesce=coalesce)
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+
+        hammer(8, lambda _: getattr(ns, method)(url=url, body={"name": "same"}))
+
+        assert mock_server.requests == 8
+        assert ns.flights.calls == 0
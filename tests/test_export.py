@@ -0,0 +1,130 @@
+import csv
+import gzip
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from NetSuite_Connector.Export import export_format
+from NetSuite_Connector.NetSuite import NetSuiteError
+
+QUERY = "SELECT id, tranid, amount FROM transaction ORDER BY id"
+
+
+def fail_once_at(odbc, offset):
+    query_page = odbc._query_page
+    failed = []
+
+    def flaky(query, url, params=None):
+        query_params = params or {k: int(v[0]) for k, v in parse_qs(urlsplit(url).query).items()}
+        if query_params.get("offset") == offset and not failed:
+            failed.append(offset)
+            raise NetSuiteError(odbc._query(query))
+        return query_page(query, url, params)
+
+    odbc._query_page = flaky
+
+
+class TestExport:
+    # The format and the compression are inferred from the extensions.
+    def test_export_format(self):
+        assert export_format("out.csv") == ("csv", None)
+        assert export_format("out.jsonl.gz") == ("jsonl", "gzip")
+        assert export_format("out.parquet", compression="zstd") == ("parquet", "zstd")
+        with pytest.raises(ValueError):
+            export_format("out.txt")
+
+    # A CSV export writes a header and every row, one page at a time.
+    def test_csv(self, mock_server, tmp_path, odbc):
+        route = mock_server.suiteql(total=1234)
+        path = tmp_path / "transactions.csv"
+
+        result = odbc.export(QUERY, str(path), page_size=500)
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert result.rows == 1234 and result.pages == 3
+        assert rows[0] == {"id": "1", "tranid": "INV000001", "amount": "0.50"}
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 1235)]
+        assert route.offsets == [0, 500, 1000]
+        assert not (tmp_path / "transactions.csv.progress").exists()
+
+    # A gzipped JSON Lines export is readable as a single stream.
+    def test_jsonl_gzip(self, mock_server, tmp_path, odbc):
+        mock_server.suiteql(total=250)
+        path = tmp_path / "transactions.jsonl.gz"
+
+        odbc.export(QUERY, str(path), page_size=100, workers=3)
+
+        with gzip.open(path, "rt") as f:
+            rows = [json.loads(line) for line in f]
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 251)]
+
+    # An interrupted export resumes after its last completed page.
+    @pytest.mark.parametrize("name", ["transactions.csv.gz", "transactions.jsonl", "transactions.parquet"])
+    def test_resume(self, mock_server, tmp_path, name, odbc):
+        if name.endswith(".parquet"):
+            pytest.importorskip("pyarrow")
+        route = mock_server.suiteql(total=1000)
+        path = tmp_path / name
+        fail_once_at(odbc, 600)
+
+        with pytest.raises(NetSuiteError):
+            odbc.export(QUERY, str(path), page_size=200)
+        route.offsets.clear()
+        result = odbc.export(QUERY, str(path), page_size=200, resume=True)
+
+        assert result.resumed_at == 600 and result.rows == 1000
+        assert route.offsets == [600, 800]
+        if name.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            ids = pq.read_table(path).column("id").to_pylist()
+        elif name.endswith(".gz"):
+            with gzip.open(path, "rt", newline="") as f:
+                ids = [row["id"] for row in csv.DictReader(f)]
+        else:
+            with open(path) as f:
+                ids = [json.loads(line)["id"] for line in f]
+        assert ids == [str(i) for i in range(1, 1001)]
+
+    # Resuming another query to the same path is refused.
+    def test_resume_other_query(self, mock_server, tmp_path, odbc):
+        mock_server.suiteql(total=400)
+        path = tmp_path / "transactions.csv"
+        fail_once_at(odbc, 200)
+        with pytest.raises(NetSuiteError):
+            odbc.export(QUERY, str(path), page_size=200)
+
+        with pytest.raises(ValueError):
+            odbc.export("SELECT id FROM customer", str(path), page_size=200, resume=True)
+
+    # A CSV column that only appears after the first page needs an explicit header.
+    def test_csv_late_column(self, mock_server, tmp_path, odbc):
+        mock_server.suiteql(total=300, row=lambda i: {"id": str(i), **({"memo": "late"} if i >= 100 else {})})
+
+        with pytest.raises(ValueError):
+            odbc.export(QUERY, str(tmp_path / "a.csv"), page_size=100)
+        odbc.export(QUERY, str(tmp_path / "b.csv"), page_size=100, columns=["id", "memo"])
+
+        with open(tmp_path / "b.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0] == {"id": "0", "memo": ""} and rows[-1] == {"id": "299", "memo": "late"}
+
+    # Parquet gets a row group per page and one schema across pages.
+    def test_parquet(self, mock_server, tmp_path, odbc):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        mock_server.suiteql(total=250, row=lambda i: {"id": str(i), **({"memo": "late"} if i >= 100 else {})})
+        path = tmp_path / "transactions.parquet"
+
+        odbc.export(QUERY, str(path), page_size=100, dtypes={"id": pa.int64()}, compression="zstd")
+
+        parquet = pq.ParquetFile(path)
+        table = parquet.read()
+        assert parquet.num_row_groups == 3
+        assert table.schema.field("id").type == pa.int64()
+        assert table.column("id").to_pylist() == list(range(250))
+        assert table.column("memo").null_count == 100
+        assert not (tmp_path / "transactions.parquet.parts").exists()
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from NetSuite_Connector.Governor import Governor, is_throttled
+from NetSuite_Connector.NetSuite import NetSuite
+
+
+class TestGovernor:
+    # Throttled responses are detected from the status code or the NetSuite error code.
+    def test_is_throttled(self):
+        assert is_throttled(429, "")
+        assert is_throttled(400, '{"error": {"code": "SSS_REQUEST_LIMIT_EXCEEDED"}}')
+        assert not is_throttled(200, "SSS_REQUEST_LIMIT_EXCEEDED")
+        assert not is_throttled(500, "Traceback")
+
+    # A throttled response halves the window once per round, successes on a full window grow it back additively.
+    def test_aimd_window(self):
+        governor = Governor(limit=8)
+
+        tokens = [governor.acquire() for _ in range(4)]
+        for token in tokens:
+            governor.release(token, throttled=True)
+        assert governor.window == 4
+        assert governor.throttled == 4
+
+        for _ in range(4):
+            governor.release(governor.acquire())
+        assert governor.window == 4
+
+        for _ in range(4):
+            tokens = [governor.acquire() for _ in range(int(governor.window))]
+            governor.release(tokens.pop())
+            for token in tokens:
+                governor.release(token)
+        assert governor.window == pytest.approx(5, abs=0.1)
+
+    # acquire blocks once the window is full.
+    def test_acquire_blocks_at_window(self):
+        governor = Governor(limit=2)
+        governor.acquire()
+        token = governor.acquire()
+
+        with pytest.raises(TimeoutError):
+            governor.acquire(timeout=0.05)
+
+        governor.release(token)
+        governor.acquire(timeout=0.05)
+
+    # Clients of the same account share a single governor.
+    def test_for_account_is_shared(self):
+        assert Governor.for_account("TSTDRV1", limit=5) is Governor.for_account("TSTDRV1")
+        assert Governor.for_account("TSTDRV1") is not Governor.for_account("TSTDRV2")
+
+    # Against a throttling server, the governor converges near the limit and avoids most 429s.
+    def test_adapts_to_throttling_server(self, mock_server):
+        mock_server.max_concurrent = 3
+        mock_server.latency = 0.01
+        url = mock_server.url + "/app/site/hosting/restlet.nl"
+        governor = Governor(limit=12)
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+            governor=governor,
+        )
+
+        # Distinct URLs, so that no request is coalesced with another.
+        def call(index):
+            return ns.get(url=url, params={"n": index}).code
+
+        with ns, ThreadPoolExecutor(max_workers=12) as pool:
+            codes = list(pool.map(call, range(300)))
+
+        assert codes.count(200) + codes.count(429) == 300
+        assert codes.count(429) < 75
+        assert governor.window < governor.limit
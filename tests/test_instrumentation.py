@@ -0,0 +1,122 @@
+import logging
+
+import requests
+import requests_mock as mocker
+
+from NetSuite_Connector.Instrumentation import Histogram, MetricsRecorder, RequestHook, endpoint
+from NetSuite_Connector.Retry import RetryPolicy
+
+URL = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=12&deploy=1&id=9"
+
+
+class Collector(RequestHook):
+    def __init__(self):
+        self.before = []
+        self.after = []
+
+    def before_request(self, metrics):
+        self.before.append(metrics.url)
+
+    def after_request(self, metrics):
+        self.after.append(metrics)
+
+
+class TestHistogram:
+    # Percentiles are exact to within the precision of the buckets.
+    def test_percentiles(self):
+        histogram = Histogram(precision=0.01)
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert abs(histogram.percentile(50) - 0.5) <= 0.5 * 0.01
+        assert abs(histogram.percentile(99) - 0.99) <= 0.99 * 0.01
+        assert histogram.percentile(100) == 1.0
+
+    # An empty histogram reports zeros.
+    def test_empty(self):
+        assert Histogram().percentile(99) == 0.0
+
+
+class TestEndpoint:
+    # Record ids are grouped and only the RESTlet script and deploy are kept.
+    def test_grouping(self):
+        assert endpoint("get", "https://a.suitetalk.api.netsuite.com/services/rest/record/v1/customer/42") == (
+            "GET a.suitetalk.api.netsuite.com/services/rest/record/v1/customer/{id}"
+        )
+        assert endpoint("POST", URL) == "POST xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=12&deploy=1"
+
+
+class TestHooks:
+    # Hooks see every request once, with its status, bytes and timings.
+    def test_hooks_receive_metrics(self, mock_server, make_client):
+        collector = Collector()
+        with make_client(hooks=[collector]) as ns:
+            ns.post(url=f"{mock_server.url}/restlet", body={"foo": "bar"})
+            ns.get(url=f"{mock_server.url}/restlet")
+
+        first, second = collector.after
+        assert collector.before == [f"{mock_server.url}/restlet"] * 2
+        assert first.status == 200 and first.method == "POST"
+        assert first.request_bytes == len('{"foo": "bar"}')
+        assert first.response_bytes > 0
+        assert first.connect > 0
+        assert second.connect == 0 and second.dns == 0
+        assert first.total >= first.server + first.download
+
+    # The TLS handshake of a new connection is timed apart from the TCP connect.
+    def test_tls_phase(self, tls_mock_server, make_client):
+        collector = Collector()
+        with make_client(hooks=[collector]) as ns:
+            ns.session.verify = False
+            ns.session.trust_env = False
+            ns.get(url=f"{tls_mock_server.url}/restlet")
+            ns.get(url=f"{tls_mock_server.url}/restlet")
+
+        first, second = collector.after
+        assert first.status == 200
+        assert first.tls > 0
+        assert second.tls == 0
+
+    # Retries and the final error are reported once, after the last attempt.
+    def test_retries_reported(self, requests_mock, make_client):
+        requests_mock.get(URL, [{"exc": requests.exceptions.ConnectionError}, {"status_code": 503}, {"text": "ok"}])
+        collector = Collector()
+        ns = make_client(hooks=[collector], retry=RetryPolicy(sleep=lambda delay: None))
+
+        ns.get(url=URL)
+
+        (metrics,) = collector.after
+        assert metrics.retries == 2
+        assert metrics.status == 200
+        assert metrics.error is None
+
+    # A failing hook is logged and does not fail the request.
+    def test_failing_hook(self, requests_mock, caplog, make_client):
+        class Broken(RequestHook):
+            def after_request(self, metrics):
+                raise RuntimeError("boom")
+
+        requests_mock.get(URL, text="ok")
+        result = make_client(hooks=[Broken()]).get(url=URL)
+
+        assert result.code == 200
+        assert "Request hook" in caplog.text
+
+    # The recorder aggregates per endpoint and prints its percentiles.
+    def test_metrics_recorder(self, requests_mock, make_client):
+        requests_mock.get(mocker.ANY, text="ok")
+        recorder = MetricsRecorder()
+        ns = make_client(hooks=[recorder])
+        for id in range(20):
+            ns.get(url=f"https://a.suitetalk.api.netsuite.com/services/rest/record/v1/customer/{id}")
+
+        (name,) = recorder.snapshot()
+        stats = recorder.snapshot()[name]
+        assert stats["requests"] == 20 and stats["errors"] == 0
+        assert 0 < stats["total"]["p50"] <= stats["total"]["p99"]
+        assert "customer/{id}" in recorder.report()
+
+    # The library leaves the log level to the application.
+    def test_logger_level_not_forced(self):
+        assert logging.getLogger("NetSuite_Connector.NetSuite").level == logging.NOTSET
@@ -1,10 +1,11 @@
 # Generated by CodiumAI
+import concurrent.futures
 import json
 
 import pytest
 import requests
 
-from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.NetSuite import NetSuite, NetsuiteObject
 
 """
 Code Analysis
@@ -27,7 +28,7 @@ Fields:
 - consumer_secret: The consumer secret used for authentication.
 - token_key: The token ID used for authentication.
 - token_secret: The token secret used for authentication.
-- _request_session: The OAuth1Session object used for making requests to the NetSuite REST API.
+- _request_session: The requests.Session, signed by OAuth1Auth, used for making requests to the NetSuite REST API.
 """
 
 
@@ -298,3 +299,164 @@ class TestNetSuite:
         assert result.request_headers == headers
         assert result.response == json.dumps(response_data)
         assert result.code == 429
+
+
+class TestNetSuiteSession:
+    # Tests that the same requests.Session is reused across requests.
+    def test_session_is_reused(self, requests_mock):
+        # Arrange
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+        requests_mock.get(url, json={"foo": "bar"}, status_code=200)
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+        )
+
+        # Act
+        ns.get(url=url)
+        session = ns.session
+        ns.get(url=url)
+
+        # Assert
+        assert ns.session is session
+
+    # Tests that the connection pool is sized from the constructor arguments.
+    def test_pool_size_is_configurable(self):
+        # Arrange
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+            pool_connections=3,
+            pool_maxsize=7,
+        )
+
+        # Act
+        adapter = ns.session.get_adapter("https://xxxx.restlets.api.netsuite.com")
+
+        # Assert
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+
+    # Tests that close and the context manager release the session.
+    def test_close_and_context_manager(self):
+        # Arrange
+        with NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+        ) as ns:
+            session = ns.session
+
+        # Assert
+        assert ns._request_session is None
+        assert ns.session is not session
+
+    # Tests that the TLS handshake count stays flat as request volume grows.
+    def test_handshakes_stay_flat_under_load(self, tls_mock_server):
+        # Arrange
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+            pool_maxsize=4,
+        )
+        ns.session.verify = False
+        ns.session.trust_env = False
+        url = tls_mock_server.url + "/app/site/hosting/restlet.nl"
+
+        # Act
+        with ns, concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            # Distinct URLs, so that no request is coalesced with another.
+            list(pool.map(lambda i: ns.get(url=url, params={"n": i}), range(50)))
+            handshakes_after_50 = tls_mock_server.connections
+            results = list(pool.map(lambda i: ns.get(url=url, params={"n": i}), range(50, 300)))
+
+        # Assert
+        assert all(r.code == 200 for r in results)
+        assert tls_mock_server.requests == 300
+        assert handshakes_after_50 <= 4
+        assert tls_mock_server.connections == handshakes_after_50
+
+
+class TestNetsuiteObject:
+    # Tests that results are slotted and keep the raw body as bytes.
+    def test_slotted_raw_body(self, requests_mock):
+        # Arrange
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+        requests_mock.get(url, json={"name": "Café"}, status_code=200)
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+        )
+
+        # Act
+        result = ns.get(url=url)
+
+        # Assert
+        assert not hasattr(result, "__dict__")
+        assert isinstance(result.content, bytes)
+        assert result.response == '{"name": "Caf\\u00e9"}'
+        assert result.json["response"] == result.response
+        assert json.loads(json.dumps(result.json))["response"] == result.response
+
+    # Tests that .data is decoded once, with the decoder of the client.
+    def test_data_is_decoded_lazily_once(self, requests_mock):
+        # Arrange
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+        requests_mock.get(url, json={"foo": "bar"}, status_code=200)
+        calls = []
+
+        def decoder(content):
+            calls.append(content)
+            return json.loads(content)
+
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+            json_decoder=decoder,
+        )
+
+        # Act
+        result = ns.get(url=url)
+        decoded_before_access = len(calls)
+        first, second = result.data, result.data
+
+        # Assert
+        assert decoded_before_access == 0
+        assert first == {"foo": "bar"} and first is second
+        assert len(calls) == 1
+
+    # Tests that replacing the body drops the decoded value.
+    def test_setting_response_resets_data(self):
+        result = NetsuiteObject(response=b'{"a": 1}', code=200)
+        assert result.data == {"a": 1}
+
+        result.response = '{"a": 2}'
+
+        assert result.data == {"a": 2}
+        assert result == NetsuiteObject(response='{"a": 2}', code=200)
+
+    # Tests that keep_request=False leaves the request echo out of the results.
+    def test_keep_request_false(self, requests_mock):
+        # Arrange
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+        requests_mock.post(url, json={"id": "1"}, status_code=200, headers={"Location": url + "&id=1", "X-Request-Id": "abc"})
+        ns = NetSuite(
+            account_id=123456,
+            consumer_keys={"consumer_key": "", "consumer_secret": ""},
+            token_keys={"token_key": "", "token_secret": ""},
+            keep_request=False,
+        )
+
+        # Act
+        result = ns.post(url=url, headers={"Content-Type": "application/json"}, body={"foo": "bar"})
+
+        # Assert
+        assert result.url == url
+        assert result.request_headers is None and result.request_data is None
+        assert result.response_headers == {"Location": url + "&id=1"}
+        assert result.data == {"id": "1"}
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from oauthlib.oauth1 import Client
+
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.OAuth import SigningContext, new_nonce, sign_request
+
+
+class TestSignRequest:
+    # The signature matches oauthlib for the same nonce and timestamp.
+    def test_matches_oauthlib(self):
+        url = "https://1234-sb1.suitetalk.api.netsuite.com:443/services/rest/query/v1/suiteql?limit=10&offset=20&q=a%20b%2Bc&e="
+        client = Client(
+            "ck",
+            client_secret="cs",
+            resource_owner_key="tk",
+            resource_owner_secret="ts",
+            signature_method="HMAC-SHA256",
+            realm="1234_SB1",
+            nonce="abc",
+            timestamp="1700000000",
+        )
+        _, headers, _ = client.sign(url, "GET")
+
+        header = sign_request("GET", url, "ck", "cs", "tk", "ts", realm="1234_SB1", nonce="abc", timestamp="1700000000")
+
+        def fields(value):
+            return dict(part.strip().split("=", 1) for part in value[len("OAuth "):].split(","))
+
+        assert fields(header) == fields(headers["Authorization"])
+
+    # Every request gets a fresh nonce.
+    def test_nonce_is_unique(self):
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=1&deploy=1"
+
+        headers = {sign_request("GET", url, "ck", "cs", "tk", "ts", realm=123456) for _ in range(100)}
+
+        assert len(headers) == 100
+
+
+class TestSigningContext:
+    # A shared context signs like sign_request from many threads at once.
+    def test_thread_safe(self):
+        signer = SigningContext("ck", "cs", "tk", "ts", realm="1234_SB1")
+        urls = [f"https://1234-sb1.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql?limit=1000&offset={i}" for i in range(400)]
+
+        def sign(url):
+            return signer.sign("POST", url, nonce="n", timestamp="1700000000")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            headers = list(pool.map(sign, urls))
+
+        assert headers == [
+            sign_request("POST", url, "ck", "cs", "tk", "ts", realm="1234_SB1", nonce="n", timestamp="1700000000") for url in urls
+        ]
+
+    # Nonces stay unique across threads.
+    def test_nonces_are_unique_across_threads(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            nonces = list(pool.map(lambda _: new_nonce(), range(5000)))
+
+        assert len(set(nonces)) == 5000
+        assert all(len(nonce) == 32 for nonce in nonces)
+
+    # The client signs its requests with its own context and the account realm.
+    def test_client_uses_context(self, requests_mock):
+        url = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=1&deploy=1"
+        requests_mock.get(url, text="ok")
+        ns = NetSuite(
+            account_id="1234_SB1",
+            consumer_keys={"consumer_key": "ck", "consumer_secret": "cs"},
+            token_keys={"token_key": "tk", "token_secret": "ts"},
+        )
+
+        ns.get(url=url)
+
+        header = requests_mock.last_request.headers["Authorization"]
+        assert header.startswith('OAuth realm="1234_SB1", oauth_consumer_key="ck"')
+        assert 'oauth_signature_method="HMAC-SHA256"' in header
+
+    # Unknown signature methods are rejected up front.
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            SigningContext("ck", "cs", "tk", "ts", signature_method="PLAINTEXT")
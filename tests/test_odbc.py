@@ -1,7 +1,11 @@
 # Generated by CodiumAI
+import threading
+import time
+
 import pytest
 
 
+from src.NetSuite_Connector.NetSuite import NetSuiteError
 from src.NetSuite_Connector.ODBC import ODBC
 
 
@@ -29,3 +33,184 @@ class TestODBC:
 
         with pytest.raises(ValueError):
             ODBC(account_id, consumer_keys, token_keys)
+
+    # iter_query follows the next links and yields every row once, without the per-row links.
+    def test_iter_query_follows_pagination(self, mock_server):
+        route = mock_server.suiteql(total=2345)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        rows = list(odbc.iter_query("SELECT id FROM transaction", page_size=500))
+
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 2346)]
+        assert "links" not in rows[0]
+        assert route.offsets == [0, 500, 1000, 1500, 2000]
+
+    # iter_query yields whole pages when batches is set and is lazy.
+    def test_iter_query_batches_are_lazy(self, mock_server):
+        route = mock_server.suiteql(total=250)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        pages = odbc.iter_query("SELECT id FROM transaction", page_size=100, batches=True)
+        first = next(pages)
+
+        assert len(first) == 100
+        assert route.offsets == [0]
+        assert [len(page) for page in pages] == [100, 50]
+
+    # iter_query raises NetSuiteError when a page fails.
+    def test_iter_query_raises_on_error(self, requests_mock):
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        requests_mock.post(odbc.suiteql_endpoint, json={"o:errorDetails": []}, status_code=400)
+
+        with pytest.raises(NetSuiteError) as error:
+            list(odbc.iter_query("SELECT id FROM transaction"))
+
+        assert error.value.response.code == 400
+
+    # iter_query rejects page sizes NetSuite does not accept.
+    def test_iter_query_rejects_invalid_page_size(self):
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+
+        with pytest.raises(ValueError):
+            next(odbc.iter_query("SELECT id FROM transaction", page_size=5000))
+
+    # iter_query with workers fetches the remaining offsets concurrently and keeps the query order.
+    def test_iter_query_parallel_ordered(self, mock_server):
+        route = mock_server.suiteql(total=2345)
+        mock_server.latency = 0.01
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        rows = list(odbc.iter_query("SELECT id FROM transaction", page_size=100, workers=4))
+
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 2346)]
+        assert sorted(route.offsets) == list(range(0, 2345, 100))
+
+    # iter_query with ordered=False returns every row once, in any order.
+    def test_iter_query_parallel_unordered(self, mock_server):
+        mock_server.suiteql(total=1050)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        pages = list(odbc.iter_query("SELECT id FROM transaction", page_size=100, workers=3, ordered=False, batches=True))
+
+        assert len(pages) == 11
+        assert sorted(int(row["id"]) for page in pages for row in page) == list(range(1, 1051))
+
+    # iter_query never runs more workers than the account concurrency limit.
+    def test_iter_query_parallel_respects_concurrency_limit(self, mock_server):
+        mock_server.suiteql(total=1000)
+        odbc = ODBC(
+            "123456",
+            {"consumer_key": "", "consumer_secret": ""},
+            {"token_key": "", "token_secret": ""},
+            concurrency_limit=2,
+        )
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+        in_flight, peak, lock = [0], [0], threading.Lock()
+        query_page = odbc._query_page
+
+        def counting_query_page(*args):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            try:
+                return query_page(*args)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        odbc._query_page = counting_query_page
+        mock_server.latency = 0.02
+
+        rows = list(odbc.iter_query("SELECT id FROM transaction", page_size=50, workers=8))
+
+        assert len(rows) == 1000
+        assert peak[0] <= 2
+
+    # iter_query with decoders parses the pages in other processes and keeps the query order.
+    def test_iter_query_pipeline(self, mock_server):
+        route = mock_server.suiteql(total=2345)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        rows = list(odbc.iter_query("SELECT id FROM transaction", page_size=100, workers=3, decoders=2))
+
+        assert rows[0] == {"id": "1", "tranid": "INV000001", "amount": "0.50"}
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 2346)]
+        assert sorted(route.offsets) == list(range(0, 2345, 100))
+
+    # The downloads pause while the queue of raw pages is full.
+    def test_iter_query_pipeline_backpressure(self, mock_server):
+        route = mock_server.suiteql(total=3000)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        pages = odbc.iter_query("SELECT id FROM transaction", page_size=100, workers=2, decoders=1, queue_size=1, batches=True)
+        taken = [next(pages), next(pages)]
+        time.sleep(0.3)
+
+        # 2 pages taken, 1 decoding, 1 queued and 2 downloading.
+        assert len(route.offsets) <= len(taken) + 1 + 1 + 2
+        assert sum(len(page) for page in pages) == 3000 - 200
+
+    # A failed page raises NetSuiteError once the pages before it were yielded.
+    def test_iter_query_pipeline_raises_on_error(self, mock_server):
+        mock_server.suiteql(total=1000, max_offset=500)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+        rows = []
+
+        with pytest.raises(NetSuiteError):
+            for row in odbc.iter_query("SELECT id FROM transaction", page_size=100, workers=2, decoders=1):
+                rows.append(row)
+
+        assert len(rows) == 500
+
+    # query_frame builds a typed DataFrame, filling columns NetSuite left out of some rows.
+    def test_query_frame(self, mock_server):
+        def row(index):
+            data = {"id": index + 1, "amount": f"{index}.5", "memo": "m"}
+            if index % 2:
+                del data["memo"]
+            return data
+
+        mock_server.suiteql(total=250, row=row)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        df = odbc.query_frame("SELECT id, amount, memo FROM transaction", page_size=100, dtypes={"amount": "float64"})
+
+        assert df.shape == (250, 3)
+        assert df["id"].tolist() == list(range(1, 251))
+        assert df["amount"].dtype == "float64"
+        assert df["amount"].iloc[3] == 3.5
+        assert df["memo"].isna().sum() == 125
+
+    # query_frame fills a column that only appears in later pages with nulls.
+    def test_query_frame_late_column(self, mock_server):
+        mock_server.suiteql(total=300, row=lambda index: {"id": index, "flag": "T"} if index >= 200 else {"id": index})
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        df = odbc.query_frame("SELECT id, flag FROM transaction", page_size=100, workers=2)
+
+        assert len(df) == 300
+        assert df["flag"].isna().sum() == 200
+        assert (df["flag"].iloc[200:] == "T").all()
+
+    # query_frame can return a pyarrow Table with one chunk per page.
+    def test_query_frame_arrow(self, mock_server):
+        pa = pytest.importorskip("pyarrow")
+        mock_server.suiteql(total=250)
+        odbc = ODBC("123456", {"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+        odbc.suiteql_endpoint = mock_server.suiteql_endpoint
+
+        table = odbc.query_frame("SELECT * FROM transaction", page_size=100, as_arrow=True, dtypes={"id": pa.int64()})
+
+        assert table.num_rows == 250
+        assert table.schema.field("id").type == pa.int64()
+        assert table.column("id").num_chunks == 3
+        assert table.column("id").to_pylist() == list(range(1, 251))
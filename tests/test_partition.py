@@ -0,0 +1,81 @@
+import pytest
+
+from mock_netsuite import KeyedTable
+from NetSuite_Connector.NetSuite import NetSuiteError
+from NetSuite_Connector.Partition import partition_query, plan_partitions, probe_query
+from NetSuite_Connector.Sync import FileWatermarks
+
+QUERY = "SELECT id, tranid, amount FROM transaction"
+
+
+class TestPartitionPlan:
+    # Numeric bounds are split into equal half-open ranges of about rows_per_partition rows.
+    def test_numeric_plan(self):
+        assert plan_partitions("1", "100", 100, 100, rows_per_partition=30) == [[1, 26], [26, 51], [51, 76], [76, 101]]
+        assert plan_partitions("1", "100", 100, 100, rows_per_partition=30, partitions=2) == [[1, 51], [51, 101]]
+
+    # Date bounds are split by day and rows with a null column get their own partition.
+    def test_date_plan_with_nulls(self):
+        plan = plan_partitions("2026-01-01", "2026-01-10", 120, 100, rows_per_partition=1000, partitions=3, dates=True)
+
+        assert plan == [["2026-01-01", "2026-01-05"], ["2026-01-05", "2026-01-09"], ["2026-01-09", "2026-01-11"], None]
+
+    # An empty table has no partitions.
+    def test_empty_plan(self):
+        assert plan_partitions(None, None, 0, 0, rows_per_partition=10) == []
+
+    # The probe and the keyset queries wrap the base query.
+    def test_queries(self):
+        assert probe_query(QUERY, "id") == (
+            f"SELECT MIN(base.id) AS lo, MAX(base.id) AS hi, COUNT(*) AS total, COUNT(base.id) AS counted FROM ({QUERY}) base"
+        )
+        assert partition_query(QUERY, "id", "id", [1, 26], 10) == (
+            f"SELECT base.* FROM ({QUERY}) base WHERE base.id >= 1 AND base.id < 26 AND base.id > 10 ORDER BY base.id"
+        )
+        assert partition_query(QUERY, "id", "trandate", ["2026-01-01", "2026-01-05"], None, dates=True) == (
+            f"SELECT base.* FROM ({QUERY}) base WHERE base.trandate >= TO_DATE('2026-01-01', 'YYYY-MM-DD') "
+            "AND base.trandate < TO_DATE('2026-01-05', 'YYYY-MM-DD') ORDER BY base.id"
+        )
+        assert "base.trandate IS NULL" in partition_query(QUERY, "id", "trandate", None, None)
+
+
+class TestExtract:
+    # Every row is extracted once with keyset pages only, past the offset limit of the endpoint.
+    def test_extract_past_offset_limit(self, mock_server, odbc):
+        route = mock_server.suiteql(source=KeyedTable(5000), max_offset=1000)
+        with pytest.raises(NetSuiteError):
+            list(odbc.iter_query(QUERY, page_size=500))
+        route.offsets.clear()
+
+        rows = list(odbc.extract(QUERY, rows_per_partition=1200, page_size=500, workers=4))
+
+        assert sorted(int(row["id"]) for row in rows) == list(range(1, 5001))
+        assert set(route.offsets) == {0}
+        assert "links" not in rows[0]
+
+    # Rows are in key order within every page.
+    def test_extract_batches(self, mock_server, odbc):
+        mock_server.suiteql(source=KeyedTable(950))
+
+        pages = list(odbc.extract(QUERY, partitions=3, page_size=100, batches=True, workers=2))
+
+        assert sum(len(page) for page in pages) == 950
+        assert all([int(row["id"]) for row in page] == sorted(int(row["id"]) for row in page) for page in pages)
+
+    # An interrupted extraction resumes its partitions where they stopped and clears its progress at the end.
+    def test_extract_restart(self, mock_server, tmp_path, odbc):
+        route = mock_server.suiteql(source=KeyedTable(3000))
+        progress = FileWatermarks(str(tmp_path / "progress.json"))
+
+        first = odbc.extract(QUERY, partitions=3, page_size=250, workers=2, batches=True, progress=progress, name="tx")
+        seen = [int(row["id"]) for _ in range(5) for row in next(first)]
+        first.close()
+        route.queries.clear()
+        rest = [int(row["id"]) for row in odbc.extract(QUERY, page_size=250, workers=2, progress=progress, name="tx")]
+
+        # The progress of a page is saved once the next one is asked for: 4 of the 12 pages were completed.
+        assert sorted(set(seen + rest)) == list(range(1, 3001))
+        assert len(rest) == 3000 - 4 * 250
+        assert len(route.queries) == 12 - 4
+        assert not any("MIN(" in q for q in route.queries)
+        assert progress.get("tx/plan") is None
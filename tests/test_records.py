@@ -0,0 +1,98 @@
+import re
+import threading
+
+import pytest
+
+from NetSuite_Connector.NetSuite import NetSuiteError
+from NetSuite_Connector.Records import RecordCache, lookup_query, record_ids
+
+
+class Table:
+    """
+    A SuiteQLRoute source answering the `WHERE id IN (...)` queries of get_records from a dict of records by id.
+    """
+
+    def __init__(self, records: dict) -> None:
+        self.records = records
+
+    def __call__(self, query: str) -> list:
+        ids = re.search(r"id IN \(([\d, ]+)\)", query).group(1).split(", ")
+        return [dict(self.records[int(id)]) for id in ids if int(id) in self.records]
+
+
+def customers(count: int) -> dict:
+    return {i: {"id": str(i), "companyname": f"Customer {i}", "lastmodifieddate": "1/1/2026"} for i in range(1, count + 1)}
+
+
+class TestRecordLookup:
+    # Ids are normalized and de-duplicated, and the lookup query only accepts a plain record type.
+    def test_ids_and_query(self):
+        assert record_ids([3, "1", " 3", "0003", 2]) == ["3", "1", "2"]
+        assert lookup_query("customer", ["1", "2"], "id, email") == "SELECT id, email FROM customer WHERE id IN (1, 2)"
+        with pytest.raises(ValueError):
+            record_ids(["1 OR 1=1"])
+        with pytest.raises(ValueError):
+            lookup_query("customer; DELETE", ["1"])
+
+    # Misses are fetched in chunks of IN queries and served from the cache afterwards.
+    def test_get_records(self, mock_server, odbc):
+        route = mock_server.suiteql(source=Table(customers(10)))
+
+        first = odbc.get_records("customer", [3, 1, 3, "2", 5, 404], chunk_size=2)
+        second = odbc.get_records("Customer", [1, 2, 3, 5])
+
+        assert list(first) == ["3", "1", "2", "5"]
+        assert first["5"] == {"id": "5", "companyname": "Customer 5", "lastmodifieddate": "1/1/2026"}
+        assert second == {id: first[id] for id in ["1", "2", "3", "5"]}
+        assert len(route.queries) == 3
+        assert odbc.record_cache.stats() == {"hits": 4, "misses": 5, "coalesced": 0, "evictions": 0, "entries": 4}
+        assert odbc.get_record("customer", 404) is None
+
+    # Every record type has its own TTL and a different lastmodifieddate refetches a record.
+    @pytest.mark.odbc(record_cache=RecordCache(ttl=600, ttls={"item": 0}))
+    def test_ttl_and_versions(self, mock_server, odbc):
+        route = mock_server.suiteql(source=Table(customers(3)))
+
+        odbc.get_records("customer", [1, 2])
+        odbc.get_records("item", [1, 2])
+        odbc.get_records("customer", [1, 2])
+        odbc.get_records("item", [1, 2])
+        assert len(route.queries) == 3
+
+        odbc.get_records("customer", [1, 2], versions={1: "1/1/2026"})
+        assert len(route.queries) == 3
+        odbc.get_records("customer", [1, 2], versions={2: "2/1/2026"})
+        assert route.queries[-1].endswith("WHERE id IN (2)")
+
+        odbc.invalidate_record("Customer", 1)
+        odbc.get_record("customer", 1)
+        assert route.queries[-1].endswith("WHERE id IN (1)")
+
+    # Threads asking for the same records at the same time share one query.
+    def test_single_flight(self, mock_server, odbc):
+        route = mock_server.suiteql(source=Table(customers(50)))
+        mock_server.latency = 0.2
+        barrier, results = threading.Barrier(8), []
+
+        def lookup():
+            barrier.wait()
+            results.append(odbc.get_records("customer", range(1, 51)))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(route.queries) == 1
+        assert all(len(result) == 50 for result in results)
+
+    # A failed query is raised and releases its ids for the next lookup.
+    def test_failure_releases_ids(self, mock_server, odbc):
+        route = mock_server.suiteql(source=Table(customers(3)), max_offset=0)
+
+        with pytest.raises(NetSuiteError):
+            odbc.get_records("customer", [1, 2])
+        route.max_offset = None
+
+        assert list(odbc.get_records("customer", [1, 2])) == ["1", "2"]
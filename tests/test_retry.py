@@ -0,0 +1,119 @@
+import pytest
+import requests
+
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+from NetSuite_Connector.Retry import RetryPolicy
+
+URL = "https://xxxx.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=xxxx&deploy=xxxx"
+
+
+def make_client(cls=NetSuite, **policy):
+    sleeps = []
+    client = cls(
+        "123456",
+        consumer_keys={"consumer_key": "", "consumer_secret": ""},
+        token_keys={"token_key": "", "token_secret": ""},
+        retry=RetryPolicy(sleep=sleeps.append, **policy),
+    )
+    return client, sleeps
+
+
+class TestRetryPolicy:
+    # A GET that hits a connection reset is sent again and succeeds.
+    def test_get_retries_connection_error(self, requests_mock):
+        requests_mock.get(URL, [{"exc": requests.exceptions.ConnectionError}, {"json": {"foo": "bar"}, "status_code": 200}])
+        ns, sleeps = make_client()
+
+        result = ns.get(url=URL)
+
+        assert result.code == 200
+        assert requests_mock.call_count == 2
+        assert len(sleeps) == 1
+
+    # Exceptions without a rule are not retried.
+    def test_unknown_exception_is_not_retried(self, requests_mock):
+        requests_mock.get(URL, exc=requests.exceptions.RequestException)
+        ns, sleeps = make_client()
+
+        result = ns.get(url=URL)
+
+        assert result.code == 500
+        assert requests_mock.call_count == 1
+
+    # Each status rule caps its own retries.
+    def test_per_status_limit(self, requests_mock):
+        requests_mock.put(URL, status_code=503)
+        ns, sleeps = make_client(statuses={503: 2})
+
+        result = ns.put(url=URL, body={"foo": "bar"})
+
+        assert result.code == 503
+        assert requests_mock.call_count == 3
+
+    # total caps the retries across every rule.
+    def test_total_limit(self, requests_mock):
+        requests_mock.delete(URL, status_code=429)
+        ns, sleeps = make_client(total=2, statuses={429: 10})
+
+        ns.delete(url=URL)
+
+        assert requests_mock.call_count == 3
+
+    # A POST is only retried when an idempotency key is given, which is sent to NetSuite.
+    def test_post_needs_idempotency_key(self, requests_mock):
+        requests_mock.post(URL, [{"status_code": 503}, {"status_code": 503}, {"json": {"id": 1}, "status_code": 204}])
+        ns, sleeps = make_client()
+
+        assert ns.post(url=URL, body={"foo": "bar"}).code == 503
+        assert requests_mock.call_count == 1
+
+        result = ns.post(url=URL, body={"foo": "bar"}, headers={"Content-Type": "application/json"}, idempotency_key="order-1042")
+
+        assert result.code == 204
+        assert requests_mock.call_count == 3
+        assert result.request_headers == {"Content-Type": "application/json"}
+        assert requests_mock.last_request.headers["X-NetSuite-Idempotency-Key"] in ("order-1042", b"order-1042")
+
+    # SuiteQL queries are read-only and retried even though they are POSTs.
+    def test_suiteql_query_is_retried(self, requests_mock):
+        odbc, sleeps = make_client(ODBC)
+        requests_mock.post(odbc.suiteql_endpoint, [{"status_code": 429}, {"json": {"items": []}, "status_code": 200}])
+
+        assert odbc.query("SELECT id FROM item").code == 200
+        assert requests_mock.call_count == 2
+
+    # The Retry-After header replaces the computed backoff.
+    def test_retry_after(self, requests_mock):
+        requests_mock.get(URL, [{"status_code": 429, "headers": {"Retry-After": "7"}}, {"status_code": 200}])
+        ns, sleeps = make_client()
+
+        ns.get(url=URL)
+
+        assert sleeps == [7.0]
+
+    # Backoff is exponential with full jitter and capped.
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+
+        delays = [[policy.backoff(retry) for _ in range(200)] for retry in (1, 2, 3, 6)]
+
+        assert all(0 <= d <= 1 for d in delays[0])
+        assert all(0 <= d <= 2 for d in delays[1])
+        assert max(delays[2]) > 2
+        assert all(0 <= d <= 4 for d in delays[3])
+        assert policy.backoff(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert policy.backoff(1, "999999") == pytest.approx(300)
+
+    # Errors injected by the mock server at a fixed rate are retried away.
+    def test_injected_server_errors(self, mock_server):
+        mock_server.error_rate = 0.2
+        mock_server.random.seed(7)
+        ns, sleeps = make_client()
+
+        results = [ns.get(url=mock_server.url + "/app/site/hosting/restlet.nl", params={"n": i}) for i in range(50)]
+
+        assert all(result.code == 200 for result in results)
+        assert mock_server.errors > 0
+        assert mock_server.requests == 50 + mock_server.errors
+        assert len(sleeps) == mock_server.errors
@@ -0,0 +1,122 @@
+import gzip
+import json
+
+import pytest
+
+from NetSuite_Connector.Governor import Governor
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.Streaming import gzip_body, iter_json_array
+
+KEYS = ({"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+EXPORT_PATH = "/app/site/hosting/restlet.nl"
+
+
+def chunked(data: bytes, size: int):
+    return iter([data[i:i + size] for i in range(0, len(data), size)])
+
+
+class ExportRoute:
+    """
+    A RESTlet serving `count` records in a JSON document, gzipped when the client accepts it, and keeping the headers and body of the last request.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.document = json.dumps({"count": count, "records": [{"id": str(i), "name": f"Récord {i}"} for i in range(count)]}).encode()
+        self.headers = None
+        self.body = None
+
+    def __call__(self, method, path, query, headers, body):
+        self.headers, self.body = headers, body
+        if "gzip" in headers.get("Accept-Encoding", ""):
+            return 200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, gzip.compress(self.document)
+        return 200, {"Content-Type": "application/json"}, self.document
+
+
+class TestIterJsonArray:
+    # Elements are parsed as they arrive, whatever the chunk boundaries.
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    def test_chunk_boundaries(self, size):
+        document = {"links": [{"rel": "self"}], "count": 4, "items": [{"id": "1", "name": "Café ☕"}, 12345, [1, [2]], "x"], "hasMore": False}
+
+        items = list(iter_json_array(chunked(json.dumps(document, ensure_ascii=False).encode(), size), "items"))
+
+        assert items == document["items"]
+
+    # The document itself can be the array, nested paths and empty arrays are supported.
+    def test_paths(self):
+        assert list(iter_json_array(iter([b" [1, 2", b"0, 3] "]))) == [1, 20, 3]
+        assert list(iter_json_array(iter([b'{"a": {"b": []}}']), "a.b")) == []
+        with pytest.raises(KeyError):
+            list(iter_json_array(iter([b'{"a": 1}']), "items"))
+
+    # Bodies are only gzipped past the size threshold.
+    def test_gzip_body(self):
+        assert gzip_body("small", None, 100) == ("small", None)
+        data, headers = gzip_body("x" * 100, {"Content-Type": "application/json"}, 100)
+        assert gzip.decompress(data) == b"x" * 100
+        assert headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+
+class TestStream:
+    # A gzipped export is negotiated, decompressed and parsed record by record.
+    def test_stream_json(self, mock_server):
+        route = mock_server.routes[EXPORT_PATH] = ExportRoute(5000)
+        ns = NetSuite("123456", *KEYS)
+
+        with ns.stream("GET", url=mock_server.url + EXPORT_PATH, chunk_size=4096) as response:
+            records = list(response.iter_json("records"))
+
+        assert response.code == 200 and response.closed
+        assert records[4999] == {"id": "4999", "name": "Récord 4999"}
+        assert route.headers["Accept-Encoding"] == "gzip, deflate"
+        assert response.bytes_read == len(route.document)
+
+    # An export is written to disk chunk by chunk and can only be read once.
+    def test_save(self, mock_server, tmp_path):
+        route = mock_server.routes[EXPORT_PATH] = ExportRoute(100)
+        ns = NetSuite("123456", *KEYS, accept_encoding="identity")
+
+        with ns.stream("GET", url=mock_server.url + EXPORT_PATH) as response:
+            written = response.save(str(tmp_path / "export.json"))
+            with pytest.raises(RuntimeError):
+                response.read()
+
+        assert (tmp_path / "export.json").read_bytes() == route.document
+        assert written == len(route.document)
+
+    # Large request bodies are gzipped, small ones are sent as they are.
+    def test_gzip_requests(self, mock_server):
+        route = mock_server.routes[EXPORT_PATH] = ExportRoute(1)
+        ns = NetSuite("123456", *KEYS, gzip_requests=1024)
+        records = [{"id": i, "memo": "migrated"} for i in range(200)]
+
+        assert ns.post(url=mock_server.url + EXPORT_PATH, body=records).code == 200
+        assert route.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(route.body)) == records
+
+        ns.post(url=mock_server.url + EXPORT_PATH, body={"id": 1})
+        assert "Content-Encoding" not in route.headers
+        assert json.loads(route.body) == {"id": 1}
+
+    # The governor slot of a streamed request is held until the response is closed.
+    def test_governor_slot(self, mock_server):
+        mock_server.routes[EXPORT_PATH] = ExportRoute(10)
+        governor = Governor(limit=4)
+        ns = NetSuite("123456", *KEYS, governor=governor)
+
+        response = ns.stream("GET", url=mock_server.url + EXPORT_PATH)
+        assert governor.in_flight == 1
+        response.close()
+        assert governor.in_flight == 0
+
+    # Streaming works over the HTTP/2 transport too.
+    def test_stream_http2(self, h2_mock_server):
+        from functools import partial
+
+        from NetSuite_Connector.Transport import HTTP2Transport
+
+        h2_mock_server.routes[EXPORT_PATH] = ExportRoute(3000)
+        ns = NetSuite("123456", *KEYS, transport=partial(HTTP2Transport, verify=False))
+
+        with ns, ns.stream("GET", url=h2_mock_server.url + EXPORT_PATH) as response:
+            assert sum(1 for _ in response.iter_json("records")) == 3000
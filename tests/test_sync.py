@@ -0,0 +1,114 @@
+import re
+
+import pytest
+
+from NetSuite_Connector.Sync import FileWatermarks, SQLiteWatermarks, delta_query
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def watermarks(request, tmp_path):
+    if request.param == "file":
+        return FileWatermarks(str(tmp_path / "watermarks.json"))
+    return SQLiteWatermarks(str(tmp_path / "watermarks.sqlite"))
+
+
+def serve_table(mock_server, table, **kwargs):
+    def source(query):
+        match = re.search(r"TO_TIMESTAMP\('([^']+)'", query)
+        after = re.search(r"base\.id > (\d+)", query)
+        rows = [
+            row
+            for row in table
+            if match is None
+            or row["lastmodifieddate"] > match.group(1)
+            or row["lastmodifieddate"] == match.group(1) and (after is None or int(row["id"]) > int(after.group(1)))
+        ]
+        rows.sort(key=lambda r: (r["lastmodifieddate"], int(r["id"])))
+        return [dict(row, sync_watermark=row["lastmodifieddate"]) for row in rows]
+
+    return mock_server.suiteql(source=source, **kwargs)
+
+
+class TestSync:
+    # The base query is wrapped with the position predicate and ordered by the column and the id.
+    def test_delta_query(self):
+        query = delta_query("SELECT id, lastmodifieddate FROM customer", "lastmodifieddate", "2026-10-17 10:00:00")
+
+        assert query == (
+            "SELECT base.*, TO_CHAR(base.lastmodifieddate, 'YYYY-MM-DD HH24:MI:SS') AS sync_watermark "
+            "FROM (SELECT id, lastmodifieddate FROM customer) base "
+            "WHERE base.lastmodifieddate >= TO_TIMESTAMP('2026-10-17 10:00:00', 'YYYY-MM-DD HH24:MI:SS') "
+            "ORDER BY base.lastmodifieddate, base.id"
+        )
+        assert "WHERE" not in delta_query("SELECT id FROM customer", "lastmodifieddate", None)
+        assert delta_query("SELECT id FROM customer", "lastmodifieddate", "2026-10-17 10:00:00", "42").endswith(
+            "WHERE (base.lastmodifieddate > TO_TIMESTAMP('2026-10-17 10:00:00', 'YYYY-MM-DD HH24:MI:SS') "
+            "OR (base.lastmodifieddate = TO_TIMESTAMP('2026-10-17 10:00:00', 'YYYY-MM-DD HH24:MI:SS') AND base.id > 42)) "
+            "ORDER BY base.lastmodifieddate, base.id"
+        )
+        assert "base.id > 'x''1'" in delta_query("SELECT id FROM customer", "lastmodifieddate", "2026-10-17 10:00:00", "x'1")
+
+    # A second run only fetches the rows changed since the first one.
+    def test_only_changed_rows_are_fetched(self, mock_server, watermarks, odbc):
+        table = [{"id": str(i), "lastmodifieddate": f"2026-10-17 10:{i // 60:02d}:{i % 60:02d}"} for i in range(250)]
+        serve_table(mock_server, table)
+        query = "SELECT id, lastmodifieddate FROM customer"
+
+        first = list(odbc.sync(query, "customers", watermarks, page_size=100))
+        table[5]["lastmodifieddate"] = "2026-10-17 11:00:00"
+        table.append({"id": "250", "lastmodifieddate": "2026-10-17 11:00:01"})
+        second = list(odbc.sync(query, "customers", watermarks, page_size=100))
+
+        assert len(first) == 250
+        assert "sync_watermark" not in first[0]
+        assert [row["id"] for row in second] == ["5", "250"]
+        assert watermarks.get("customers") == "2026-10-17 11:00:01|250"
+
+    # An interrupted run resumes from its last completed page.
+    def test_resume_after_interruption(self, mock_server, watermarks, odbc):
+        table = [{"id": str(i), "lastmodifieddate": f"2026-10-17 10:{i // 60:02d}:{i % 60:02d}"} for i in range(250)]
+        serve_table(mock_server, table)
+        query = "SELECT id, lastmodifieddate FROM customer"
+
+        rows = odbc.sync(query, "customers", watermarks, page_size=100)
+        for _ in range(150):
+            next(rows)
+        rows.close()
+        resumed = list(odbc.sync(query, "customers", watermarks, page_size=100))
+
+        assert watermarks.get("customers") == "2026-10-17 10:04:09|249"
+        assert resumed[0]["id"] == "100"
+        assert len(resumed) == 150
+
+    # Rows sharing a timestamp across page boundaries are synced once each, with every page at offset 0.
+    def test_keyset_pages(self, mock_server, watermarks, odbc):
+        table = [{"id": str(i), "lastmodifieddate": f"2026-10-17 10:00:0{i % 3}"} for i in range(250)]
+        route = serve_table(mock_server, table, max_offset=100)
+
+        rows = list(odbc.sync("SELECT id, lastmodifieddate FROM customer", "customers", watermarks, page_size=100))
+
+        assert sorted(int(row["id"]) for row in rows) == list(range(250))
+        assert set(route.offsets) == {0}
+        assert watermarks.get("customers") == "2026-10-17 10:00:02|248"
+
+    # Pages the server cuts shorter than page_size are not mistaken for the last one, and page_size is bounded.
+    def test_short_pages(self, mock_server, watermarks, odbc):
+        table = [{"id": str(i), "lastmodifieddate": f"2026-10-17 10:{i // 60 % 60:02d}:{i % 60:02d}"} for i in range(1500)]
+        serve_table(mock_server, table, max_page=400)
+
+        rows = list(odbc.sync("SELECT id, lastmodifieddate FROM customer", "customers", watermarks))
+
+        assert len(rows) == 1500
+        assert watermarks.get("customers") == "2026-10-17 10:24:59|1499"
+        with pytest.raises(ValueError):
+            list(odbc.sync("SELECT id, lastmodifieddate FROM customer", "customers", watermarks, page_size=2000))
+
+    # since is used when no watermark is stored and must be a valid datetime.
+    def test_since(self, mock_server, watermarks, odbc):
+        serve_table(mock_server, [{"id": "1", "lastmodifieddate": "2026-01-01 00:00:00"}, {"id": "2", "lastmodifieddate": "2026-06-01 00:00:00"}])
+
+        rows = list(odbc.sync("SELECT * FROM customer", "c", watermarks, since="2026-03-01 00:00:00"))
+
+        assert [row["id"] for row in rows] == ["2"]
+        with pytest.raises(ValueError):
+            list(odbc.sync("SELECT * FROM customer", "d", watermarks, since="1 OR 1=1"))
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+from NetSuite_Connector.Tenants import ClientRegistry
+
+KEYS = ({"consumer_key": "", "consumer_secret": ""}, {"token_key": "", "token_secret": ""})
+RESTLET_PATH = "/app/site/hosting/restlet.nl"
+
+
+def registry(accounts, **kwargs) -> ClientRegistry:
+    clients = ClientRegistry(**kwargs)
+    for account_id in accounts:
+        clients.register(account_id, *KEYS)
+    return clients
+
+
+class TestClientRegistry:
+    # Each account gets one client, built on first use and reused with its SuiteQL endpoint.
+    def test_reuses_clients(self):
+        clients = registry(["123456", "654321_SB1"])
+
+        client = clients.get("654321_SB1")
+
+        assert isinstance(client, ODBC)
+        assert clients["654321_SB1"] is client and clients.get("123456") is not client
+        assert client.suiteql_endpoint == "https://654321-sb1.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql"
+        assert clients.stats() == {"tenants": 2, "clients": 2, "created": 2, "evictions": 0, "in_flight": 0}
+        with pytest.raises(KeyError):
+            clients.get("999999")
+
+    # Requests never exceed the limit of their account nor the budget shared by every account.
+    def test_concurrency_limits(self, mock_server):
+        mock_server.latency = 0.05
+        mock_server.max_concurrent = 4
+        clients = ClientRegistry(NetSuite, max_in_flight=4, concurrency_limit=3)
+        for account_id in ("1", "2", "3"):
+            clients.register(account_id, *KEYS)
+        clients.register("4", *KEYS, concurrency_limit=1)
+
+        def call(index):
+            account_id = str(index % 4 + 1)
+            return clients.get(account_id).get(url=mock_server.url + RESTLET_PATH, params={"n": index}).code
+
+        with clients, ThreadPoolExecutor(max_workers=24) as pool:
+            codes = list(pool.map(call, range(48)))
+
+        assert codes == [200] * 48
+        assert mock_server.throttled == 0
+        assert clients.get("4").governor.limit == 1
+
+    # Idle clients are closed and built again on the next call, with the same governor.
+    def test_idle_eviction(self, mock_server):
+        clients = registry(["123456"], client_class=NetSuite, idle_timeout=0.05, grace_period=0.05)
+        client = clients.get("123456")
+        client.get(url=mock_server.url + RESTLET_PATH)
+
+        time.sleep(0.1)
+
+        assert clients.evict_idle() == 1
+        assert client._request_session is None
+        rebuilt = clients.get("123456")
+        assert rebuilt is not client and rebuilt.governor is client.governor
+        assert clients.stats()["evictions"] == 1
+
+    # Past max_clients, the least recently used idle client is dropped, unless it was handed out within the grace period.
+    def test_max_clients(self):
+        clients = registry(["1", "2", "3"], client_class=NetSuite, max_clients=2, grace_period=0.05)
+        first = clients.get("1")
+        clients.get("2")
+        time.sleep(0.1)
+        clients.get("1")
+
+        clients.get("3")
+
+        assert clients.stats()["clients"] == 2
+        assert clients.get("1") is first
+
+        clients.get("2")
+
+        assert clients.stats()["clients"] == 3
+        assert clients.stats()["evictions"] == 1
+
+    # A client just returned by get is not closed by an idle sweep before its caller uses it.
+    def test_grace_period(self):
+        clients = registry(["123456"], client_class=NetSuite, idle_timeout=0.0)
+        client = clients.get("123456")
+
+        assert clients.evict_idle() == 0
+        assert clients.get("123456") is client
@@ -0,0 +1,111 @@
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from mock_netsuite import echo
+
+from NetSuite_Connector.Instrumentation import RequestHook
+from NetSuite_Connector.NetSuite import NetSuite
+from NetSuite_Connector.ODBC import ODBC
+from NetSuite_Connector.Retry import RetryPolicy
+from NetSuite_Connector.Transport import HTTP2Transport, RequestsTransport, Transport
+
+KEYS = ({"consumer_key": "key", "consumer_secret": "secret"}, {"token_key": "token", "token_secret": "secret"})
+
+
+class RecordingTransport(Transport):
+    def __init__(self, client):
+        super().__init__(client)
+        self.sent = []
+
+    def send(self, http_method, url, data=None, params=None, headers=None, metrics=None):
+        self.sent.append((http_method, url))
+        return RequestsTransport(self.client).send(http_method, url, data, params, headers, metrics)
+
+
+class Collector(RequestHook):
+    def __init__(self):
+        self.done = []
+
+    def after_request(self, metrics):
+        self.done.append(metrics)
+
+
+class TestTransport:
+    # The requests transport is the default and any transport factory can replace it.
+    def test_pluggable(self, mock_server):
+        assert isinstance(NetSuite("123456", *KEYS).transport, RequestsTransport)
+        ns = NetSuite("123456", *KEYS, transport=RecordingTransport)
+
+        response = ns.get(url=mock_server.url + "/restlet")
+
+        assert response.code == 200
+        assert ns.transport.sent == [("GET", mock_server.url + "/restlet")]
+        with pytest.raises(ValueError):
+            NetSuite("123456", *KEYS, transport="carrier-pigeon")
+
+    # Concurrent signed requests are multiplexed over a single HTTP/2 connection.
+    def test_http2_multiplexes(self, h2_mock_server):
+        h2_mock_server.latency = 0.1
+        ns = NetSuite("123456", *KEYS, transport=partial(HTTP2Transport, verify=False))
+        url = h2_mock_server.url + "/app/site/hosting/restlet.nl"
+
+        with ns, ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(lambda i: ns.post(url=url, params={"n": i}, body={"n": i}), range(40)))
+
+        assert all(result.code == 200 for result in results)
+        assert json.loads(results[7].data["body"]) == {"n": 7}
+        assert results[7].data["authorization"].startswith('OAuth realm="123456"')
+        assert h2_mock_server.requests == 40
+        assert h2_mock_server.connections == 1
+
+    # SuiteQL pages fetched by parallel workers share the HTTP/2 connection.
+    def test_http2_suiteql(self, h2_mock_server):
+        h2_mock_server.suiteql(total=2500)
+        odbc = ODBC("123456", *KEYS, transport=partial(HTTP2Transport, verify=False))
+        odbc.suiteql_endpoint = h2_mock_server.suiteql_endpoint
+
+        with odbc:
+            rows = list(odbc.iter_query("SELECT id FROM transaction", page_size=250, workers=5))
+
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 2501)]
+        assert h2_mock_server.connections == 1
+
+    # The metrics of a request retried over HTTP/2 add up its attempts.
+    def test_http2_retry_metrics(self, h2_mock_server):
+        responses = [(503, {"Content-Type": "application/json"}, {"title": "Service Unavailable"})]
+        h2_mock_server.routes["/restlet"] = lambda *args: responses.pop() if responses else echo(*args)
+        collector = Collector()
+        ns = NetSuite("123456", *KEYS, transport=partial(HTTP2Transport, verify=False), retry=RetryPolicy(sleep=lambda seconds: None), hooks=[collector])
+
+        with ns:
+            response = ns.put(url=h2_mock_server.url + "/restlet", body={"n": 1})
+            single = ns.put(url=h2_mock_server.url + "/restlet", body={"n": 1})
+
+        metrics, once = collector.done
+        assert response.code == 200 and single.code == 200
+        assert metrics.retries == 1 and once.retries == 0
+        assert metrics.request_bytes == 2 * once.request_bytes
+        assert metrics.response_bytes > once.response_bytes
+        assert metrics.server > 0
+
+    # A refused connection is retried the same way over both transports.
+    @pytest.mark.parametrize("transport", ["requests", "http2"])
+    def test_connection_error_is_retried(self, transport):
+        pytest.importorskip("h2")
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        sleeps = []
+        factory = partial(HTTP2Transport, verify=False) if transport == "http2" else transport
+        ns = NetSuite("123456", *KEYS, transport=factory, retry=RetryPolicy(sleep=sleeps.append))
+
+        with ns:
+            response = ns.get(url=f"https://127.0.0.1:{port}/app/site/hosting/restlet.nl")
+
+        assert response.code == 500
+        assert "ConnectionError" in response.response
+        assert len(sleeps) == 3